@@ -0,0 +1 @@
+"""Benchmarks for the draft/verify/eval pipeline."""
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Mock Ollama Server - Local stand-in for /api/generate, /api/chat, /api/tags.
+
+Simulates model latency and decode speed without a real model, so the
+pipeline's own overhead and concurrency behaviour can be measured.
+
+Usage:
+    with MockOllamaServer(latency=0.05, token_rate=200) as server:
+        client = OllamaClient(base_url=server.base_url)
+
+    python -m benchmarks.mock_ollama --port 11500 --latency 0.1
+"""
+
+import argparse
+import itertools
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+
+DEFAULT_RESPONSES = [
+    "The capital of France is Paris.",
+    "2 + 2 = 4. The answer is 4.",
+    "The sky is blue on a clear day because of Rayleigh scattering.",
+    "Here is the function:\n```python\ndef add(a, b):\n    return a + b\n\nprint(add(2, 3))\n```\nIt returns the sum.",
+]
+
+
+class MockOllamaServer:
+    """Threaded HTTP server imitating the Ollama API."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.05,
+        token_rate: float = 200.0,
+        failure_rate: float = 0.0,
+        hang_rate: float = 0.0,
+        responses: Optional[List[str]] = None,
+        model: str = "qwen3:1.7b",
+        seed: int = 0
+    ):
+        """
+        Initialize the server (call start() or use as a context manager).
+
+        Args:
+            host: Interface to bind
+            port: Port to bind (0 = pick a free port)
+            latency: Seconds before the first token (prompt processing)
+            token_rate: Simulated decode speed in tokens (words) per second
+            failure_rate: Fraction of requests answered with HTTP 500
+            hang_rate: Fraction of requests that stall for 10 minutes
+                       (exercises client timeouts)
+            responses: Response texts served round-robin
+            model: Model name reported by /api/tags
+            seed: Seed for failure injection
+        """
+        self.latency = latency
+        self.token_rate = token_rate
+        self.failure_rate = failure_rate
+        self.hang_rate = hang_rate
+        self.model = model
+        self.requests = 0
+        self.failures = 0
+        self._responses = itertools.cycle(responses or DEFAULT_RESPONSES)
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockOllamaServer":
+        """Serve requests on a background thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Shut the server down."""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def _next_request(self) -> Dict[str, Any]:
+        """Pick the response and injected fault for a request."""
+        with self._lock:
+            self.requests += 1
+            roll = self._random.random()
+            fault = None
+            if roll < self.failure_rate:
+                fault = "fail"
+                self.failures += 1
+            elif roll < self.failure_rate + self.hang_rate:
+                fault = "hang"
+            return {"text": next(self._responses), "fault": fault}
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def _send_json(self, status: int, body: Dict[str, Any]) -> None:
+                data = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _write_chunk(self, body: Dict[str, Any]) -> None:
+                data = (json.dumps(body) + "\n").encode("utf-8")
+                self.wfile.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+                self.wfile.flush()
+
+            def do_GET(self):
+                if self.path != "/api/tags":
+                    self._send_json(404, {"error": "not found"})
+                    return
+                self._send_json(200, {"models": [{"name": server.model}]})
+
+            def do_POST(self):
+                if self.path not in ("/api/generate", "/api/chat"):
+                    self._send_json(404, {"error": "not found"})
+                    return
+
+                length = int(self.headers.get("Content-Length", 0))
+                payload = json.loads(self.rfile.read(length) or b"{}")
+                request = server._next_request()
+
+                if request["fault"] == "fail":
+                    self._send_json(500, {"error": "injected failure"})
+                    return
+                if request["fault"] == "hang":
+                    time.sleep(600)
+                    return
+
+                options = payload.get("options", {})
+                tokens = request["text"].split(" ")
+                done_reason = "stop"
+                if options.get("num_predict") and len(tokens) > options["num_predict"]:
+                    tokens = tokens[:options["num_predict"]]
+                    done_reason = "length"
+                prompt_tokens = len(str(payload.get("prompt", payload.get("messages", ""))).split())
+
+                time.sleep(server.latency)
+                started = time.perf_counter()
+                is_chat = self.path == "/api/chat"
+
+                def text_body(text: str) -> Dict[str, Any]:
+                    if is_chat:
+                        return {"message": {"role": "assistant", "content": text}}
+                    return {"response": text}
+
+                def final_body(decode_seconds: float) -> Dict[str, Any]:
+                    return {
+                        "model": payload.get("model", server.model),
+                        "done": True,
+                        "done_reason": done_reason,
+                        "total_duration": int((server.latency + decode_seconds) * 1e9),
+                        "load_duration": 0,
+                        "prompt_eval_count": prompt_tokens,
+                        "prompt_eval_duration": int(server.latency * 1e9),
+                        "eval_count": len(tokens),
+                        "eval_duration": int(decode_seconds * 1e9),
+                        "context": [1, 2, 3]
+                    }
+
+                if payload.get("stream", True):
+                    self.send_response(200)
+                    self.send_header("Content-Type", "application/x-ndjson")
+                    self.send_header("Transfer-Encoding", "chunked")
+                    self.end_headers()
+                    try:
+                        for i, token in enumerate(tokens):
+                            time.sleep(1.0 / server.token_rate)
+                            piece = token if i == 0 else " " + token
+                            body = text_body(piece)
+                            body["done"] = False
+                            self._write_chunk(body)
+                        body = text_body("")
+                        body.update(final_body(time.perf_counter() - started))
+                        self._write_chunk(body)
+                        self.wfile.write(b"0\r\n\r\n")
+                    except (BrokenPipeError, ConnectionResetError):
+                        # Client stopped reading (early stop)
+                        self.close_connection = True
+                    return
+
+                time.sleep(len(tokens) / server.token_rate)
+                body = text_body(" ".join(tokens))
+                body.update(final_body(time.perf_counter() - started))
+                self._send_json(200, body)
+
+        return Handler
+
+
+def main():
+    """Run the mock server in the foreground."""
+    parser = argparse.ArgumentParser(description="Mock Ollama server for benchmarks")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=11500)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--token-rate", type=float, default=200.0)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--hang-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    server = MockOllamaServer(
+        host=args.host,
+        port=args.port,
+        latency=args.latency,
+        token_rate=args.token_rate,
+        failure_rate=args.failure_rate,
+        hang_rate=args.hang_rate
+    )
+    print(f"Mock Ollama listening on {server.base_url} (Ctrl+C to stop)")
+    server.start()
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+Benchmark Harness - Throughput and latency of draft/verify/code/eval.
+
+Starts a MockOllamaServer and drives DraftGenerator, SimpleVerifier,
+CodeExecutor and SimpleEvaluator/EvaluationRunner at varying k,
+concurrency and dataset sizes. Results (throughput, latency percentiles,
+peak RSS) are written to a JSON file so runs can be compared over time.
+
+Usage:
+    python -m benchmarks.run --output benchmarks/results.json
+    python -m benchmarks.run --quick --latency 0.02 --failure-rate 0.05
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ollama_client import OllamaClient
+from vpa.draft.generator import DraftGenerator
+from vpa.verify.checker import SimpleVerifier
+from vpa.verify.code_executor import CodeExecutor
+from vpa.eval.scorer import SimpleEvaluator
+from vpa.eval.runner import EvaluationRunner
+from vpa.tracing import Histogram
+
+from benchmarks.mock_ollama import MockOllamaServer, DEFAULT_RESPONSES
+
+
+def peak_rss_mb() -> Dict[str, float]:
+    """Peak resident set size of this process and its reaped children (MiB)."""
+    if resource is None:
+        return {"self": 0.0, "children": 0.0}
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return {
+        "self": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale,
+        "children": resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / scale
+    }
+
+
+def measure(
+    name: str,
+    params: Dict[str, Any],
+    operation: Callable[[], Any],
+    operations: int,
+    concurrency: int = 1,
+    failures: Optional[Callable[[Any], int]] = None
+) -> Dict[str, Any]:
+    """
+    Run an operation repeatedly and summarize it.
+
+    Args:
+        name: Scenario name
+        params: Scenario parameters recorded with the result
+        operation: Callable timed once per operation
+        operations: Number of operations
+        concurrency: Operations run at once
+        failures: Counts errors inside an operation's result, for
+                  operations that swallow their own failures (e.g.
+                  DraftGenerator.generate dropping failed candidates)
+
+    Returns:
+        Result dictionary with throughput, latency summary and peak RSS
+    """
+    latencies = Histogram()
+    errors = 0
+    lock = threading.Lock()
+
+    def timed():
+        nonlocal errors
+        start = time.perf_counter()
+        try:
+            result = operation()
+            failed = failures(result) if failures is not None else 0
+        except Exception:
+            failed = 1
+        elapsed = time.perf_counter() - start
+        with lock:
+            errors += failed
+            latencies.observe(elapsed)
+
+    start = time.perf_counter()
+    if concurrency == 1:
+        for _ in range(operations):
+            timed()
+    else:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            for future in [pool.submit(timed) for _ in range(operations)]:
+                future.result()
+    elapsed = time.perf_counter() - start
+
+    result = {
+        "scenario": name,
+        "params": params,
+        "operations": operations,
+        "errors": errors,
+        "elapsed_seconds": elapsed,
+        "throughput_per_second": operations / elapsed if elapsed > 0 else 0.0,
+        "latency_seconds": latencies.summary(),
+        "peak_rss_mb": peak_rss_mb()
+    }
+    print(
+        f"{name:<10} {json.dumps(params):<48} "
+        f"{result['throughput_per_second']:8.2f} ops/s  "
+        f"p50 {result['latency_seconds']['p50'] * 1000:8.1f} ms  "
+        f"p99 {result['latency_seconds']['p99'] * 1000:8.1f} ms"
+    )
+    return result
+
+
+def bench_draft(server: MockOllamaServer, args) -> List[Dict[str, Any]]:
+    """DraftGenerator latency per question at varying k and concurrency."""
+    results = []
+    for k in args.k:
+        for max_in_flight in args.concurrency:
+            generator = DraftGenerator(base_url=server.base_url, max_in_flight=max_in_flight)
+            results.append(measure(
+                "draft",
+                {"k": k, "max_in_flight": max_in_flight},
+                lambda: generator.generate("What is 2 + 2?", k=k),
+                args.questions,
+                failures=lambda candidates: k - len(candidates)
+            ))
+            generator.client.close()
+    return results
+
+
+def bench_verify(args) -> List[Dict[str, Any]]:
+    """SimpleVerifier on text-only and code-bearing candidate sets."""
+    results = []
+    texts = {"text": DEFAULT_RESPONSES[:3], "code": DEFAULT_RESPONSES[3:]}
+    for kind, pool in texts.items():
+        for k in args.k:
+            candidates = [{"id": i + 1, "text": pool[i % len(pool)]} for i in range(k)]
+            for code_workers in args.code_workers:
+                verifier = SimpleVerifier(code_workers=code_workers)
+                results.append(measure(
+                    "verify",
+                    {"kind": kind, "k": k, "code_workers": code_workers},
+                    lambda: verifier.verify(candidates),
+                    args.questions
+                ))
+                verifier.executor.close()
+    return results
+
+
+def bench_code(args) -> List[Dict[str, Any]]:
+    """CodeExecutor: single snippets and execute_many batches."""
+    results = []
+    snippet = "import json\nprint(json.dumps({'sum': sum(range(1000))}))"
+    for pool_size in args.code_workers:
+        executor = CodeExecutor(pool_size=pool_size)
+        results.append(measure(
+            "code",
+            {"mode": "execute_code", "pool_size": pool_size},
+            lambda: executor.execute_code(snippet),
+            args.questions
+        ))
+        for batch in args.k:
+            results.append(measure(
+                "code",
+                {"mode": "execute_many", "pool_size": pool_size, "batch": batch},
+                lambda: executor.execute_many([snippet] * batch),
+                args.questions
+            ))
+        executor.close()
+    return results
+
+
+def bench_eval(server: MockOllamaServer, args) -> List[Dict[str, Any]]:
+    """End-to-end draft+verify+score over synthetic datasets."""
+    results = []
+    client = OllamaClient(base_url=server.base_url, pool_size=max(args.concurrency) * max(args.k))
+    generator = DraftGenerator(client=client, max_in_flight=max(args.k))
+    verifier = SimpleVerifier()
+
+    def generate_fn(question, k):
+        return verifier.verify(generator.generate(question, k=k))
+
+    for size in args.dataset_sizes:
+        dataset = [
+            {"id": str(i), "question": f"What is the capital of France? ({i})",
+             "answer": "Paris", "acceptable": ["paris"]}
+            for i in range(size)
+        ]
+        for workers in args.concurrency:
+            with tempfile.TemporaryDirectory() as directory:
+                runner = EvaluationRunner(
+                    generate_fn,
+                    os.path.join(directory, "checkpoint.jsonl"),
+                    workers=workers,
+                    evaluator=SimpleEvaluator()
+                )
+                k = args.k[0]
+                results.append(measure(
+                    "eval",
+                    {"dataset_size": size, "workers": workers, "k": k},
+                    lambda: runner.run(dataset, test_set="qa", k=k),
+                    1
+                ))
+                # Report per-question throughput as well as per-run
+                results[-1]["questions_per_second"] = size / results[-1]["elapsed_seconds"]
+
+    verifier.executor.close()
+    client.close()
+    return results
+
+
+def git_commit() -> str:
+    """Current commit hash, if run inside a git checkout."""
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def main():
+    """Run the selected benchmarks and write results to JSON."""
+    parser = argparse.ArgumentParser(description="VPA pipeline benchmarks")
+    parser.add_argument("--output", default="benchmark_results.json", help="Results JSON file")
+    parser.add_argument("--scenarios", nargs="+", default=["draft", "verify", "code", "eval"],
+                        choices=["draft", "verify", "code", "eval"])
+    parser.add_argument("--k", type=int, nargs="+", default=[1, 3, 5])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4])
+    parser.add_argument("--code-workers", type=int, nargs="+", default=[0, 4])
+    parser.add_argument("--dataset-sizes", type=int, nargs="+", default=[10, 50])
+    parser.add_argument("--questions", type=int, default=10, help="Operations per scenario")
+    parser.add_argument("--latency", type=float, default=0.05, help="Mock first-token latency (s)")
+    parser.add_argument("--token-rate", type=float, default=200.0, help="Mock tokens per second")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Mock HTTP 500 rate")
+    parser.add_argument("--quick", action="store_true", help="Small sizes for a smoke run")
+    args = parser.parse_args()
+
+    if args.quick:
+        args.k = [1, 3]
+        args.concurrency = [1, 3]
+        args.code_workers = [0, 2]
+        args.dataset_sizes = [5]
+        args.questions = 3
+
+    # Per-candidate logging would dominate the measurements
+    logging.disable(logging.WARNING)
+
+    results = []
+    with MockOllamaServer(
+        latency=args.latency,
+        token_rate=args.token_rate,
+        failure_rate=args.failure_rate
+    ) as server:
+        if "draft" in args.scenarios:
+            results += bench_draft(server, args)
+        if "verify" in args.scenarios:
+            results += bench_verify(args)
+        if "code" in args.scenarios:
+            results += bench_code(args)
+        if "eval" in args.scenarios:
+            results += bench_eval(server, args)
+        mock_stats = {"requests": server.requests, "failures": server.failures}
+
+    report = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "mock": {
+            "latency": args.latency,
+            "token_rate": args.token_rate,
+            "failure_rate": args.failure_rate,
+            **mock_stats
+        },
+        "results": results
+    }
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nWrote {len(results)} results to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -13,7 +13,16 @@ Usage:
 import requests
 import json
 import logging
-from typing import Optional, Dict, Any
+import asyncio
+import contextlib
+import random
+import threading
+import time
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout, wait, FIRST_COMPLETED
+from functools import partial
+from typing import Optional, Dict, Any, Callable, Iterator, List, Sequence, Union
+from requests.adapters import HTTPAdapter
 
 # Configure logging
 logging.basicConfig(
@@ -22,86 +31,592 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Called with the text streamed so far; returns True to stop generation
+StopPredicate = Callable[[str], bool]
+
+
+def code_block_closed(text: str) -> bool:
+    """Stop predicate: True once a ``` fenced code block has been closed."""
+    return text.count("```") >= 2
+
+
+def char_budget(max_chars: int) -> StopPredicate:
+    """
+    Build a stop predicate that ends generation after max_chars characters.
+
+    Args:
+        max_chars: Maximum number of characters to generate
+
+    Returns:
+        Stop predicate for ask/chat/ask_stream/chat_stream
+    """
+    return lambda text: len(text) >= max_chars
+
+
+def any_stop(*predicates: StopPredicate) -> StopPredicate:
+    """Combine stop predicates; generation stops when any of them fires."""
+    return lambda text: any(predicate(text) for predicate in predicates)
+
+
+def _request_error(error: requests.exceptions.RequestException, message: str) -> RuntimeError:
+    """Map a failed request to TransientError (timeouts, 5xx, 429) or RuntimeError."""
+    if isinstance(error, (requests.exceptions.Timeout, requests.exceptions.ConnectionError)):
+        return TransientError(message)
+    status = error.response.status_code if error.response is not None else None
+    if status is not None and (status >= 500 or status == 429):
+        return TransientError(message)
+    return RuntimeError(message)
+
+
+class TransientError(RuntimeError):
+    """Request failure worth retrying: timeout, connection error, HTTP 5xx or 429."""
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised without contacting Ollama while the circuit breaker is open."""
+
+
+class RetryPolicy:
+    """Retries with exponential backoff and full jitter."""
+
+    def __init__(self, max_retries: int = 2, base_delay: float = 0.5, max_delay: float = 8.0):
+        """
+        Initialize the retry policy.
+
+        Args:
+            max_retries: Retries after the first attempt
+            base_delay: Backoff cap for the first retry (seconds); doubles
+                        with each retry
+            max_delay: Largest backoff cap (seconds)
+        """
+        if max_retries < 0:
+            raise ValueError("max_retries must be non-negative")
+
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def delay(self, attempt: int) -> float:
+        """Random delay before retry number attempt + 1."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+
+class CircuitBreaker:
+    """
+    Fails fast while Ollama keeps failing.
+
+    After failure_threshold consecutive transient failures the circuit opens
+    and requests raise CircuitOpenError immediately. After reset_timeout
+    seconds one trial request is let through; its success closes the
+    circuit, its failure opens it again.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """
+        Initialize the circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds the circuit stays open before a trial request
+        """
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self.failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self) -> None:
+        """
+        Check whether a request may be sent.
+
+        Raises:
+            CircuitOpenError: If the circuit is open (or a trial is in flight)
+        """
+        with self._lock:
+            if self.state == "closed":
+                return
+            if self.state == "open" and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self.state = "half_open"
+                return
+            raise CircuitOpenError("Ollama circuit breaker is open; failing fast")
+
+    def record_success(self) -> None:
+        """Close the circuit after a request reached the server."""
+        with self._lock:
+            self.state = "closed"
+            self.failures = 0
+
+    def record_failure(self) -> None:
+        """Count a transient failure, opening the circuit at the threshold."""
+        with self._lock:
+            self.failures += 1
+            if self.state == "half_open" or self.failures >= self.failure_threshold:
+                if self.state != "open":
+                    logger.warning(f"Opening Ollama circuit after {self.failures} failures")
+                self.state = "open"
+                self._opened_at = time.monotonic()
+
+
+ROUTING_STRATEGIES = ("p2c", "least")
+
+
+class EndpointPool:
+    """
+    Routes requests across several Ollama servers.
+
+    Each request goes to the endpoint with the fewest outstanding requests
+    ("least") or to the less loaded of two random endpoints ("p2c", power of
+    two choices). An endpoint whose request fails with a transient error is
+    ejected until a health probe succeeds; probes start eject_seconds after
+    the failure. If every endpoint is ejected, requests still go to the one
+    ejected longest ago rather than failing outright.
+    """
+
+    def __init__(self, urls: Sequence[str], strategy: str = "p2c", eject_seconds: float = 30.0):
+        """
+        Initialize the pool.
+
+        Args:
+            urls: Ollama base URLs
+            strategy: "p2c" or "least"
+            eject_seconds: Seconds before an ejected endpoint is probed
+        """
+        if not urls:
+            raise ValueError("At least one endpoint is required")
+        if strategy not in ROUTING_STRATEGIES:
+            raise ValueError(f"Unknown routing strategy: {strategy}")
+
+        self.urls = list(urls)
+        self.strategy = strategy
+        self.eject_seconds = eject_seconds
+        self.outstanding = {url: 0 for url in self.urls}
+        self.requests = {url: 0 for url in self.urls}
+        self.ejected: Dict[str, float] = {}  # url -> time it may be probed
+        self._probing = set()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> str:
+        """Pick an endpoint for a request and count it as outstanding."""
+        with self._lock:
+            healthy = [url for url in self.urls if url not in self.ejected]
+            if not healthy:
+                url = min(self.ejected, key=self.ejected.get)
+            elif len(healthy) == 1:
+                url = healthy[0]
+            elif self.strategy == "p2c":
+                first, second = random.sample(healthy, 2)
+                url = first if self.outstanding[first] <= self.outstanding[second] else second
+            else:
+                url = min(healthy, key=lambda u: (self.outstanding[u], random.random()))
+
+            self.outstanding[url] += 1
+            self.requests[url] += 1
+            return url
+
+    def release(self, url: str, failed: bool = False) -> None:
+        """Finish a request; a transient failure ejects the endpoint."""
+        with self._lock:
+            self.outstanding[url] -= 1
+            if failed and len(self.urls) > 1:
+                if url not in self.ejected:
+                    logger.warning(f"Ejecting Ollama endpoint {url}")
+                self.ejected[url] = time.monotonic() + self.eject_seconds
+
+    def due_for_probe(self) -> List[str]:
+        """Ejected endpoints whose probe time has come (marked as being probed)."""
+        now = time.monotonic()
+        with self._lock:
+            due = [
+                url for url, probe_at in self.ejected.items()
+                if probe_at <= now and url not in self._probing
+            ]
+            self._probing.update(due)
+            return due
+
+    def probed(self, url: str, healthy: bool) -> None:
+        """Readmit an endpoint after a successful probe, or wait for the next one."""
+        with self._lock:
+            self._probing.discard(url)
+            if healthy:
+                self.ejected.pop(url, None)
+                logger.info(f"Readmitting Ollama endpoint {url}")
+            elif url in self.ejected:
+                self.ejected[url] = time.monotonic() + self.eject_seconds
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-endpoint request counts, load and health."""
+        with self._lock:
+            return {
+                url: {
+                    "requests": self.requests[url],
+                    "outstanding": self.outstanding[url],
+                    "healthy": url not in self.ejected
+                }
+                for url in self.urls
+            }
+
 
 class OllamaClient:
     """Client for interacting with Ollama API."""
 
     def __init__(
         self,
-        base_url: str = "http://127.0.0.1:11434",
+        base_url: Union[str, Sequence[str]] = "http://127.0.0.1:11434",
         model: str = "qwen3:1.7b",
         temperature: float = 0.7,
-        timeout: int = 60
+        timeout: int = 60,
+        pool_size: int = 10,
+        cache: Optional[Any] = None,
+        tracer: Optional[Any] = None,
+        retry: Optional[RetryPolicy] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        hedge: bool = False,
+        hedge_quantile: float = 0.95,
+        hedge_min_samples: int = 20,
+        routing: str = "p2c",
+        eject_seconds: float = 30.0,
+        keep_alive: Optional[Union[str, int]] = None
     ):
         """
         Initialize Ollama client.
 
+        Requests go through a pooled keep-alive session, so the client can be
+        shared between threads (e.g. concurrent drafting) without opening a
+        new TCP connection per request.
+
         Args:
-            base_url: Base URL for Ollama API (default: http://127.0.0.1:11434)
+            base_url: Base URL for Ollama API (default: http://127.0.0.1:11434),
+                      or a list of URLs to load-balance requests across
             model: Model name to use (default: qwen3:1.7b)
             temperature: Sampling temperature 0.0-1.0 (default: 0.7)
             timeout: Request timeout in seconds (default: 60)
+            pool_size: Maximum pooled connections per Ollama server
+                       (default: 10); extra concurrent requests wait for a
+                       free connection
+            cache: Optional response cache (e.g. vpa.cache.ResponseCache)
+                   consulted by ask/chat before calling the model
+            tracer: Optional tracer (e.g. vpa.tracing.Tracer) that receives
+                    request spans and server-reported timings
+            retry: Retry policy for transient failures of ask/chat
+                   (default: no retries)
+            breaker: Circuit breaker shared by all requests (default: none)
+            hedge: Send a duplicate ask/chat request when the first one takes
+                   longer than the hedge_quantile of recent latencies, and
+                   use whichever finishes first
+            hedge_quantile: Latency quantile that triggers a hedged request
+            hedge_min_samples: Latencies observed before hedging starts
+            routing: How requests are spread over several base URLs:
+                     "p2c" (power of two choices) or "least" (fewest
+                     outstanding requests)
+            eject_seconds: Seconds a failing server is left out before it is
+                           health-checked with is_available
+            keep_alive: How long Ollama keeps the model loaded after each
+                        request (e.g. "30m", -1 = forever); default: server
+                        setting
         """
-        self.base_url = base_url.rstrip('/')
+        if pool_size < 1:
+            raise ValueError("pool_size must be at least 1")
+
+        urls = [base_url] if isinstance(base_url, str) else list(base_url)
+        self.base_urls = [url.rstrip('/') for url in urls]
+        self.base_url = self.base_urls[0]
+        self.endpoints = EndpointPool(self.base_urls, routing, eject_seconds)
         self.model = model
         self.temperature = temperature
         self.timeout = timeout
+        self.pool_size = pool_size
+        self.cache = cache
+        self.tracer = tracer
+        self.retry = retry
+        self.breaker = breaker
+        self.hedge = hedge
+        self.hedge_quantile = hedge_quantile
+        self.hedge_min_samples = hedge_min_samples
+        self.keep_alive = keep_alive
+        self.stats = Counter()
+        self._stats_lock = threading.Lock()
+        self._latencies = deque(maxlen=512)
+        self._hedge_pool = None
+        self._hedge_pool_lock = threading.Lock()
         self.generate_url = f"{self.base_url}/api/generate"
         self.chat_url = f"{self.base_url}/api/chat"
 
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=len(self.base_urls),
+            pool_maxsize=pool_size,
+            pool_block=True
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def _span(self, name: str):
+        """Tracing span for a request (no-op without a tracer)."""
+        if self.tracer is None:
+            return contextlib.nullcontext()
+        return self.tracer.span(name)
+
+    def _observe(self, result: Dict[str, Any]) -> None:
+        """Pass server-reported timings of a final response to the tracer."""
+        if self.tracer is not None:
+            self.tracer.observe_ollama(result)
+
+    def _count(self, name: str) -> None:
+        with self._stats_lock:
+            self.stats[name] += 1
+
+    def _allow(self) -> None:
+        """Check the circuit breaker, counting rejected requests."""
+        if self.breaker is None:
+            return
+        try:
+            self.breaker.allow()
+        except CircuitOpenError:
+            self._count("circuit_rejections")
+            raise
+
+    def _resilient(self, send: Callable[[str], Any]) -> Any:
+        """
+        Run a blocking request with the circuit breaker, retries and hedging.
+
+        Args:
+            send: Makes one attempt against the given base URL; raises
+                  TransientError on retryable failures
+
+        Returns:
+            The result of the first successful attempt
+        """
+        attempt = 0
+        while True:
+            self._allow()
+
+            try:
+                answer = self._hedged(send) if self.hedge else self._timed(send)
+            except TransientError:
+                if self.breaker is not None:
+                    self.breaker.record_failure()
+                if self.retry is None or attempt >= self.retry.max_retries:
+                    raise
+                delay = self.retry.delay(attempt)
+                attempt += 1
+                self._count("retries")
+                logger.warning(f"Retrying Ollama request in {delay:.2f}s (retry {attempt})")
+                time.sleep(delay)
+                continue
+            except RuntimeError:
+                # The server answered; the request or response was bad
+                if self.breaker is not None:
+                    self.breaker.record_success()
+                raise
+
+            if self.breaker is not None:
+                self.breaker.record_success()
+            return answer
+
+    def _timed(self, send: Callable[[str], Any]) -> Any:
+        """Make one attempt on a routed endpoint, recording its latency for the hedge delay."""
+        endpoint = self._acquire_endpoint()
+        failed = False
+        start = time.monotonic()
+        try:
+            answer = send(endpoint)
+        except TransientError:
+            failed = True
+            raise
+        finally:
+            self.endpoints.release(endpoint, failed)
+        self._latencies.append(time.monotonic() - start)
+        return answer
+
+    def _acquire_endpoint(self) -> str:
+        """Route a request, probing ejected endpoints in the background when due."""
+        for url in self.endpoints.due_for_probe():
+            threading.Thread(
+                target=lambda u: self.endpoints.probed(u, self.is_available(u)),
+                args=(url,),
+                daemon=True
+            ).start()
+        return self.endpoints.acquire()
+
+    def hedge_delay(self) -> Optional[float]:
+        """Seconds after which a hedged request is sent (None until enough samples)."""
+        latencies = sorted(self._latencies)
+        if len(latencies) < self.hedge_min_samples:
+            return None
+        return latencies[min(len(latencies) - 1, int(self.hedge_quantile * len(latencies)))]
+
+    def _hedged(self, send: Callable[[str], Any]) -> Any:
+        """
+        Make an attempt and, if it is slower than the hedge delay, a second
+        one in parallel; the first success wins. The slower request is left
+        to finish in the background.
+        """
+        delay = self.hedge_delay()
+        if delay is None:
+            return self._timed(send)
+
+        with self._hedge_pool_lock:
+            if self._hedge_pool is None:
+                self._hedge_pool = ThreadPoolExecutor(
+                    max_workers=2 * self.pool_size,
+                    thread_name_prefix="ollama-hedge"
+                )
+        primary = self._hedge_pool.submit(self._timed, send)
+        try:
+            return primary.result(timeout=delay)
+        except FutureTimeout:
+            pass
+
+        self._count("hedges")
+        backup = self._hedge_pool.submit(self._timed, send)
+        pending = {primary, backup}
+        error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    if future is backup:
+                        self._count("hedge_wins")
+                    return future.result()
+                error = future.exception()
+        raise error
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        if self._hedge_pool is not None:
+            self._hedge_pool.shutdown(wait=False)
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def ask(
         self,
         prompt: str,
         stream: bool = False,
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
-        system: Optional[str] = None
+        system: Optional[str] = None,
+        timeout: Optional[float] = None,
+        stop: Optional[StopPredicate] = None,
+        seed: Optional[int] = None,
+        context: Optional[List[int]] = None,
+        info: Optional[Dict[str, Any]] = None,
+        cache: bool = True
     ) -> str:
         """
         Ask a question to the model and get a response.
 
+        Blocking requests use the response cache, retries, hedging and the
+        circuit breaker as configured. Streamed requests (stream=True or a
+        stop predicate) are sent once, with no retries or hedging; only the
+        circuit breaker and endpoint routing apply. A stop predicate also
+        bypasses the cache, since the answer depends on it. Callers with a
+        deadline (DraftGenerator) stream with a stop predicate, so their
+        requests are neither retried, hedged nor cached.
+
         Args:
             prompt: The question or prompt to send to the model
             stream: Whether to stream the response (default: False)
             temperature: Override default temperature for this request
             max_tokens: Maximum number of tokens to generate
             system: System prompt to set context/behavior
+            timeout: Override the client timeout for this request (seconds)
+            stop: Predicate called with the text generated so far; returning
+                  True ends generation early (implies stream=True)
+            seed: Sampling seed for reproducible output
+            context: Token context returned by an earlier request; the prompt
+                     continues from it instead of re-sending its text
+            info: Dictionary filled with the server's final response fields
+                  ('context', 'prompt_eval_count', 'prompt_eval_duration',
+                  ...); left empty when the answer comes from the cache
+            cache: Use the response cache if the client has one (False
+                   forces a server request, e.g. when info is required)
 
         Returns:
             The model's response as a string
 
         Raises:
-            requests.exceptions.RequestException: If the API request fails
+            RuntimeError: If the API request fails or the response is empty
         """
-        payload = {
-            "model": self.model,
-            "prompt": prompt,
-            "stream": stream,
-            "options": {}
-        }
+        payload = self._generate_payload(prompt, False, temperature, max_tokens, system, seed, context)
 
-        # Add optional parameters
-        if temperature is not None:
-            payload["options"]["temperature"] = temperature
-        elif self.temperature != 0.7:  # Only add if not default
-            payload["options"]["temperature"] = self.temperature
+        # Early-stopped answers depend on the predicate, so they bypass the cache
+        use_cache = cache and self.cache is not None and stop is None
+        if use_cache:
+            cached = self.cache.lookup("generate", payload)
+            if cached is not None:
+                logger.debug(f"Cache hit for prompt: {prompt[:50]}...")
+                return cached
 
-        if max_tokens is not None:
-            payload["options"]["num_predict"] = max_tokens
+        with self._span("ollama.ask"):
+            if stream or stop is not None:
+                answer = "".join(self.ask_stream(
+                    prompt,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    system=system,
+                    timeout=timeout,
+                    stop=stop,
+                    seed=seed,
+                    context=context,
+                    info=info
+                )).strip()
 
-        if system is not None:
-            payload["system"] = system
+                if not answer:
+                    logger.warning(f"Empty response from Ollama for prompt: {prompt[:50]}...")
+                    raise RuntimeError("Ollama returned an empty response")
+            else:
+                # Each attempt (retry or hedged duplicate) fills its own dict
+                # and only the winner's is copied, so a losing hedged request
+                # still running in the background cannot overwrite it
+                def attempt(base_url: str) -> tuple:
+                    attempt_info: Dict[str, Any] = {}
+                    answer = self._request_generate(payload, prompt, timeout, base_url, info=attempt_info)
+                    return answer, attempt_info
+
+                answer, attempt_info = self._resilient(attempt)
+                if info is not None:
+                    info.update(attempt_info)
+
+        if use_cache:
+            self.cache.store("generate", payload, answer)
+
+        return answer
+
+    def _request_generate(
+        self,
+        payload: Dict[str, Any],
+        prompt: str,
+        timeout: Optional[float],
+        base_url: Optional[str] = None,
+        info: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """Send a blocking /api/generate request and return the answer."""
+        timeout = self.timeout if timeout is None else timeout
+        base_url = base_url or self.base_url
+        url = f"{base_url}/api/generate"
 
         try:
-            logger.debug(f"Sending request to {self.generate_url} with model {self.model}")
-            response = requests.post(
-                self.generate_url,
+            logger.debug(f"Sending request to {url} with model {self.model}")
+            response = self.session.post(
+                url,
                 json=payload,
-                timeout=self.timeout
+                timeout=timeout
             )
             response.raise_for_status()
 
             result = response.json()
+            self._observe(result)
+            if info is not None:
+                info.update((key, value) for key, value in result.items() if key != "response")
             answer = result.get("response", "").strip()
 
             # Guard against empty responses
@@ -113,29 +628,91 @@ class OllamaClient:
             return answer
 
         except requests.exceptions.Timeout:
-            logger.error(f"Request timed out after {self.timeout}s")
-            raise RuntimeError(f"Ollama API request timed out after {self.timeout}s")
+            logger.error(f"Request timed out after {timeout}s")
+            raise TransientError(f"Ollama API request timed out after {timeout}s")
         except requests.exceptions.ConnectionError as e:
             logger.error(f"Connection error: {e}")
-            raise RuntimeError(f"Cannot connect to Ollama at {self.base_url}. Is Ollama running?")
+            raise TransientError(f"Cannot connect to Ollama at {base_url}. Is Ollama running?")
         except requests.exceptions.RequestException as e:
             logger.error(f"Ollama API request failed: {e}")
-            raise RuntimeError(f"Ollama API request failed: {e}")
+            raise _request_error(e, f"Ollama API request failed: {e}")
+
+    def ask_stream(
+        self,
+        prompt: str,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        system: Optional[str] = None,
+        timeout: Optional[float] = None,
+        stop: Optional[StopPredicate] = None,
+        seed: Optional[int] = None,
+        context: Optional[List[int]] = None,
+        info: Optional[Dict[str, Any]] = None
+    ) -> Iterator[str]:
+        """
+        Stream a response token chunk by token chunk.
+
+        The request is sent once: it is not retried, hedged or cached.
+        The circuit breaker and endpoint routing still apply.
+
+        Args:
+            prompt: The question or prompt to send to the model
+            temperature: Override default temperature for this request
+            max_tokens: Maximum number of tokens to generate
+            system: System prompt to set context/behavior
+            timeout: Override the client timeout (seconds between chunks)
+            stop: Predicate called with the text generated so far; returning
+                  True closes the connection so Ollama stops decoding
+            seed: Sampling seed for reproducible output
+            context: Token context returned by an earlier request
+            info: Dictionary filled with the final chunk's fields (not
+                  filled when generation is stopped early)
+
+        Yields:
+            Response text chunks as they are generated
+
+        Example:
+            for chunk in client.ask_stream("Write a haiku", stop=char_budget(200)):
+                print(chunk, end="", flush=True)
+        """
+        payload = self._generate_payload(prompt, True, temperature, max_tokens, system, seed, context)
+        return self._stream(
+            "/api/generate",
+            payload,
+            timeout,
+            lambda chunk: chunk.get("response", ""),
+            stop,
+            "Ollama API",
+            info
+        )
 
     def chat(
         self,
         messages: list,
         stream: bool = False,
-        temperature: Optional[float] = None
+        temperature: Optional[float] = None,
+        timeout: Optional[float] = None,
+        stop: Optional[StopPredicate] = None,
+        seed: Optional[int] = None,
+        cache: bool = True
     ) -> str:
         """
         Use the chat API with conversation history.
 
+        Like ask, streamed requests (stream=True or a stop predicate) are
+        not retried or hedged, and stopped ones are not cached.
+
         Args:
             messages: List of message dicts with 'role' and 'content' keys
                      Example: [{"role": "user", "content": "Hello!"}]
             stream: Whether to stream the response (default: False)
             temperature: Override default temperature for this request
+            timeout: Override the client timeout for this request (seconds)
+            stop: Predicate called with the text generated so far; returning
+                  True ends generation early (implies stream=True)
+            seed: Sampling seed for reproducible output
+            cache: Use the response cache if the client has one (False
+                   forces a server request)
 
         Returns:
             The model's response as a string
@@ -147,28 +724,59 @@ class OllamaClient:
             ]
             response = client.chat(messages)
         """
-        payload = {
-            "model": self.model,
-            "messages": messages,
-            "stream": stream,
-            "options": {}
-        }
+        payload = self._chat_payload(messages, False, temperature, seed)
 
-        if temperature is not None:
-            payload["options"]["temperature"] = temperature
-        elif self.temperature != 0.7:
-            payload["options"]["temperature"] = self.temperature
+        # Early-stopped answers depend on the predicate, so they bypass the cache
+        use_cache = cache and self.cache is not None and stop is None
+        if use_cache:
+            cached = self.cache.lookup("chat", payload)
+            if cached is not None:
+                logger.debug("Cache hit for chat request")
+                return cached
+
+        with self._span("ollama.chat"):
+            if stream or stop is not None:
+                answer = "".join(self.chat_stream(
+                    messages,
+                    temperature=temperature,
+                    timeout=timeout,
+                    stop=stop,
+                    seed=seed
+                )).strip()
+
+                if not answer:
+                    logger.warning("Empty response from Ollama chat API")
+                    raise RuntimeError("Ollama chat API returned an empty response")
+            else:
+                answer = self._resilient(partial(self._request_chat, payload, timeout))
+
+        if use_cache:
+            self.cache.store("chat", payload, answer)
+
+        return answer
+
+    def _request_chat(
+        self,
+        payload: Dict[str, Any],
+        timeout: Optional[float],
+        base_url: Optional[str] = None
+    ) -> str:
+        """Send a blocking /api/chat request and return the answer."""
+        timeout = self.timeout if timeout is None else timeout
+        base_url = base_url or self.base_url
+        url = f"{base_url}/api/chat"
 
         try:
-            logger.debug(f"Sending chat request to {self.chat_url} with model {self.model}")
-            response = requests.post(
-                self.chat_url,
+            logger.debug(f"Sending chat request to {url} with model {self.model}")
+            response = self.session.post(
+                url,
                 json=payload,
-                timeout=self.timeout
+                timeout=timeout
             )
             response.raise_for_status()
 
             result = response.json()
+            self._observe(result)
             message = result.get("message", {})
             answer = message.get("content", "").strip()
 
@@ -181,14 +789,205 @@ class OllamaClient:
             return answer
 
         except requests.exceptions.Timeout:
-            logger.error(f"Chat request timed out after {self.timeout}s")
-            raise RuntimeError(f"Ollama chat API request timed out after {self.timeout}s")
+            logger.error(f"Chat request timed out after {timeout}s")
+            raise TransientError(f"Ollama chat API request timed out after {timeout}s")
         except requests.exceptions.ConnectionError as e:
             logger.error(f"Chat connection error: {e}")
-            raise RuntimeError(f"Cannot connect to Ollama at {self.base_url}. Is Ollama running?")
+            raise TransientError(f"Cannot connect to Ollama at {base_url}. Is Ollama running?")
         except requests.exceptions.RequestException as e:
             logger.error(f"Ollama chat API request failed: {e}")
-            raise RuntimeError(f"Ollama chat API request failed: {e}")
+            raise _request_error(e, f"Ollama chat API request failed: {e}")
+
+    def chat_stream(
+        self,
+        messages: list,
+        temperature: Optional[float] = None,
+        timeout: Optional[float] = None,
+        stop: Optional[StopPredicate] = None,
+        seed: Optional[int] = None
+    ) -> Iterator[str]:
+        """
+        Stream a chat response token chunk by token chunk.
+
+        As with ask_stream, the request is not retried, hedged or cached.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content' keys
+            temperature: Override default temperature for this request
+            timeout: Override the client timeout (seconds between chunks)
+            stop: Predicate called with the text generated so far; returning
+                  True closes the connection so Ollama stops decoding
+            seed: Sampling seed for reproducible output
+
+        Yields:
+            Response text chunks as they are generated
+        """
+        payload = self._chat_payload(messages, True, temperature, seed)
+        return self._stream(
+            "/api/chat",
+            payload,
+            timeout,
+            lambda chunk: chunk.get("message", {}).get("content", ""),
+            stop,
+            "Ollama chat API"
+        )
+
+    def _generate_payload(
+        self,
+        prompt: str,
+        stream: bool,
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        system: Optional[str],
+        seed: Optional[int] = None,
+        context: Optional[List[int]] = None
+    ) -> Dict[str, Any]:
+        """Build the /api/generate request body."""
+        payload = {
+            "model": self.model,
+            "prompt": prompt,
+            "stream": stream,
+            "options": {}
+        }
+
+        # Add optional parameters
+        if temperature is not None:
+            payload["options"]["temperature"] = temperature
+        elif self.temperature != 0.7:  # Only add if not default
+            payload["options"]["temperature"] = self.temperature
+
+        if max_tokens is not None:
+            payload["options"]["num_predict"] = max_tokens
+
+        if seed is not None:
+            payload["options"]["seed"] = seed
+
+        if system is not None:
+            payload["system"] = system
+
+        if context is not None:
+            payload["context"] = context
+
+        if self.keep_alive is not None:
+            payload["keep_alive"] = self.keep_alive
+
+        return payload
+
+    def _chat_payload(
+        self,
+        messages: list,
+        stream: bool,
+        temperature: Optional[float],
+        seed: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Build the /api/chat request body."""
+        payload = {
+            "model": self.model,
+            "messages": messages,
+            "stream": stream,
+            "options": {}
+        }
+
+        if temperature is not None:
+            payload["options"]["temperature"] = temperature
+        elif self.temperature != 0.7:
+            payload["options"]["temperature"] = self.temperature
+
+        if seed is not None:
+            payload["options"]["seed"] = seed
+
+        if self.keep_alive is not None:
+            payload["keep_alive"] = self.keep_alive
+
+        return payload
+
+    def _stream(
+        self,
+        path: str,
+        payload: Dict[str, Any],
+        timeout: Optional[float],
+        extract: Callable[[Dict[str, Any]], str],
+        stop: Optional[StopPredicate],
+        api_name: str,
+        info: Optional[Dict[str, Any]] = None
+    ) -> Iterator[str]:
+        """
+        POST a streaming request and yield text from each NDJSON line.
+
+        Closing the response (on stop, on completion, or when the caller
+        abandons the generator) drops the connection, which makes Ollama
+        abort the generation instead of decoding tokens nobody reads.
+
+        A timeout shorter than the client's own (e.g. the time left before a
+        caller's deadline) expiring is not held against the endpoint.
+        """
+        # Only the client's own timeout is evidence of an unhealthy server
+        own_timeout = timeout is None or timeout >= self.timeout
+        timeout = self.timeout if timeout is None else timeout
+        self._allow()
+
+        base_url = self._acquire_endpoint()
+        url = f"{base_url}{path}"
+        failed = False
+
+        try:
+            logger.debug(f"Sending streaming request to {url} with model {self.model}")
+            try:
+                response = self.session.post(url, json=payload, timeout=timeout, stream=True)
+                response.raise_for_status()
+            except requests.exceptions.RequestException as e:
+                held = own_timeout or not isinstance(e, requests.exceptions.Timeout)
+                if self.breaker is not None and held and isinstance(_request_error(e, ""), TransientError):
+                    self.breaker.record_failure()
+                raise
+            if self.breaker is not None:
+                self.breaker.record_success()
+
+            try:
+                text = ""
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+
+                    chunk = json.loads(line)
+                    if "error" in chunk:
+                        raise RuntimeError(f"{api_name} error: {chunk['error']}")
+
+                    piece = extract(chunk)
+                    if piece:
+                        text += piece
+                        yield piece
+
+                        if stop is not None and stop(text):
+                            logger.debug(f"Stop predicate hit after {len(text)} chars")
+                            break
+
+                    if chunk.get("done"):
+                        self._observe(chunk)
+                        if info is not None:
+                            info.update(chunk)
+                        break
+            finally:
+                response.close()
+
+        except requests.exceptions.Timeout:
+            (logger.error if own_timeout else logger.info)(f"Streaming request timed out after {timeout}s")
+            failed = own_timeout
+            raise TransientError(f"{api_name} request timed out after {timeout}s")
+        except requests.exceptions.ConnectionError as e:
+            logger.error(f"Streaming connection error: {e}")
+            failed = True
+            raise TransientError(f"Cannot connect to Ollama at {base_url}. Is Ollama running?")
+        except requests.exceptions.RequestException as e:
+            logger.error(f"{api_name} streaming request failed: {e}")
+            error = _request_error(e, f"{api_name} request failed: {e}")
+            failed = isinstance(error, TransientError)
+            raise error
+        except ValueError as e:
+            logger.error(f"Malformed streaming response: {e}")
+            raise RuntimeError(f"{api_name} returned malformed stream data: {e}")
+        finally:
+            self.endpoints.release(base_url, failed)
 
     def list_models(self) -> list:
         """
@@ -198,7 +997,7 @@ class OllamaClient:
             List of available model names
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/api/tags",
                 timeout=self.timeout
             )
@@ -211,16 +1010,19 @@ class OllamaClient:
         except requests.exceptions.RequestException as e:
             raise RuntimeError(f"Failed to list models: {e}")
 
-    def is_available(self) -> bool:
+    def is_available(self, base_url: Optional[str] = None) -> bool:
         """
         Check if Ollama API is available.
 
+        Args:
+            base_url: Server to probe (default: the first base URL)
+
         Returns:
             True if API is reachable, False otherwise
         """
         try:
-            response = requests.get(
-                f"{self.base_url}/api/tags",
+            response = self.session.get(
+                f"{base_url or self.base_url}/api/tags",
                 timeout=5
             )
             return response.status_code == 200
@@ -228,6 +1030,86 @@ class OllamaClient:
             return False
 
 
+class AsyncOllamaClient:
+    """
+    Asyncio front-end for OllamaClient.
+
+    Each call runs the pooled synchronous client on a bounded thread pool, so
+    at most `pool_size` requests are in flight and every request reuses a
+    keep-alive connection. Errors are mapped to RuntimeError exactly as in
+    OllamaClient.
+
+    Usage:
+        async with AsyncOllamaClient() as client:
+            answers = await asyncio.gather(*(client.ask(q) for q in questions))
+    """
+
+    def __init__(
+        self,
+        base_url: str = "http://127.0.0.1:11434",
+        model: str = "qwen3:1.7b",
+        temperature: float = 0.7,
+        timeout: int = 60,
+        pool_size: int = 10,
+        client: Optional[OllamaClient] = None
+    ):
+        """
+        Initialize the async client.
+
+        Args:
+            base_url: Base URL for Ollama API
+            model: Model name to use
+            temperature: Sampling temperature 0.0-1.0
+            timeout: Default request timeout in seconds
+            pool_size: Maximum concurrent requests / pooled connections
+            client: Existing OllamaClient to share (other args are ignored)
+        """
+        self.client = client or OllamaClient(
+            base_url=base_url,
+            model=model,
+            temperature=temperature,
+            timeout=timeout,
+            pool_size=pool_size
+        )
+        self._owns_client = client is None
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.client.pool_size,
+            thread_name_prefix="ollama"
+        )
+
+    async def _run(self, fn, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(fn, *args, **kwargs))
+
+    async def ask(self, prompt: str, **kwargs) -> str:
+        """Async version of OllamaClient.ask (same keyword arguments)."""
+        return await self._run(self.client.ask, prompt, **kwargs)
+
+    async def chat(self, messages: list, **kwargs) -> str:
+        """Async version of OllamaClient.chat (same keyword arguments)."""
+        return await self._run(self.client.chat, messages, **kwargs)
+
+    async def list_models(self) -> list:
+        """Async version of OllamaClient.list_models."""
+        return await self._run(self.client.list_models)
+
+    async def is_available(self) -> bool:
+        """Async version of OllamaClient.is_available."""
+        return await self._run(self.client.is_available)
+
+    async def close(self) -> None:
+        """Shut down the worker threads and close owned connections."""
+        self._executor.shutdown(wait=True)
+        if self._owns_client:
+            self.client.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+
 # Convenience function for quick usage
 def ask_ollama(prompt: str, model: str = "qwen3:1.7b") -> str:
     """
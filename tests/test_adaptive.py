@@ -0,0 +1,111 @@
+"""Tests for AdaptiveDrafter's stop conditions with stub drafting and verification."""
+
+import pytest
+
+from vpa.plan import AdaptiveDrafter
+from vpa.reporting import EventSink
+
+
+class StubGenerator:
+    """Yields prepared candidates, recording how many were drafted."""
+
+    def __init__(self, texts):
+        self.texts = texts
+        self.drafted = 0
+        self.closed = False
+        self.kwargs = None
+
+    def iter_generate(self, question, k, **kwargs):
+        self.kwargs = kwargs
+        try:
+            for i, text in enumerate(self.texts[:k], 1):
+                self.drafted += 1
+                yield {"id": i, "text": text}
+        finally:
+            self.closed = True
+
+
+class StubVerifier:
+    """Scores candidates from a table keyed by text; empty text is filtered out."""
+
+    def __init__(self, scores):
+        self.scores = scores
+
+    def verify(self, candidates, tests=None):
+        if not candidates[0]["text"]:
+            raise ValueError("No valid candidates")
+        return [dict(candidate, score=self.scores[candidate["text"]]) for candidate in candidates]
+
+
+class RecordingSink(EventSink):
+    def __init__(self):
+        self.events = []
+
+    def emit(self, event, **fields):
+        self.events.append((event, fields))
+
+
+SCORES = {"4": 0.5, "four": 0.6, "5": 0.7, "six": 0.95, "": 0.0}
+
+
+def drafter(texts, **kwargs):
+    generator = StubGenerator(texts)
+    drafter = AdaptiveDrafter(generator, StubVerifier(SCORES), answer_fn=str.strip, **kwargs)
+    return drafter, generator
+
+
+def test_stops_once_a_candidate_clears_the_threshold():
+    adaptive, generator = drafter(["4", "six", "5", "four"], threshold=0.9)
+    candidates = adaptive.generate("Q?", k=4)
+
+    assert generator.drafted == 2
+    assert generator.closed
+    assert [(c["text"], c["rank"]) for c in candidates] == [("six", 1), ("4", 2)]
+
+
+def test_min_k_delays_the_stop():
+    adaptive, generator = drafter(["six", "4", "5", "four"], threshold=0.9)
+    candidates = adaptive.generate("Q?", k=4, min_k=3)
+
+    assert generator.drafted == 3
+    assert candidates[0]["text"] == "six"
+
+
+def test_stops_on_consensus():
+    adaptive, generator = drafter(["4", "5", "4", "six"], threshold=None, consensus=2)
+    candidates = adaptive.generate("Q?", k=4)
+
+    assert generator.drafted == 3
+    assert [c["answer"] for c in candidates] == ["5", "4", "4"]
+
+
+def test_drafts_all_k_when_nothing_stops_it():
+    sink = RecordingSink()
+    adaptive, generator = drafter(["4", "5", "four", "six"], threshold=0.99, consensus=2, reporter=sink)
+    candidates = adaptive.generate("Q?", k=3, token_budget=300, deadline=5.0)
+
+    assert generator.drafted == 3
+    assert [c["text"] for c in candidates] == ["5", "four", "4"]
+    assert sink.events[-1] == ("plan.done", {"reason": "budget", "verified": 3, "k": 3, "best_score": 0.7})
+    assert generator.kwargs["token_budget"] == 300
+    assert generator.kwargs["deadline"] == 5.0
+
+
+def test_candidates_filtered_by_the_verifier_do_not_count():
+    adaptive, generator = drafter(["", "4", "4"], threshold=None, consensus=2)
+    candidates = adaptive.generate("Q?", k=3, min_k=2)
+
+    assert generator.drafted == 3
+    assert [c["id"] for c in candidates] == [2, 3]
+
+
+@pytest.mark.parametrize("min_k,k", [(0, 3), (4, 3)])
+def test_invalid_min_k(min_k, k):
+    adaptive, _ = drafter(["4"])
+    with pytest.raises(ValueError):
+        adaptive.generate("Q?", k=k, min_k=min_k)
+
+
+def test_consensus_needs_at_least_two():
+    with pytest.raises(ValueError):
+        AdaptiveDrafter(StubGenerator([]), StubVerifier(SCORES), consensus=1)
@@ -0,0 +1,57 @@
+"""Tests for the benchmark harness."""
+
+import argparse
+from collections import Counter
+
+import pytest
+
+from benchmarks import run
+from benchmarks.mock_ollama import MockOllamaServer
+
+
+def test_measure_runs_the_operation_each_time():
+    calls = []
+    result = run.measure("unit", {}, lambda: calls.append(1), 5)
+
+    assert len(calls) == 5
+    assert result["operations"] == 5
+    assert result["errors"] == 0
+
+
+def test_measure_counts_raised_and_reported_failures():
+    def fail():
+        raise RuntimeError("boom")
+
+    assert run.measure("unit", {}, fail, 3)["errors"] == 3
+    assert run.measure("unit", {}, lambda: [1], 2, failures=lambda result: 3 - len(result))["errors"] == 4
+
+
+@pytest.fixture
+def counted(monkeypatch):
+    calls = Counter()
+    measure = run.measure
+
+    def counting(name, params, operation, operations, **kwargs):
+        def operation_counted():
+            calls[name] += 1
+            return operation()
+        return measure(name, params, operation_counted, operations, **kwargs)
+
+    monkeypatch.setattr(run, "measure", counting)
+    return calls
+
+
+def test_every_scenario_runs_its_operation(counted):
+    args = argparse.Namespace(k=[1], concurrency=[1], code_workers=[0], dataset_sizes=[2], questions=2)
+
+    with MockOllamaServer(latency=0.0) as server:
+        results = (
+            run.bench_draft(server, args)
+            + run.bench_verify(args)
+            + run.bench_code(args)
+            + run.bench_eval(server, args)
+        )
+
+    # draft and verify: 2 each per configuration; code: execute_code + execute_many; eval: one run
+    assert counted == {"draft": 2, "verify": 4, "code": 4, "eval": 1}
+    assert all(result["errors"] == 0 for result in results)
@@ -0,0 +1,123 @@
+"""Tests for the tiered cache stores and the client and verifier caches."""
+
+import pytest
+
+from ollama_client import OllamaClient
+from vpa.cache import ResponseCache, VerificationCache
+from vpa.cache.store import LRUCache, SQLiteStore, TieredCache
+
+
+def test_lru_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert len(cache) == 2
+
+
+def test_sqlite_store_round_trip_and_size_budget(tmp_path):
+    store = SQLiteStore(str(tmp_path / "cache.sqlite"), max_bytes=200)
+    store.put("a", {"text": "x" * 50})
+    assert store.get("a") == {"text": "x" * 50}
+
+    for i in range(10):
+        store.put(f"k{i}", "y" * 50)
+    assert store.total_bytes <= 200
+    assert store.get("a") is None
+    store.close()
+
+
+def test_tiered_cache_promotes_disk_hits(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    cache = TieredCache(memory_size=4, path=path)
+    cache.put("key", "value")
+    cache.close()
+
+    reopened = TieredCache(memory_size=4, path=path)
+    assert reopened.get("key") == "value"
+    assert reopened.get("key") == "value"
+    assert reopened.get("missing") is None
+
+    stats = reopened.stats()
+    assert (stats["disk_hits"], stats["memory_hits"], stats["misses"]) == (1, 1, 1)
+    reopened.close()
+
+
+def test_response_cache_key_ignores_stream_and_keep_alive():
+    base = {"model": "m", "prompt": "p", "options": {"temperature": 0}}
+    assert ResponseCache.key("generate", base) == ResponseCache.key(
+        "generate", dict(base, stream=True, keep_alive="30m")
+    )
+    assert ResponseCache.key("generate", base) != ResponseCache.key("chat", base)
+    assert ResponseCache.key("generate", base) != ResponseCache.key(
+        "generate", dict(base, prompt="q")
+    )
+
+
+def test_response_cache_deterministic_policy():
+    cache = ResponseCache(policy="deterministic")
+    sampled = {"model": "m", "prompt": "p", "options": {"temperature": 0.7}}
+    seeded = {"model": "m", "prompt": "p", "options": {"temperature": 0.7, "seed": 1}}
+
+    cache.store("generate", sampled, "a")
+    cache.store("generate", seeded, "b")
+    assert cache.lookup("generate", sampled) is None
+    assert cache.lookup("generate", seeded) == "b"
+
+    with pytest.raises(ValueError):
+        ResponseCache(policy="sometimes")
+
+
+def test_verification_cache_checks_round_trip():
+    cache = VerificationCache()
+    config = {"version": "2"}
+    checks = {"length": 1.0, "code": 0.0}
+
+    cache.store_checks("text", config, None, checks)
+    checks["length"] = 0.0
+
+    assert cache.lookup_checks("text", config) == {"checks": {"length": 1.0, "code": 0.0}, "tests": None}
+    assert cache.lookup_checks("text", {"version": "3"}) is None
+    assert cache.lookup_checks("text", config, ["assert f() == 1"]) is None
+
+
+def test_verification_cache_skips_transient_failures():
+    cache = VerificationCache()
+    timed_out = {"success": False, "output": "", "error": "Execution timed out after 5 seconds"}
+    failed = {"success": False, "output": "", "error": "NameError: x"}
+
+    cache.store_code("loop()", {}, timed_out)
+    cache.store_code("x", {}, failed)
+    assert cache.lookup_code("loop()", {}) is None
+    assert cache.lookup_code("x", {}) == failed
+
+    cache.store_checks("a", {}, None, {"code": 0.0}, code_results=[timed_out])
+    cache.store_checks("b", {}, ["assert 1"], {"tests": 0.0}, test_report={"error": "Batch deadline of 1 seconds exceeded"})
+    assert cache.lookup_checks("a", {}) is None
+    assert cache.lookup_checks("b", {}, ["assert 1"]) is None
+
+
+class FakeChatResponse:
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return {"message": {"role": "assistant", "content": "Hello!"}, "done": True}
+
+
+@pytest.mark.parametrize("cache", [True, False])
+def test_chat_cache_can_be_skipped(monkeypatch, cache):
+    client = OllamaClient(base_url="http://ollama.test", cache=ResponseCache())
+    posts = []
+    monkeypatch.setattr(client.session, "post", lambda url, **kwargs: posts.append(url) or FakeChatResponse())
+    messages = [{"role": "user", "content": "Hi"}]
+
+    assert client.chat(messages, temperature=0.0) == "Hello!"
+    assert client.chat(messages, temperature=0.0, cache=cache) == "Hello!"
+
+    assert len(posts) == (1 if cache else 2)
+    client.close()
@@ -0,0 +1,138 @@
+"""Tests for code normalization, deduplicated execution and resource limits."""
+
+import time
+
+import pytest
+
+from vpa.cache import VerificationCache
+from vpa.verify.checker import SimpleVerifier
+from vpa.verify.code_executor import CodeExecutor, ResourceLimits, code_fingerprint, normalize_code, resource
+
+rlimits = pytest.mark.skipif(resource is None, reason="resource module unavailable")
+
+
+def counting_executor(executor, calls):
+    """Replace real execution with a recorder that reports success."""
+    def execute(code, timeout):
+        calls.append(code)
+        return {"success": True, "output": code, "error": None}
+    executor._execute = execute
+    return executor
+
+
+def test_normalize_code_line_endings_and_trailing_whitespace():
+    assert normalize_code("x = 1\r\ny = 2\r\n\n  ") == "x = 1\ny = 2"
+    assert normalize_code("x = 1\ry = 2") == "x = 1\ny = 2"
+
+
+def test_normalize_code_keeps_whitespace_inside_string_literals():
+    padded = 's = """x   \n"""\nassert len(s) == 5'
+    plain = 's = """x\n"""\nassert len(s) == 5'
+    assert normalize_code(padded) != normalize_code(plain)
+    assert code_fingerprint(padded) != code_fingerprint(plain)
+
+
+def test_normalize_code_keeps_leading_lines():
+    assert normalize_code("\n\nraise ValueError") == "\n\nraise ValueError"
+
+
+def test_execute_unique_runs_identical_snippets_once():
+    calls = []
+    executor = counting_executor(CodeExecutor(), calls)
+
+    results = executor.execute_unique(["print(1)", "print(2)", "print(1)\r\n", "print(1)"])
+
+    assert calls == ["print(1)", "print(2)"]
+    assert [result["output"] for result in results] == ["print(1)", "print(2)", "print(1)", "print(1)"]
+
+
+def test_execute_unique_empty():
+    assert CodeExecutor().execute_unique([]) == []
+
+
+def test_verifier_executes_shared_blocks_once_and_caches_them():
+    calls = []
+    cache = VerificationCache()
+    verifier = SimpleVerifier(code_workers=0, cache=cache)
+    counting_executor(verifier.executor, calls)
+
+    block = "```python\nprint('hi')\n```"
+    texts = [f"Here is the code:\n{block}\nIt prints hi.", f"Try this:\n{block}\nDone."]
+    verifier.verify([{"id": i, "text": text} for i, text in enumerate(texts, 1)])
+    assert calls == ["print('hi')"]
+
+    verifier.verify([{"id": 3, "text": f"Another answer:\n{block}\nThat is all."}])
+    assert calls == ["print('hi')"]
+
+
+def test_execute_unique_keeps_programs_that_differ_in_string_whitespace_apart():
+    padded = 's = """x   \n"""\nassert len(s) == 5'
+    plain = 's = """x\n"""\nassert len(s) == 5'
+
+    results = CodeExecutor(timeout=10).execute_unique([padded, plain])
+
+    assert results[0]["success"]
+    assert not results[1]["success"]
+
+
+@pytest.mark.parametrize("pool_size", [0, 1])
+def test_large_output_is_truncated_not_timed_out(pool_size):
+    limits = ResourceLimits(output_bytes=1024)
+    with CodeExecutor(timeout=5, pool_size=pool_size, limits=limits) as executor:
+        started = time.monotonic()
+        printed = executor.execute_code("print('x' * 200_000)")
+        raised = executor.execute_code("import sys\nsys.stderr.write('e' * 200_000)\nraise ValueError('done')")
+
+    assert time.monotonic() - started < 4
+    assert printed["success"]
+    assert printed["output"] == "x" * 1024 + "\n... [output truncated at 1024 bytes]"
+    assert not raised["success"]
+    assert "[output truncated at 1024 bytes]" in raised["error"]
+    assert "ValueError: done" in raised["error"]
+
+
+def test_default_output_cap_survives_the_pipe_buffer():
+    result = CodeExecutor(timeout=5).execute_code("print('x' * 70_000)")
+
+    assert result["success"]
+    assert result["output"].endswith(f"[output truncated at {64 * 1024} bytes]")
+
+
+@rlimits
+@pytest.mark.parametrize("pool_size", [0, 1])
+def test_memory_limit(pool_size):
+    limits = ResourceLimits(memory_mb=64)
+    with CodeExecutor(timeout=10, pool_size=pool_size, limits=limits) as executor:
+        result = executor.execute_code("data = bytearray(512 * 1024 * 1024)")
+        after = executor.execute_code("print('ok')")
+
+    assert not result["success"]
+    assert "MemoryError" in result["error"]
+    assert after["output"] == "ok\n"
+
+
+@rlimits
+@pytest.mark.parametrize("pool_size", [0, 1])
+def test_cpu_time_limit(pool_size):
+    limits = ResourceLimits(cpu_seconds=1)
+    with CodeExecutor(timeout=30, pool_size=pool_size, limits=limits) as executor:
+        started = time.monotonic()
+        result = executor.execute_code("while True:\n    pass")
+        elapsed = time.monotonic() - started
+        after = executor.execute_code("print('ok')")
+
+    assert elapsed < 10
+    assert result == {"success": False, "output": "", "error": "CPU time limit exceeded"}
+    assert after["output"] == "ok\n"
+
+
+@rlimits
+@pytest.mark.parametrize("pool_size", [0, 1])
+def test_open_files_limit(pool_size):
+    limits = ResourceLimits(open_files=32)
+    code = "import os\nhandles = [open(os.devnull) for _ in range(64)]"
+    with CodeExecutor(timeout=10, pool_size=pool_size, limits=limits) as executor:
+        result = executor.execute_code(code)
+
+    assert not result["success"]
+    assert "Too many open files" in result["error"]
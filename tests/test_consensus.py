@@ -0,0 +1,96 @@
+"""Tests for vpa.verify.consensus."""
+
+import itertools
+
+import pytest
+
+from vpa.verify.consensus import ConsensusClusterer, answer_key
+
+
+def test_answer_key_prefers_last_number():
+    assert answer_key("2 + 2 = 4. The answer is 1,024") == "1024"
+    assert answer_key("Paris!\nIt is the capital.") == "paris"
+
+
+def test_different_numbers_do_not_cluster():
+    clusterer = ConsensusClusterer()
+    labels = clusterer.cluster(["The answer is 1000000", "The answer is 10000000"])
+    assert labels == [0, 1]
+
+
+def test_identical_numbers_cluster_regardless_of_wording():
+    clusterer = ConsensusClusterer()
+    labels = clusterer.cluster(["The answer is 42", "So we get 42.", "It is 41"])
+    assert labels == [0, 0, 2]
+
+
+def test_short_answers_only_match_exactly():
+    clusterer = ConsensusClusterer()
+    assert clusterer.cluster(["Paris", "paris!", "Parish"]) == [0, 0, 2]
+
+
+def test_empty_answers_stay_unclustered():
+    clusterer = ConsensusClusterer()
+    assert clusterer.cluster(["", "", "..."]) == [0, 1, 2]
+
+
+def test_near_identical_free_text_clusters():
+    clusterer = ConsensusClusterer()
+    labels = clusterer.cluster([
+        "photosynthesis converts light energy",
+        "gravity bends spacetime around mass",
+        "Photosynthesis converts light energy.",
+        "photosynthesis converts light energy!"
+    ])
+    assert labels == [0, 1, 0, 0]
+
+
+def test_cluster_matches_all_pairs_within_lsh_buckets():
+    # Single-row bands: some buckets hold a dissimilar first member
+    clusterer = ConsensusClusterer(threshold=0.8, num_perm=16, bands=16)
+    texts = [
+        "photosynthesis converts l",
+        "photosynthesis converts li now",
+        "photosynthesis converts lighs",
+        "photosynthesis converts light now",
+        "photosynthesis converts light too",
+        "mitochondria produce en too"
+    ]
+
+    # Reference: connected components over every pair sharing a band
+    signatures = [clusterer.signature(answer_key(text)) for text in texts]
+    parent = list(range(len(texts)))
+
+    def find(i):
+        while parent[i] != i:
+            i = parent[i]
+        return i
+
+    rows = clusterer.rows
+    for a, b in itertools.combinations(range(len(texts)), 2):
+        shares_band = any(
+            signatures[a][band * rows:(band + 1) * rows] == signatures[b][band * rows:(band + 1) * rows]
+            for band in range(clusterer.bands)
+        )
+        if shares_band and clusterer._similarity(signatures[a], signatures[b]) >= clusterer.threshold:
+            root_a, root_b = find(a), find(b)
+            parent[max(root_a, root_b)] = min(root_a, root_b)
+
+    labels = clusterer.cluster(texts)
+    assert labels == [find(i) for i in range(len(texts))]
+    assert labels == [0, 0, 0, 0, 0, 5]
+
+
+def test_apply_adds_consensus_and_reranks():
+    verified = [
+        {"id": 1, "text": "The answer is 5", "checks": {"length": 1.0}, "score": 1.0},
+        {"id": 2, "text": "I think 4", "checks": {"length": 0.8}, "score": 0.8},
+        {"id": 3, "text": "So it is 4", "checks": {"length": 0.8}, "score": 0.8}
+    ]
+    result = ConsensusClusterer().apply(verified)
+
+    assert [candidate["id"] for candidate in result] == [2, 3, 1]
+    assert [candidate["rank"] for candidate in result] == [1, 2, 3]
+    assert result[0]["cluster_size"] == 2
+    assert result[0]["checks"]["consensus"] == pytest.approx(2 / 3)
+    assert result[2]["score"] == pytest.approx((1.0 + 1 / 3) / 2)
@@ -0,0 +1,125 @@
+"""Tests for the streaming dataset loaders."""
+
+import json
+
+import pytest
+
+from vpa.eval import load_dataset
+
+
+def write_jsonl(path, records):
+    path.write_text("".join(json.dumps(record) + "\n" for record in records), encoding="utf-8")
+    return str(path)
+
+
+@pytest.fixture
+def qa_file(tmp_path):
+    records = [{"id": f"q{i}", "question": f"Question {i}?", "answer": str(i)} for i in range(200)]
+    return write_jsonl(tmp_path / "qa.jsonl", records)
+
+
+def ids(items):
+    return [item["id"] for item in items]
+
+
+def test_shards_are_disjoint_and_cover_the_dataset(qa_file):
+    shards = [ids(load_dataset(qa_file, shard=(index, 3))) for index in range(3)]
+
+    assert sum(len(shard) for shard in shards) == 200
+    assert sorted(sum(shards, [])) == sorted(ids(load_dataset(qa_file)))
+    assert shards[1][:2] == ["q1", "q4"]
+
+
+def test_seeded_sample_is_stable(qa_file):
+    first = ids(load_dataset(qa_file, sample_rate=0.25, seed=7))
+    second = ids(load_dataset(qa_file, sample_rate=0.25, seed=7))
+
+    assert first == second
+    assert 20 < len(first) < 80
+    assert first != ids(load_dataset(qa_file, sample_rate=0.25, seed=8))
+
+
+def test_sample_does_not_depend_on_record_order(qa_file, tmp_path):
+    records = list(reversed([json.loads(line) for line in open(qa_file, encoding="utf-8")]))
+    reversed_file = write_jsonl(tmp_path / "reversed.jsonl", records)
+
+    assert sorted(ids(load_dataset(qa_file, sample_rate=0.3))) == sorted(
+        ids(load_dataset(reversed_file, sample_rate=0.3))
+    )
+
+
+def test_sample_within_a_shard(qa_file):
+    shard = set(ids(load_dataset(qa_file, shard=(0, 2))))
+    sampled = ids(load_dataset(qa_file, shard=(0, 2), sample_rate=0.5, seed=1))
+
+    assert set(sampled) <= shard
+    assert sampled == [item_id for item_id in ids(load_dataset(qa_file, sample_rate=0.5, seed=1))
+                       if item_id in shard]
+
+
+def test_full_sample_rate_and_limit(qa_file):
+    assert len(ids(load_dataset(qa_file, sample_rate=1.0))) == 200
+    assert ids(load_dataset(qa_file, limit=3)) == ["q0", "q1", "q2"]
+
+
+def test_missing_ids_use_the_file_position(tmp_path):
+    path = write_jsonl(tmp_path / "gsm8k.jsonl", [
+        {"question": "2 + 2?", "answer": "Add them.\n#### 4"},
+        {"question": "1,000 + 1?", "answer": "#### 1,001"}
+    ])
+    items = list(load_dataset(path, format="gsm8k"))
+
+    assert ids(items) == ["0", "1"]
+    assert [item["answer"] for item in items] == ["4", "1001"]
+
+
+def test_mbpp_records_become_code_items(tmp_path):
+    path = write_jsonl(tmp_path / "mbpp.jsonl", [{
+        "task_id": 11, "text": "Write add.", "test_list": ["assert add(1, 2) == 3"], "test_setup_code": ""
+    }])
+    [item] = load_dataset(path, format="mbpp")
+
+    assert item["id"] == "11"
+    assert item["type"] == "code"
+    assert item["tests"] == ["assert add(1, 2) == 3"]
+    assert item["test_setup"] is None
+    assert item["question"].endswith("assert add(1, 2) == 3")
+
+
+def test_dataset_is_read_lazily(tmp_path):
+    path = tmp_path / "broken.jsonl"
+    path.write_text('{"question": "ok?", "answer": "yes"}\n{broken\n', encoding="utf-8")
+    items = load_dataset(str(path))
+
+    assert next(items)["question"] == "ok?"
+    with pytest.raises(ValueError, match="broken.jsonl:2"):
+        next(items)
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"format": "squad"},
+    {"shard": (2, 2)},
+    {"shard": (0, 0)},
+    {"sample_rate": 0.0},
+    {"sample_rate": 1.5}
+])
+def test_invalid_options(qa_file, kwargs):
+    with pytest.raises(ValueError):
+        list(load_dataset(qa_file, **kwargs))
+
+
+def test_unsupported_file_type(tmp_path):
+    with pytest.raises(ValueError):
+        list(load_dataset(str(tmp_path / "data.csv")))
+
+
+def test_parquet_matches_jsonl(qa_file, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    pa = pytest.importorskip("pyarrow")
+    records = [json.loads(line) for line in open(qa_file, encoding="utf-8")]
+    path = str(tmp_path / "qa.parquet")
+    pq.write_table(pa.Table.from_pylist(records), path)
+
+    assert ids(load_dataset(path, shard=(1, 4), sample_rate=0.5)) == ids(
+        load_dataset(qa_file, shard=(1, 4), sample_rate=0.5)
+    )
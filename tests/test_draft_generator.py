@@ -0,0 +1,173 @@
+"""Tests for DraftGenerator against a fake client and the mock Ollama server."""
+
+import threading
+import time
+
+import pytest
+
+from benchmarks.mock_ollama import MockOllamaServer
+from ollama_client import OllamaClient
+from vpa.cache import ResponseCache
+from vpa.draft.generator import DraftGenerator
+from vpa.reporting import EventSink
+
+
+class FakeClient:
+    """Records ask() calls and answers with a fixed text."""
+
+    model = "fake"
+    base_url = "http://fake"
+    base_urls = ["http://fake"]
+
+    def __init__(self, answer="An answer.", context=(7, 8, 9)):
+        self.answer = answer
+        self.context = list(context)
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def ask(self, prompt, **kwargs):
+        with self._lock:
+            self.calls.append((prompt, kwargs))
+        info = kwargs.get("info")
+        if info is not None:
+            info.update(context=self.context, prompt_eval_count=len(prompt.split()),
+                        prompt_eval_duration=1_000_000)
+        return self.answer
+
+
+class SlowClient(FakeClient):
+    """Streams for a per-temperature duration, honoring the stop predicate."""
+
+    def __init__(self, durations):
+        super().__init__()
+        self.durations = durations
+        self.stopped = []
+
+    def ask(self, prompt, temperature=None, stop=None, **kwargs):
+        super().ask(prompt, temperature=temperature, stop=stop, **kwargs)
+        finish = time.monotonic() + self.durations[temperature]
+        text = ""
+        while time.monotonic() < finish:
+            text += "token "
+            if stop is not None and stop(text):
+                with self._lock:
+                    self.stopped.append(temperature)
+                return text
+            time.sleep(0.01)
+        return text
+
+
+class RecordingSink(EventSink):
+    def __init__(self):
+        self.events = []
+
+    def emit(self, event, **fields):
+        self.events.append((event, fields))
+
+
+def test_prefix_is_sent_with_the_question_by_default():
+    client = FakeClient()
+    candidates = DraftGenerator(client=client).generate("Q?", k=2, prefix="Passage.")
+
+    assert len(candidates) == 2
+    assert [prompt for prompt, _ in client.calls] == ["Passage.\n\nQ?"] * 2
+    assert all(kwargs["context"] is None for _, kwargs in client.calls)
+
+
+def test_prime_prefix_evaluates_the_prefix_once():
+    client = FakeClient()
+    generator = DraftGenerator(client=client, prime_prefix=True)
+
+    generator.generate("Q1?", k=2, prefix="Passage.")
+    generator.generate("Q2?", k=2, prefix="Passage.")
+
+    primes = [kwargs for prompt, kwargs in client.calls if prompt == "Passage."]
+    assert len(primes) == 1
+    assert primes[0]["cache"] is False
+    candidates = [(prompt, kwargs) for prompt, kwargs in client.calls if prompt != "Passage."]
+    assert sorted(prompt for prompt, _ in candidates) == ["Q1?", "Q1?", "Q2?", "Q2?"]
+    assert all(kwargs["context"] == [7, 8, 9] for _, kwargs in candidates)
+
+
+def test_failed_priming_falls_back_to_the_full_prompt():
+    client = FakeClient(context=())
+    DraftGenerator(client=client, prime_prefix=True).generate("Q?", k=1, prefix="Passage.")
+
+    assert client.calls[-1][0] == "Passage.\n\nQ?"
+
+
+def test_candidates_with_a_prefix_still_use_the_response_cache():
+    with MockOllamaServer(latency=0.0) as server:
+        client = OllamaClient(base_url=server.base_url, cache=ResponseCache())
+        generator = DraftGenerator(client=client, max_in_flight=1)
+
+        generator.generate("Q?", k=2, prefix="Passage.")
+        sent = server.requests
+        generator.generate("Q?", k=2, prefix="Passage.")
+
+        assert server.requests == sent
+        client.close()
+
+
+def test_token_budget_is_split_across_candidates():
+    client = FakeClient()
+    DraftGenerator(client=client).generate("Q?", k=3, token_budget=100)
+
+    assert [kwargs["max_tokens"] for _, kwargs in client.calls] == [33] * 3
+    with pytest.raises(ValueError):
+        DraftGenerator(client=client).generate("Q?", k=3, token_budget=2)
+
+
+def test_candidates_cut_by_max_tokens_are_marked_truncated():
+    with MockOllamaServer(latency=0.0) as server:
+        client = OllamaClient(base_url=server.base_url)
+        short = DraftGenerator(client=client).generate("Q?", k=2, token_budget=4)
+        full = DraftGenerator(client=client).generate("Q?", k=2)
+        client.close()
+
+    assert all(candidate["metadata"]["truncated"] for candidate in short)
+    assert not any(candidate["metadata"]["truncated"] for candidate in full)
+
+
+@pytest.mark.parametrize("max_in_flight", [1, 3])
+def test_generate_returns_finished_candidates_at_the_deadline(max_in_flight):
+    client = SlowClient({0.6: 0.05, 0.75: 0.05, 0.9: 5.0})
+    sink = RecordingSink()
+    generator = DraftGenerator(client=client, max_in_flight=max_in_flight, reporter=sink)
+
+    started = time.monotonic()
+    candidates = generator.generate("Q?", k=3, deadline=0.5)
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 1.0
+    assert [candidate["id"] for candidate in candidates] == [1, 2]
+    assert ("draft.candidate_cancelled", {"id": 3, "deadline": 0.5}) in sink.events
+
+    # The slow request sees the deadline and closes its stream
+    time.sleep(0.1)
+    assert client.stopped == [0.9]
+
+
+def test_iter_generate_stops_at_the_deadline():
+    client = SlowClient({0.6: 0.05, 0.9: 5.0})
+    generator = DraftGenerator(client=client, max_in_flight=2)
+
+    started = time.monotonic()
+    candidates = list(generator.iter_generate("Q?", k=2, deadline=0.5))
+
+    assert time.monotonic() - started < 1.0
+    assert [candidate["id"] for candidate in candidates] == [1]
+
+
+def test_requests_get_a_timeout_capped_by_the_deadline():
+    client = FakeClient()
+    DraftGenerator(client=client).generate("Q?", k=1, deadline=2.0)
+
+    _, kwargs = client.calls[0]
+    assert 0 < kwargs["timeout"] <= 2.0
+    assert kwargs["stop"] is not None
+
+
+def test_invalid_deadline():
+    with pytest.raises(ValueError):
+        DraftGenerator(client=FakeClient()).generate("Q?", k=1, deadline=0)
@@ -0,0 +1,63 @@
+"""Tests for answer normalization and matching."""
+
+import pytest
+
+from vpa.eval import AnswerMatcher, normalize_answer
+from vpa.eval.matcher import get_matcher
+
+
+def test_normalize_answer():
+    assert normalize_answer("The  Eiffel-Tower!") == "eiffel tower"
+    assert normalize_answer("Twenty two apples") == "20 2 apples"
+    assert normalize_answer("An apple, a pear") == "apple pear"
+
+
+def test_exact_match_after_normalization():
+    result = AnswerMatcher("Paris").match("paris.")
+    assert result["exact_match"]
+    assert result["f1"] == 1.0
+
+
+def test_acceptable_answer_anywhere_in_the_response():
+    matcher = AnswerMatcher("Paris", ["capital of France is Paris"])
+    result = matcher.match("Well, the capital of France is Paris, of course.")
+    assert result["accepted"]
+    assert not result["exact_match"]
+
+
+def test_gold_answer_alone_is_only_contained():
+    result = AnswerMatcher("Paris").match("I think it is Paris or Lyon")
+    assert result["contains_gold"]
+    assert not result["accepted"]
+
+
+def test_acceptable_answer_overlapping_the_gold_answer():
+    result = AnswerMatcher("New York", ["York City"]).match("It is in New York City.")
+    assert result["accepted"]
+    assert not result["contains_gold"]
+
+
+def test_matches_respect_word_boundaries():
+    result = AnswerMatcher("4").match("The answer is 42")
+    assert not result["contains_gold"]
+    assert not result["exact_match"]
+
+
+def test_number_words_match_digits():
+    matcher = AnswerMatcher("4", ["4"])
+    assert matcher.match("Four.")["exact_match"]
+    assert matcher.match("It is four.")["accepted"]
+
+
+def test_token_f1_partial_overlap():
+    result = AnswerMatcher("New York City").match("York City")
+    assert result["f1"] == pytest.approx(0.8)
+
+
+def test_empty_gold_and_response():
+    assert AnswerMatcher("").match("")["f1"] == 1.0
+    assert AnswerMatcher("Paris").match("")["f1"] == 0.0
+
+
+def test_get_matcher_reuses_compiled_matchers():
+    assert get_matcher("Paris", ["paris"]) is get_matcher("Paris", ("paris",))
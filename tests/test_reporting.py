@@ -0,0 +1,31 @@
+"""Tests for the event sinks."""
+
+import io
+import json
+
+from vpa.reporting import JsonlSink
+
+
+def test_jsonl_sink_logs_fields_as_they_were_when_emitted():
+    stream = io.StringIO()
+    sink = JsonlSink(stream, buffer_size=10)
+    checks = {"length": 0.8}
+
+    sink.emit("verify.candidate", id=1, score=0.8, checks=checks)
+    checks["consensus"] = 0.5
+    assert stream.getvalue() == ""
+    sink.close()
+
+    [record] = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert record["event"] == "verify.candidate"
+    assert record["checks"] == {"length": 0.8}
+
+
+def test_jsonl_sink_writes_when_the_buffer_fills(tmp_path):
+    path = tmp_path / "events.jsonl"
+    sink = JsonlSink(str(path), buffer_size=2)
+    sink.emit("a")
+    assert path.read_text() == ""
+    sink.emit("b", value=object())
+    assert [json.loads(line)["event"] for line in path.read_text().splitlines()] == ["a", "b"]
+    sink.close()
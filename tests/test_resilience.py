@@ -0,0 +1,181 @@
+"""Tests for the circuit breaker, retry policy, hedging and endpoint pool."""
+
+import time
+
+import pytest
+
+import ollama_client
+from ollama_client import CircuitBreaker, CircuitOpenError, EndpointPool, OllamaClient, RetryPolicy
+
+# Nothing listens on the discard port, so requests fail fast
+DEAD_URL = "http://127.0.0.1:9"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(ollama_client.time, "monotonic", fake.monotonic)
+    return fake
+
+
+def test_breaker_opens_after_threshold(clock):
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30)
+    breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "closed"
+    breaker.record_failure()
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        breaker.allow()
+
+
+def test_breaker_success_resets_failure_count(clock):
+    breaker = CircuitBreaker(failure_threshold=2)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == "closed"
+
+
+def test_breaker_half_open_trial(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+    breaker.record_failure()
+
+    clock.now += 30
+    breaker.allow()
+    assert breaker.state == "half_open"
+    # Only one trial request at a time
+    with pytest.raises(CircuitOpenError):
+        breaker.allow()
+
+    breaker.record_success()
+    assert breaker.state == "closed"
+    breaker.allow()
+
+
+def test_breaker_failed_trial_reopens(clock):
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30)
+    for _ in range(3):
+        breaker.record_failure()
+
+    clock.now += 30
+    breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        breaker.allow()
+
+
+def test_retry_delay_is_capped():
+    policy = RetryPolicy(max_retries=5, base_delay=1.0, max_delay=4.0)
+    assert all(0 <= policy.delay(attempt) <= 4.0 for attempt in range(10))
+    with pytest.raises(ValueError):
+        RetryPolicy(max_retries=-1)
+
+
+@pytest.mark.parametrize("call", [
+    lambda client: client.ask("x"),
+    lambda client: list(client.ask_stream("x"))
+])
+def test_circuit_rejections_are_counted_for_blocking_and_streaming(call):
+    client = OllamaClient(base_url=DEAD_URL, breaker=CircuitBreaker(failure_threshold=1))
+    client.breaker.record_failure()
+
+    with pytest.raises(CircuitOpenError):
+        call(client)
+    assert client.stats["circuit_rejections"] == 1
+
+
+def test_pool_least_outstanding_routing():
+    pool = EndpointPool(["a", "b", "c"], strategy="least")
+    picked = [pool.acquire() for _ in range(3)]
+    assert sorted(picked) == ["a", "b", "c"]
+
+    pool.release("b")
+    assert pool.acquire() == "b"
+
+
+def test_pool_p2c_prefers_less_loaded_endpoint():
+    pool = EndpointPool(["a", "b"], strategy="p2c")
+    first = pool.acquire()
+    assert pool.acquire() != first
+
+
+def test_pool_ejects_and_readmits_after_probe(clock):
+    pool = EndpointPool(["a", "b"], strategy="least", eject_seconds=30)
+    url = pool.acquire()
+    pool.release(url, failed=True)
+    other = "b" if url == "a" else "a"
+
+    assert pool.stats()[url]["healthy"] is False
+    assert all(pool.acquire() == other for _ in range(5))
+    assert pool.due_for_probe() == []
+
+    clock.now += 30
+    assert pool.due_for_probe() == [url]
+    # Already being probed
+    assert pool.due_for_probe() == []
+
+    pool.probed(url, healthy=False)
+    assert pool.stats()[url]["healthy"] is False
+    clock.now += 30
+    assert pool.due_for_probe() == [url]
+    pool.probed(url, healthy=True)
+    assert pool.stats()[url]["healthy"] is True
+
+
+def test_pool_with_every_endpoint_ejected_uses_the_oldest(clock):
+    pool = EndpointPool(["a", "b"], strategy="least")
+    pool.acquire()
+    pool.acquire()
+    pool.release("a", failed=True)
+    clock.now += 1
+    pool.release("b", failed=True)
+
+    assert pool.acquire() == "a"
+
+
+def test_pool_never_ejects_its_only_endpoint():
+    pool = EndpointPool(["a"])
+    pool.release(pool.acquire(), failed=True)
+    assert pool.stats()["a"]["healthy"] is True
+
+
+def test_pool_rejects_bad_configuration():
+    with pytest.raises(ValueError):
+        EndpointPool([])
+    with pytest.raises(ValueError):
+        EndpointPool(["a"], strategy="random")
+
+
+def test_hedged_attempts_fill_separate_info(monkeypatch):
+    client = OllamaClient(base_url=DEAD_URL, hedge=True, hedge_min_samples=1)
+    client._latencies.append(0.05)
+    calls = []
+
+    def request(payload, prompt, timeout, base_url=None, info=None):
+        calls.append(info)
+        if len(calls) == 1:
+            time.sleep(0.3)
+            info.update(context=[1], winner=False)
+            return "slow"
+        info.update(context=[2], winner=True)
+        return "fast"
+
+    monkeypatch.setattr(client, "_request_generate", request)
+    info = {}
+
+    assert client.ask("x", info=info) == "fast"
+    time.sleep(0.4)
+
+    assert info == {"context": [2], "winner": True}
+    assert calls[0] is not calls[1]
+    client.close()
@@ -0,0 +1,129 @@
+"""Tests for the resumable EvaluationRunner and its JSONL checkpoint."""
+
+import json
+import threading
+
+import pytest
+
+from vpa.eval.runner import EvaluationRunner, iter_checkpoint
+
+ANSWERS = {"Capital of France?": "Paris", "Capital of Italy?": "Rome", "Capital of Spain?": "Madrid"}
+
+
+def dataset():
+    return [{"id": f"q{i}", "question": question, "answer": answer}
+            for i, (question, answer) in enumerate(ANSWERS.items())]
+
+
+class Generator:
+    """Answers from ANSWERS, recording (and optionally failing) questions."""
+
+    def __init__(self, fail=()):
+        self.fail = set(fail)
+        self.questions = []
+        self._lock = threading.Lock()
+
+    def __call__(self, question, k):
+        with self._lock:
+            self.questions.append(question)
+        if question in self.fail:
+            raise RuntimeError("model unavailable")
+        return [{"id": 1, "text": ANSWERS[question]}]
+
+
+def read_ids(path):
+    return [record["id"] for record in iter_checkpoint(str(path))]
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_run_checkpoints_every_item(tmp_path, workers):
+    path = tmp_path / "runs" / "qa.jsonl"
+    metrics = EvaluationRunner(Generator(), str(path), workers=workers).run(dataset(), k=1)
+
+    assert sorted(read_ids(path)) == ["q0", "q1", "q2"]
+    assert (metrics["total"], metrics["correct"]) == (3, 3)
+    record = json.loads(path.read_text().splitlines()[0])
+    assert record["test_set"] == "qa"
+    assert record["correct"]
+
+
+def test_resume_skips_finished_items(tmp_path):
+    path = tmp_path / "qa.jsonl"
+    first = Generator(fail={"Capital of Italy?"})
+    metrics = EvaluationRunner(first, str(path)).run(dataset(), k=1)
+
+    assert metrics["total"] == 2
+    assert "q1" not in read_ids(path)
+
+    second = Generator()
+    metrics = EvaluationRunner(second, str(path)).run(dataset(), k=1)
+
+    assert second.questions == ["Capital of Italy?"]
+    assert sorted(read_ids(path)) == ["q0", "q1", "q2"]
+    assert metrics["total"] == 3
+
+    third = Generator()
+    EvaluationRunner(third, str(path)).run(dataset(), k=1)
+    assert third.questions == []
+
+
+def test_items_without_ids_are_keyed_by_position(tmp_path):
+    path = tmp_path / "qa.jsonl"
+    items = [{"question": question, "answer": answer} for question, answer in ANSWERS.items()]
+    EvaluationRunner(Generator(), str(path)).run(items[:2], k=1)
+
+    generator = Generator()
+    EvaluationRunner(generator, str(path)).run(items, k=1)
+
+    assert generator.questions == ["Capital of Spain?"]
+    assert sorted(read_ids(path)) == ["0", "1", "2"]
+
+
+def test_truncated_checkpoint_line_is_skipped_and_retried(tmp_path):
+    path = tmp_path / "qa.jsonl"
+    EvaluationRunner(Generator(), str(path)).run(dataset()[:2], k=1)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"id": "q2", "correct": tr')
+
+    assert read_ids(path) == ["q0", "q1"]
+
+    generator = Generator()
+    metrics = EvaluationRunner(generator, str(path)).run(dataset(), k=1)
+    assert generator.questions == ["Capital of Spain?"]
+    assert metrics["total"] == 3
+
+
+def test_dataset_is_consumed_lazily(tmp_path):
+    consumed = []
+    release = threading.Event()
+
+    def items():
+        for index in range(10):
+            consumed.append(index)
+            yield {"id": str(index), "question": "Capital of France?", "answer": "Paris"}
+
+    def generate(question, k):
+        release.wait(5)
+        return [{"id": 1, "text": "Paris"}]
+
+    runner = EvaluationRunner(generate, str(tmp_path / "qa.jsonl"), workers=1)
+    thread = threading.Thread(target=runner.run, args=(items(),), kwargs={"k": 1})
+    thread.start()
+    try:
+        # At most 2 * workers items are in flight before one finishes
+        thread.join(0.3)
+        assert len(consumed) == 3
+    finally:
+        release.set()
+        thread.join()
+
+    assert len(read_ids(tmp_path / "qa.jsonl")) == 10
+
+
+def test_iter_checkpoint_missing_file(tmp_path):
+    assert list(iter_checkpoint(str(tmp_path / "missing.jsonl"))) == []
+
+
+def test_invalid_workers(tmp_path):
+    with pytest.raises(ValueError):
+        EvaluationRunner(Generator(), str(tmp_path / "qa.jsonl"), workers=0)
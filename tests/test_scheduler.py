@@ -0,0 +1,133 @@
+"""Tests for dataset-level drafting with DraftScheduler."""
+
+import threading
+import time
+
+import pytest
+
+from vpa.draft.generator import DraftGenerator
+from vpa.draft.scheduler import DraftScheduler
+from vpa.eval.runner import EvaluationRunner, iter_checkpoint
+
+
+class ConcurrencyClient:
+    """Answers after a short delay, tracking how many requests overlap."""
+
+    model = "fake"
+    base_url = "http://fake"
+    base_urls = ["http://fake"]
+
+    def __init__(self, delay=0.05, fail=()):
+        self.delay = delay
+        self.fail = set(fail)
+        self.in_flight = 0
+        self.peak = 0
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def ask(self, prompt, temperature=None, **kwargs):
+        with self._lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+            self.calls.append((prompt, temperature))
+        try:
+            time.sleep(self.delay)
+            if (prompt, temperature) in self.fail:
+                raise RuntimeError("model error")
+            return f"Answer to {prompt}"
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+def scheduler(client, max_outstanding):
+    return DraftScheduler(DraftGenerator(client=client, max_in_flight=1), max_outstanding=max_outstanding)
+
+
+def test_every_item_gets_k_candidates():
+    client = ConcurrencyClient()
+    items = [{"id": i, "question": f"Q{i}?"} for i in range(5)]
+
+    results = list(scheduler(client, 4).run(items, k=3))
+
+    assert sorted(item["id"] for item, _ in results) == list(range(5))
+    for item, candidates in results:
+        assert [candidate["id"] for candidate in candidates] == [1, 2, 3]
+        assert all(candidate["text"] == f"Answer to {item['question']}" for candidate in candidates)
+
+
+def test_requests_overlap_across_questions_up_to_the_limit():
+    client = ConcurrencyClient()
+
+    list(scheduler(client, 6).run([f"Q{i}?" for i in range(6)], k=2))
+
+    # k=2 per question, so reaching 6 means three questions were drafted at once
+    assert client.peak == 6
+    assert len(client.calls) == 12
+
+
+def test_max_outstanding_caps_concurrency():
+    client = ConcurrencyClient(delay=0.02)
+
+    list(scheduler(client, 2).run([f"Q{i}?" for i in range(4)], k=3))
+
+    assert client.peak == 2
+
+
+def test_items_are_read_lazily():
+    client = ConcurrencyClient()
+    read = []
+
+    def items():
+        for i in range(100):
+            read.append(i)
+            yield f"Q{i}?"
+
+    runs = scheduler(client, 4).run(items(), k=2)
+    next(runs)
+    runs.close()
+
+    assert len(read) <= 4
+
+
+def test_temperatures_follow_the_generator():
+    client = ConcurrencyClient(delay=0.0)
+    generator = DraftGenerator(client=client)
+
+    [(_, candidates)] = DraftScheduler(generator, max_outstanding=3).run(["Q?"], k=3, temperature_range=(0.2, 0.8))
+
+    assert [candidate["temperature"] for candidate in candidates] == [
+        generator.candidate_temperature(i, 3, (0.2, 0.8)) for i in range(3)
+    ]
+
+
+def test_failed_candidates_are_left_out():
+    client = ConcurrencyClient(delay=0.0, fail={("Q?", 0.75)})
+
+    [(_, candidates)] = scheduler(client, 3).run(["Q?"], k=3)
+
+    assert [candidate["id"] for candidate in candidates] == [1, 3]
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        DraftScheduler(DraftGenerator(client=ConcurrencyClient()), max_outstanding=0)
+    with pytest.raises(ValueError):
+        list(scheduler(ConcurrencyClient(), 2).run(["Q?"], k=0))
+
+
+def test_run_scheduled_checkpoints_and_resumes(tmp_path):
+    path = str(tmp_path / "qa.jsonl")
+    items = [{"id": f"q{i}", "question": f"Q{i}?", "answer": f"Q{i}?"} for i in range(4)]
+
+    client = ConcurrencyClient(delay=0.0)
+    runner = EvaluationRunner(lambda question, k: [], path)
+    runner.run_scheduled(items[:2], scheduler(client, 4), lambda candidates: candidates, k=2)
+    assert len(client.calls) == 4
+
+    client = ConcurrencyClient(delay=0.0)
+    metrics = runner.run_scheduled(items, scheduler(client, 4), lambda candidates: candidates, k=2)
+
+    assert sorted({prompt for prompt, _ in client.calls}) == ["Q2?", "Q3?"]
+    assert sorted(record["id"] for record in iter_checkpoint(path)) == ["q0", "q1", "q2", "q3"]
+    assert metrics["total"] == 4
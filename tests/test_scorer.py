@@ -0,0 +1,34 @@
+"""Tests for the pass@k estimator."""
+
+import math
+
+import pytest
+
+from vpa.eval import pass_at_k
+
+
+def reference_pass_at_k(n, c, k):
+    """1 - C(n - c, k) / C(n, k), exactly."""
+    if k > n:
+        return 1.0 if c > 0 else 0.0
+    return 1.0 - math.comb(n - c, k) / math.comb(n, k)
+
+
+@pytest.mark.parametrize("n", range(1, 11))
+def test_pass_at_k_matches_the_closed_form(n):
+    for c in range(n + 1):
+        for k in range(1, n + 3):
+            assert pass_at_k(n, c, k) == pytest.approx(reference_pass_at_k(n, c, k))
+
+
+def test_pass_at_k_edge_cases():
+    assert pass_at_k(5, 0, 1) == 0.0
+    assert pass_at_k(5, 5, 1) == 1.0
+    assert pass_at_k(5, 1, 1) == pytest.approx(0.2)
+    assert pass_at_k(3, 1, 10) == 1.0
+    assert pass_at_k(0, 0, 1) == 0.0
+
+
+def test_pass_at_k_rejects_zero_k():
+    with pytest.raises(ValueError):
+        pass_at_k(5, 1, 0)
@@ -0,0 +1,92 @@
+"""Tests for request validation in vpa.server."""
+
+import http.client
+import json
+import socket
+
+import pytest
+
+from vpa.server import PipelineServer, PipelineService, RequestError
+
+
+@pytest.fixture
+def server():
+    # No Ollama is needed: every request here fails validation or only verifies
+    service = PipelineService(base_url="http://127.0.0.1:9", code_workers=0, max_batch=2)
+    with PipelineServer(service, port=0) as server:
+        yield server
+
+
+def post(server, path, body):
+    host, port = server._server.server_address[:2]
+    connection = http.client.HTTPConnection(host, port, timeout=10)
+    connection.request("POST", path, json.dumps(body))
+    response = connection.getresponse()
+    result = response.status, json.loads(response.read())
+    connection.close()
+    return result
+
+
+def raw_status(server, content_length):
+    host, port = server._server.server_address[:2]
+    with socket.create_connection((host, port), timeout=10) as connection:
+        connection.sendall(
+            b"POST /verify HTTP/1.1\r\nHost: test\r\nContent-Length: " + content_length + b"\r\n\r\n"
+        )
+        return connection.recv(4096).split(b"\r\n", 1)[0]
+
+
+@pytest.mark.parametrize("content_length", [b"abc", b"-1"])
+def test_invalid_content_length_is_rejected(server, content_length):
+    assert raw_status(server, content_length) == b"HTTP/1.1 400 Bad Request"
+
+
+def test_batch_size_is_limited(server):
+    status, body = post(server, "/batch", {"items": [{"question": "q"}] * 3})
+    assert status == 413
+    assert "at most 2" in body["error"]
+
+
+def test_tests_must_be_a_list_of_strings(server):
+    status, _ = post(server, "/verify", {"candidates": ["A full answer."], "tests": "assert 1"})
+    assert status == 400
+
+
+def test_candidates_must_be_strings_or_objects_with_text(server):
+    status, _ = post(server, "/verify", {"candidates": [5]})
+    assert status == 400
+    status, _ = post(server, "/verify", {"candidates": [{"id": 1}]})
+    assert status == 400
+
+
+def test_verify_accepts_plain_strings(server):
+    status, body = post(server, "/verify", {"candidates": ["Paris is the capital of France."]})
+    assert status == 200
+    assert body["candidates"][0]["rank"] == 1
+
+
+def test_default_token_budget_is_raised_to_k():
+    service = PipelineService(base_url="http://127.0.0.1:9", code_workers=0, token_budget=2)
+    try:
+        assert service._budget({}, 4)["token_budget"] == 4
+        assert service._budget({"token_budget": 8}, 4)["token_budget"] == 8
+        with pytest.raises(RequestError):
+            service._budget({"token_budget": 2}, 4)
+    finally:
+        service.close()
+
+
+def test_invalid_default_budget_is_rejected_at_startup():
+    with pytest.raises(ValueError):
+        PipelineService(base_url="http://127.0.0.1:9", code_workers=0, token_budget=0)
+
+
+@pytest.mark.parametrize("k", [True, False, 0, 2.0, "3"])
+def test_k_must_be_an_integer_in_range(k):
+    service = PipelineService(base_url="http://127.0.0.1:9", code_workers=0)
+    try:
+        assert service._question_and_k({"question": "q", "k": 2}) == ("q", 2)
+        with pytest.raises(RequestError):
+            service._question_and_k({"question": "q", "k": k})
+    finally:
+        service.close()
@@ -0,0 +1,156 @@
+"""Tests for NDJSON streaming in OllamaClient against a mocked response."""
+
+import json
+
+import pytest
+
+from ollama_client import OllamaClient, char_budget
+from vpa.cache import ResponseCache
+from vpa.tracing import Tracer
+
+DONE = {"done": True, "done_reason": "stop", "eval_count": 3, "eval_duration": 30_000_000,
+        "prompt_eval_count": 5, "prompt_eval_duration": 10_000_000, "context": [1, 2]}
+
+
+class FakeStreamResponse:
+    """A streaming response yielding NDJSON lines and recording how far it was read."""
+
+    def __init__(self, chunks):
+        self.lines = [json.dumps(chunk).encode() if isinstance(chunk, dict) else chunk for chunk in chunks]
+        self.read = 0
+        self.closed = False
+
+    def raise_for_status(self):
+        pass
+
+    def iter_lines(self):
+        for line in self.lines:
+            self.read += 1
+            yield line
+
+    def close(self):
+        self.closed = True
+
+
+def generate_chunks(*pieces):
+    return [{"response": piece, "done": False} for piece in pieces] + [dict(DONE, response="")]
+
+
+@pytest.fixture
+def client():
+    client = OllamaClient(base_url="http://ollama.test")
+    yield client
+    client.close()
+
+
+def mock_post(monkeypatch, client, *responses):
+    """Serve the given responses in order, recording each request."""
+    requests = []
+    queue = list(responses)
+
+    def post(url, json=None, timeout=None, stream=False):
+        requests.append({"url": url, "json": json, "stream": stream})
+        return queue.pop(0)
+
+    monkeypatch.setattr(client.session, "post", post)
+    return requests
+
+
+def test_stream_yields_chunks_and_fills_info(monkeypatch, client):
+    response = FakeStreamResponse(generate_chunks("Hel", "lo", "!"))
+    requests = mock_post(monkeypatch, client, response)
+    info = {}
+
+    assert list(client.ask_stream("Hi", info=info)) == ["Hel", "lo", "!"]
+
+    assert requests[0]["url"] == "http://ollama.test/api/generate"
+    assert requests[0]["stream"] and requests[0]["json"]["stream"]
+    assert info["eval_count"] == 3
+    assert info["context"] == [1, 2]
+    assert response.closed
+
+
+def test_blank_lines_are_skipped(monkeypatch, client):
+    mock_post(monkeypatch, client, FakeStreamResponse([b"", {"response": "a"}, b"", dict(DONE, response="")]))
+
+    assert list(client.ask_stream("Hi")) == ["a"]
+
+
+def test_stop_predicate_closes_the_connection_early(monkeypatch, client):
+    response = FakeStreamResponse(generate_chunks("abc", "def", "ghi", "jkl"))
+    mock_post(monkeypatch, client, response)
+    info = {}
+
+    assert list(client.ask_stream("Hi", stop=char_budget(5), info=info)) == ["abc", "def"]
+
+    assert response.read == 2
+    assert response.closed
+    assert info == {}
+
+
+def test_abandoned_stream_closes_the_connection(monkeypatch, client):
+    response = FakeStreamResponse(generate_chunks("a", "b", "c"))
+    mock_post(monkeypatch, client, response)
+
+    stream = client.ask_stream("Hi")
+    assert next(stream) == "a"
+    stream.close()
+
+    assert response.closed
+    assert response.read == 1
+
+
+def test_done_statistics_reach_the_tracer(monkeypatch):
+    tracer = Tracer()
+    client = OllamaClient(base_url="http://ollama.test", tracer=tracer)
+    mock_post(monkeypatch, client, FakeStreamResponse(generate_chunks("a")))
+
+    list(client.ask_stream("Hi"))
+
+    assert (tracer.ollama_responses, tracer.eval_tokens, tracer.prompt_eval_tokens) == (1, 3, 5)
+    client.close()
+
+
+def test_error_chunk_raises(monkeypatch, client):
+    response = FakeStreamResponse([{"response": "a"}, {"error": "model not found"}])
+    mock_post(monkeypatch, client, response)
+
+    with pytest.raises(RuntimeError, match="model not found"):
+        list(client.ask_stream("Hi"))
+    assert response.closed
+
+
+def test_malformed_line_raises(monkeypatch, client):
+    mock_post(monkeypatch, client, FakeStreamResponse([b"{not json"]))
+
+    with pytest.raises(RuntimeError, match="malformed stream data"):
+        list(client.ask_stream("Hi"))
+
+
+def test_chat_stream_extracts_message_content(monkeypatch, client):
+    chunks = [{"message": {"role": "assistant", "content": piece}} for piece in ("Hi", " there")]
+    requests = mock_post(monkeypatch, client, FakeStreamResponse(chunks + [dict(DONE, message={})]))
+
+    assert "".join(client.chat_stream([{"role": "user", "content": "Hello"}])) == "Hi there"
+    assert requests[0]["url"] == "http://ollama.test/api/chat"
+
+
+def test_ask_with_stop_streams_and_skips_the_cache(monkeypatch):
+    client = OllamaClient(base_url="http://ollama.test", cache=ResponseCache())
+    requests = mock_post(
+        monkeypatch, client,
+        FakeStreamResponse(generate_chunks("abc", "def")),
+        FakeStreamResponse(generate_chunks("abc", "def"))
+    )
+
+    assert client.ask("Hi", stop=char_budget(3)) == "abc"
+    assert client.ask("Hi", stop=char_budget(3)) == "abc"
+    assert len(requests) == 2
+    client.close()
+
+
+def test_empty_stream_is_an_error(monkeypatch, client):
+    mock_post(monkeypatch, client, FakeStreamResponse([dict(DONE, response="")]))
+
+    with pytest.raises(RuntimeError, match="empty response"):
+        client.ask("Hi", stream=True)
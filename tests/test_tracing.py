@@ -0,0 +1,131 @@
+"""Tests for the tracer's spans, Ollama timings and exports."""
+
+import json
+import re
+import threading
+import time
+
+import pytest
+
+from vpa.tracing import Histogram, NullTracer, Tracer, resolve_tracer
+
+SAMPLE_LINE = re.compile(r'^[a-zA-Z_:][a-zA-Z0-9_:]*(\{([a-zA-Z_][a-zA-Z0-9_]*="[^"]*",?)*\})? \S+$')
+
+RESPONSE = {"total_duration": 3_000_000_000, "load_duration": 500_000_000,
+            "prompt_eval_duration": 500_000_000, "eval_duration": 2_000_000_000,
+            "eval_count": 100, "prompt_eval_count": 20}
+
+
+def test_nested_spans_are_recorded_separately():
+    tracer = Tracer()
+    with tracer.span("outer"):
+        for _ in range(2):
+            with tracer.span("inner"):
+                time.sleep(0.01)
+
+    spans = tracer.to_dict()["spans"]
+    assert spans["outer"]["count"] == 1
+    assert spans["inner"]["count"] == 2
+    assert spans["outer"]["sum"] >= spans["inner"]["sum"] >= 0.02
+
+
+def test_span_is_recorded_when_the_block_raises():
+    tracer = Tracer()
+    with pytest.raises(ValueError):
+        with tracer.span("failing"):
+            raise ValueError
+
+    assert tracer.to_dict()["spans"]["failing"]["count"] == 1
+
+
+def test_spans_from_several_threads():
+    tracer = Tracer()
+
+    def work():
+        for _ in range(100):
+            with tracer.span("work"):
+                pass
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert tracer.to_dict()["spans"]["work"]["count"] == 400
+
+
+def test_ollama_timings():
+    tracer = Tracer()
+    tracer.observe_ollama(RESPONSE)
+    tracer.observe_ollama({"eval_count": 10})
+
+    ollama = tracer.to_dict()["ollama"]
+    assert (ollama["responses"], ollama["eval_tokens"], ollama["prompt_eval_tokens"]) == (2, 110, 20)
+    assert ollama["durations"]["eval"]["sum"] == pytest.approx(2.0)
+    assert ollama["tokens_per_second"]["count"] == 1
+    assert ollama["overall_tokens_per_second"] == pytest.approx(55.0)
+
+
+def test_prometheus_export_format():
+    tracer = Tracer()
+    tracer.record("verify.length", 0.5)
+    tracer.observe_ollama(RESPONSE)
+
+    text = tracer.to_prometheus()
+    lines = text.splitlines()
+
+    assert text.endswith("\n")
+    assert 'vpa_span_duration_seconds{span="verify.length",quantile="0.5"} 0.5' in lines
+    assert 'vpa_span_duration_seconds_sum{span="verify.length"} 0.5' in lines
+    assert 'vpa_span_duration_seconds_count{span="verify.length"} 1' in lines
+    assert 'vpa_ollama_duration_seconds_count{phase="eval"} 1' in lines
+    assert 'vpa_ollama_tokens_per_second{quantile="0.99"} 50.0' in lines
+    assert "vpa_ollama_tokens_per_second_count 1" in lines
+    assert "vpa_ollama_eval_tokens_total 100" in lines
+
+    families = {}
+    for line in lines:
+        if line.startswith("# TYPE "):
+            _, _, name, kind = line.split()
+            families[name] = kind
+        elif line.startswith("# HELP "):
+            assert line.split()[2] not in families
+        else:
+            assert SAMPLE_LINE.match(line), line
+            float(line.rsplit(" ", 1)[1])
+            name = re.split(r"[{ ]", line)[0]
+            family = re.sub(r"_(sum|count)$", "", name) if name not in families else name
+            assert family in families, line
+
+    assert families["vpa_span_duration_seconds"] == "summary"
+    assert families["vpa_ollama_responses_total"] == "counter"
+
+
+def test_prometheus_prefix_and_empty_tracer():
+    lines = Tracer().to_prometheus(prefix="app").splitlines()
+
+    assert "app_ollama_responses_total 0" in lines
+    assert not any(line.startswith("app_span_duration_seconds") for line in lines)
+
+
+def test_json_export_round_trips():
+    tracer = Tracer()
+    tracer.record("draft.candidate", 1.0)
+    assert json.loads(tracer.to_json())["spans"]["draft.candidate"]["p95"] == 1.0
+
+
+def test_histogram_keeps_exact_totals_beyond_the_sample_cap():
+    histogram = Histogram(max_samples=10)
+    for value in range(1, 101):
+        histogram.observe(float(value))
+
+    summary = histogram.summary()
+    assert (summary["count"], summary["sum"], summary["min"], summary["max"]) == (100, 5050.0, 1.0, 100.0)
+    assert len(histogram._samples) == 10
+
+
+def test_resolve_tracer():
+    tracer = Tracer()
+    assert resolve_tracer(tracer) is tracer
+    assert isinstance(resolve_tracer(None), NullTracer)
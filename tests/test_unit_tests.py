@@ -0,0 +1,75 @@
+"""Tests for the unit test harness and UnitTestVerifier.run_tests."""
+
+import pytest
+
+from vpa.verify.code_executor import CodeExecutor
+from vpa.verify.unit_tests import UnitTestVerifier
+
+ADD = "```python\ndef add(a, b):\n    return a + b\n```"
+TESTS = ["assert add(1, 2) == 3", "assert add(-1, 1) == 0"]
+
+
+@pytest.fixture(scope="module")
+def verifier():
+    return UnitTestVerifier(CodeExecutor(timeout=2))
+
+
+def test_passing_candidate(verifier):
+    [report] = verifier.run_tests([ADD], TESTS)
+
+    assert (report["passed"], report["total"], report["all_passed"], report["error"]) == (2, 2, True, "")
+    assert [result["test"] for result in report["results"]] == TESTS
+
+
+def test_failing_tests_are_reported_per_test(verifier):
+    wrong = "def add(a, b):\n    print('debug')\n    return a - b"
+    [report] = verifier.run_tests([wrong], TESTS + ["assert add(0, 0) == 0"])
+
+    assert report["passed"] == 1
+    assert not report["all_passed"]
+    assert [result["passed"] for result in report["results"]] == [False, False, True]
+    assert report["results"][0]["error"].startswith("AssertionError")
+
+
+def test_stop_on_failure(verifier):
+    [report] = verifier.run_tests(["def add(a, b):\n    return 0"], TESTS, stop_on_failure=True)
+
+    assert report["passed"] == 0
+    assert len(report["results"]) == 1
+
+
+def test_candidate_that_fails_to_load(verifier):
+    [broken, missing] = verifier.run_tests(["def add(a, b) return a", "x = 1"], TESTS)
+
+    assert broken["error"].startswith("SyntaxError")
+    assert broken["results"] == []
+    assert not broken["all_passed"]
+    assert missing["results"][0]["error"].startswith("NameError")
+
+
+def test_setup_runs_before_the_candidate(verifier):
+    [report] = verifier.run_tests(["def add(a, b):\n    return OFFSET + a + b"], TESTS, setup="OFFSET = 0")
+
+    assert report["all_passed"]
+
+
+def test_timeout(verifier):
+    [report] = verifier.run_tests(["def add(a, b):\n    while True:\n        pass"], TESTS)
+
+    assert report["passed"] == 0
+    assert "timed out" in report["error"]
+
+
+def test_report_longer_than_the_output_cap():
+    tests = [f"assert False, {'x' * 600!r}"] * 150
+    [report] = UnitTestVerifier().run_tests([ADD], tests)
+
+    assert report["passed"] == 0
+    assert not report["all_passed"]
+    assert report["error"] == "Test harness report exceeded the output limit"
+
+
+def test_reports_follow_candidate_order(verifier):
+    reports = verifier.run_tests([ADD, "def add(a, b):\n    return 1", ADD], TESTS)
+
+    assert [report["passed"] for report in reports] == [2, 0, 2]
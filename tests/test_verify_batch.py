@@ -0,0 +1,55 @@
+"""verify_batch must score texts exactly like verify."""
+
+import random
+
+import pytest
+
+from vpa.verify.checker import HEURISTIC_CHECKS, SimpleVerifier
+
+np = pytest.importorskip("numpy")
+
+WORDS = ["the", "model", "answer", "is", "Paris", "because", "water", "boils", "at", "100", "degrees"]
+ENDINGS = ["", ".", "!", "?", "...", "!!!!!!", "\n\n\n", " and so on"]
+
+
+def random_text(rng):
+    words = [rng.choice(WORDS) for _ in range(rng.randint(0, 120))]
+    if words and rng.random() < 0.5:
+        words[0] = words[0].capitalize()
+    text = " ".join(words)
+    for _ in range(rng.randint(0, 3)):
+        text += rng.choice(ENDINGS) + " " + " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 8)))
+    return text + rng.choice(ENDINGS)
+
+
+@pytest.fixture(scope="module")
+def verifier():
+    verifier = SimpleVerifier(code_workers=0)
+    yield verifier
+    verifier.executor.close()
+
+
+def test_verify_batch_matches_verify(verifier):
+    rng = random.Random(0)
+    texts = [random_text(rng) for _ in range(200)] + ["word word word word word word", "Short."]
+
+    batch = verifier.verify_batch(texts)
+
+    for i, text in enumerate(texts):
+        if not text.strip():
+            assert not batch["valid"][i]
+            continue
+        single = verifier.verify([{"id": i, "text": text}])[0]
+        for name in HEURISTIC_CHECKS:
+            assert batch[name][i] == pytest.approx(single["checks"][name]), (name, text)
+        assert batch["score"][i] == pytest.approx(single["score"])
+
+
+def test_verify_batch_ranks_within_groups(verifier):
+    texts = ["Short.", "A much longer and complete answer. It has two sentences.", "ok", "Fine answer here."]
+    batch = verifier.verify_batch(texts, group_ids=["a", "a", "b", "b"])
+
+    assert sorted(batch["rank"][:2]) == [1, 2]
+    assert sorted(batch["rank"][2:]) == [1, 2]
+    assert batch["rank"][1] == 1
+    assert list(batch["order"][:2]) == [1, 0]
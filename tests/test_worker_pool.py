@@ -0,0 +1,117 @@
+"""Tests for the warm WorkerPool behind CodeExecutor(pool_size=...)."""
+
+import threading
+import time
+
+import pytest
+
+from vpa.verify.code_executor import CodeExecutor, WorkerPool
+
+PID = "import os\nprint(os.getpid())"
+
+
+@pytest.fixture
+def pool():
+    pool = WorkerPool(1, timeout=5)
+    yield pool
+    pool.close()
+
+
+def pid(pool):
+    return int(pool.run(PID)["output"])
+
+
+def test_worker_is_reused(pool):
+    assert pid(pool) == pid(pool)
+
+
+def test_namespace_is_fresh_for_each_run(pool):
+    assert pool.run("x = 41")["success"]
+    result = pool.run("print(x + 1)")
+
+    assert not result["success"]
+    assert "NameError" in result["error"]
+
+
+def test_interpreter_state_is_restored_between_runs(pool):
+    pool.run("import os, sys\nos.chdir('/')\nsys.path.insert(0, '/nowhere')\nsys.argv[:] = ['changed']")
+    result = pool.run("import os, sys\nprint(os.getcwd() != '/', '/nowhere' in sys.path, sys.argv != ['changed'])")
+
+    assert result["output"] == "True False True\n"
+
+
+def test_hung_worker_is_replaced(pool):
+    before = pid(pool)
+    started = time.monotonic()
+    result = pool.run("while True:\n    pass", timeout=0.5)
+
+    assert time.monotonic() - started < 3
+    assert result == {"success": False, "output": "", "error": "Execution timed out after 0.5 seconds"}
+    assert pid(pool) != before
+
+
+def test_killed_worker_is_replaced(pool):
+    before = pid(pool)
+    result = pool.run("import os\nos._exit(1)")
+
+    assert not result["success"]
+    assert result["error"] == "Process failed to return result"
+    assert pid(pool) != before
+
+
+def test_exit_is_reported_and_the_worker_kept(pool):
+    before = pid(pool)
+    result = pool.run("raise SystemExit(3)")
+
+    assert not result["success"]
+    assert result["error"].startswith("Code called exit()")
+    assert pid(pool) == before
+
+
+def test_worker_is_recycled_after_max_jobs():
+    pool = WorkerPool(1, max_jobs=2)
+    try:
+        first, second, third = pid(pool), pid(pool), pid(pool)
+    finally:
+        pool.close()
+
+    assert first == second
+    assert third != first
+
+
+def test_concurrent_runs_use_every_worker():
+    pool = WorkerPool(2)
+    results = []
+    code = "import os, time\ntime.sleep(0.5)\nprint(os.getpid())"
+    try:
+        threads = [threading.Thread(target=lambda: results.append(pool.run(code))) for _ in range(2)]
+        started = time.monotonic()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.monotonic() - started
+    finally:
+        pool.close()
+
+    assert elapsed < 0.9
+    assert len({result["output"] for result in results}) == 2
+
+
+def test_closed_pool_rejects_runs():
+    pool = WorkerPool(1)
+    pool.close()
+
+    with pytest.raises(RuntimeError):
+        pool.run("print(1)")
+    with pytest.raises(ValueError):
+        WorkerPool(0)
+
+
+def test_executor_uses_the_pool_and_closes_it():
+    executor = CodeExecutor(pool_size=1)
+    assert executor.execute_code("print('hi')")["output"] == "hi\n"
+    assert executor._pool is not None
+
+    executor.close()
+    assert executor._pool is None
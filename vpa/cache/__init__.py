@@ -0,0 +1,7 @@
+"""Caching module."""
+
+from .store import LRUCache, SQLiteStore, TieredCache
+from .response import ResponseCache
+from .verification import VerificationCache
+
+__all__ = ['LRUCache', 'SQLiteStore', 'TieredCache', 'ResponseCache', 'VerificationCache']
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Response Cache - Content-addressed cache for Ollama responses.
+
+Usage:
+    from ollama_client import OllamaClient
+    from vpa.cache import ResponseCache
+
+    cache = ResponseCache(path=".vpa_cache/responses.sqlite")
+    client = OllamaClient(cache=cache)
+    generator = DraftGenerator(client=client)
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, Optional
+
+from .store import TieredCache
+
+POLICIES = ("all", "deterministic")
+
+
+class ResponseCache(TieredCache):
+    """
+    Caches model responses keyed by a hash of the full request payload.
+
+    Policies:
+        "all": cache every response (replays sampled answers on reruns)
+        "deterministic": cache only requests with temperature 0 or a seed
+    """
+
+    def __init__(
+        self,
+        memory_size: int = 1024,
+        path: Optional[str] = None,
+        max_disk_bytes: int = 256 * 1024 * 1024,
+        policy: str = "all"
+    ):
+        """
+        Initialize the response cache.
+
+        Args:
+            memory_size: Maximum responses in the in-memory LRU tier
+            path: SQLite file for the persistent tier (None = memory only)
+            max_disk_bytes: Size budget for the persistent tier
+            policy: "all" or "deterministic"
+        """
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown cache policy: {policy}")
+
+        super().__init__(memory_size, path, max_disk_bytes)
+        self.policy = policy
+
+    @staticmethod
+    def key(endpoint: str, payload: Dict[str, Any]) -> str:
+        """
+        Hash an API endpoint and request payload.
+
+        The 'stream' flag and 'keep_alive' hint do not change the response
+        text, so they are excluded from the key.
+        """
+        material = {k: v for k, v in payload.items() if k not in ("stream", "keep_alive")}
+        material["endpoint"] = endpoint
+        encoded = json.dumps(material, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def cacheable(self, payload: Dict[str, Any]) -> bool:
+        """Check whether the policy allows caching this payload."""
+        if self.policy == "all":
+            return True
+
+        options = payload.get("options", {})
+        return options.get("temperature") == 0 or options.get("seed") is not None
+
+    def lookup(self, endpoint: str, payload: Dict[str, Any]) -> Optional[str]:
+        """
+        Get a cached response for a request.
+
+        Returns:
+            Cached response text, or None on a miss or uncacheable payload
+        """
+        if not self.cacheable(payload):
+            return None
+        return self.get(self.key(endpoint, payload))
+
+    def store(self, endpoint: str, payload: Dict[str, Any], response: str) -> None:
+        """Cache a response if the policy allows it."""
+        if self.cacheable(payload):
+            self.put(self.key(endpoint, payload), response)
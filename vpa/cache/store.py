@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Cache Stores - In-memory LRU and on-disk SQLite tiers.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+class LRUCache:
+    """Thread-safe in-memory LRU cache."""
+
+    def __init__(self, maxsize: int = 1024):
+        """
+        Initialize the LRU cache.
+
+        Args:
+            maxsize: Maximum number of entries kept in memory
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value (marking it recently used) or None."""
+        with self._lock:
+            if key not in self._data:
+                return None
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def put(self, key: str, value: Any) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SQLiteStore:
+    """
+    On-disk cache tier backed by a single SQLite file.
+
+    Values are stored as JSON. When the total stored size exceeds max_bytes,
+    the least recently accessed entries are evicted.
+    """
+
+    def __init__(self, path: str, max_bytes: int = 256 * 1024 * 1024):
+        """
+        Initialize the SQLite store.
+
+        Args:
+            path: Database file path (parent directories are created)
+            max_bytes: Size budget for stored values (default: 256 MiB)
+        """
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " key TEXT PRIMARY KEY,"
+            " value TEXT NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " accessed REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)"
+        )
+        self._conn.commit()
+        self._total_bytes = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM entries"
+        ).fetchone()[0]
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the stored value or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE entries SET accessed = ? WHERE key = ?", (time.time(), key)
+            )
+            self._conn.commit()
+        return json.loads(row[0])
+
+    def put(self, key: str, value: Any) -> None:
+        """Store a JSON-serializable value, then evict down to max_bytes."""
+        encoded = json.dumps(value)
+        size = len(encoded.encode("utf-8"))
+
+        if size > self.max_bytes:
+            logger.warning(f"Cache entry of {size} bytes exceeds max_bytes, not stored")
+            return
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT size FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                self._total_bytes -= row[0]
+
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, size, accessed) VALUES (?, ?, ?, ?)",
+                (key, encoded, size, time.time())
+            )
+            self._total_bytes += size
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        """Drop least recently accessed entries until under budget (lock held)."""
+        while self._total_bytes > self.max_bytes:
+            rows = self._conn.execute(
+                "SELECT key, size FROM entries ORDER BY accessed LIMIT 64"
+            ).fetchall()
+            if not rows:
+                self._total_bytes = 0
+                return
+            for key, size in rows:
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self._total_bytes -= size
+                if self._total_bytes <= self.max_bytes:
+                    return
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+            self._conn.commit()
+            self._total_bytes = 0
+
+    @property
+    def total_bytes(self) -> int:
+        """Total size of stored values in bytes."""
+        return self._total_bytes
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+
+class TieredCache:
+    """
+    Memory LRU in front of an optional disk store, with hit/miss counters.
+
+    Disk hits are promoted into the memory tier.
+    """
+
+    def __init__(
+        self,
+        memory_size: int = 1024,
+        path: Optional[str] = None,
+        max_disk_bytes: int = 256 * 1024 * 1024
+    ):
+        """
+        Initialize the tiered cache.
+
+        Args:
+            memory_size: Maximum entries in the in-memory LRU tier
+            path: SQLite file for the disk tier (None = memory only)
+            max_disk_bytes: Size budget for the disk tier
+        """
+        self.memory = LRUCache(memory_size)
+        self.disk = SQLiteStore(path, max_disk_bytes) if path else None
+        self.hits = 0
+        self.misses = 0
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self._stats_lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Look a key up in memory, then on disk."""
+        value = self.memory.get(key)
+        if value is not None:
+            self._count(memory=True)
+            return value
+
+        if self.disk is not None:
+            value = self.disk.get(key)
+            if value is not None:
+                self.memory.put(key, value)
+                self._count(disk=True)
+                return value
+
+        self._count()
+        return None
+
+    def put(self, key: str, value: Any) -> None:
+        """Store a value in every tier."""
+        self.memory.put(key, value)
+        if self.disk is not None:
+            self.disk.put(key, value)
+
+    def _count(self, memory: bool = False, disk: bool = False) -> None:
+        with self._stats_lock:
+            if memory or disk:
+                self.hits += 1
+                self.memory_hits += int(memory)
+                self.disk_hits += int(disk)
+            else:
+                self.misses += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache counters.
+
+        Returns:
+            Dictionary with hits, misses, hit_rate and per-tier sizes
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "hit_rate": self.hits / lookups if lookups > 0 else 0.0,
+            "memory_entries": len(self.memory),
+            "disk_bytes": self.disk.total_bytes if self.disk is not None else 0
+        }
+
+    def clear(self) -> None:
+        """Remove all entries from every tier."""
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+    def close(self) -> None:
+        """Close the disk tier."""
+        if self.disk is not None:
+            self.disk.close()
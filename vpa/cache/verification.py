@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Verification Cache - Reuses verifier check results across runs.
+
+Two kinds of entries share one tiered store:
+    checks: all check scores of a candidate, keyed by its text and the
+            verifier configuration (and unit tests, if any)
+    code:   execution result of a code block, keyed by the code and the
+            executor configuration, so identical snippets in different
+            candidates or runs execute once
+
+Usage:
+    from vpa.cache import VerificationCache
+    from vpa.verify import SimpleVerifier
+
+    cache = VerificationCache(path=".vpa_cache/verification.sqlite")
+    verifier = SimpleVerifier(cache=cache)
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, List, Optional
+
+from .store import TieredCache
+
+# Failures caused by load or a batch budget rather than by the code itself
+TRANSIENT_ERRORS = ("Execution timed out", "Batch deadline")
+
+
+def _digest(*parts: Any) -> str:
+    """Hash JSON-serializable parts into a hex key."""
+    encoded = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class VerificationCache(TieredCache):
+    """Caches candidate check results and code execution results."""
+
+    def __init__(
+        self,
+        memory_size: int = 4096,
+        path: Optional[str] = None,
+        max_disk_bytes: int = 256 * 1024 * 1024
+    ):
+        """
+        Initialize the verification cache.
+
+        Args:
+            memory_size: Maximum entries in the in-memory LRU tier
+            path: SQLite file for the persistent tier (None = memory only)
+            max_disk_bytes: Size budget for the persistent tier
+        """
+        super().__init__(memory_size, path, max_disk_bytes)
+
+    @staticmethod
+    def checks_key(
+        text: str,
+        config: Dict[str, Any],
+        tests: Optional[List[str]] = None
+    ) -> str:
+        """Key for a candidate's checks under a verifier configuration."""
+        return "checks:" + _digest(text, config, tests or [])
+
+    @staticmethod
+    def code_key(code: str, config: Dict[str, Any]) -> str:
+        """Key for a code block's execution result under an executor configuration."""
+        return "code:" + _digest(code, config)
+
+    def lookup_checks(
+        self,
+        text: str,
+        config: Dict[str, Any],
+        tests: Optional[List[str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get cached checks for a candidate.
+
+        Returns:
+            {'checks': ..., 'tests': <unit test report or None>}, or None
+        """
+        return self.get(self.checks_key(text, config, tests))
+
+    def store_checks(
+        self,
+        text: str,
+        config: Dict[str, Any],
+        tests: Optional[List[str]],
+        checks: Dict[str, float],
+        test_report: Optional[Dict[str, Any]] = None,
+        code_results: Optional[List[Dict[str, Any]]] = None
+    ) -> None:
+        """Cache a candidate's checks unless its code or tests hit a timeout."""
+        if test_report is not None and self._transient(test_report.get("error")):
+            return
+        if any(self._transient(result.get("error")) for result in code_results or ()):
+            return
+        self.put(self.checks_key(text, config, tests), {"checks": dict(checks), "tests": test_report})
+
+    def lookup_code(self, code: str, config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Get a cached execution result for a code block."""
+        return self.get(self.code_key(code, config))
+
+    def store_code(self, code: str, config: Dict[str, Any], result: Dict[str, Any]) -> None:
+        """Cache an execution result unless it failed on a timeout or deadline."""
+        if not result["success"] and self._transient(result.get("error")):
+            return
+        self.put(self.code_key(code, config), result)
+
+    @staticmethod
+    def _transient(error: Optional[str]) -> bool:
+        """Check whether an error depends on load rather than the code."""
+        return bool(error) and error.startswith(TRANSIENT_ERRORS)
@@ -1,5 +1,6 @@
 """Draft generation module."""
 
 from .generator import DraftGenerator
+from .scheduler import DraftScheduler
 
-__all__ = ['DraftGenerator']
+__all__ = ['DraftGenerator', 'DraftScheduler']
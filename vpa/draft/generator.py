@@ -4,7 +4,12 @@ Draft Generator - Generates k candidate answers using Ollama.
 """
 
 import logging
-from typing import List, Dict, Any
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from functools import partial
+from typing import List, Dict, Any, Optional, Callable, Iterator, Union
 
 # Import from parent package
 try:
@@ -16,6 +21,9 @@ except ImportError:
     sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
     from ollama_client import OllamaClient
 
+from vpa.reporting import EventSink, ConsoleSink, resolve_reporter
+from vpa.tracing import resolve_tracer
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -23,6 +31,24 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Default concurrent requests per question for each Ollama endpoint
+IN_FLIGHT_PER_ENDPOINT = 4
+
+# Primed prefix contexts kept per generator
+MAX_PRIMED_PREFIXES = 32
+
+
+def default_max_in_flight(
+    base_url: Union[str, List[str]],
+    client: Optional[OllamaClient] = None
+) -> int:
+    """Requests per question that keep every endpoint busy (4 per endpoint)."""
+    if client is not None:
+        endpoints = len(client.base_urls)
+    else:
+        endpoints = 1 if isinstance(base_url, str) else len(base_url)
+    return IN_FLIGHT_PER_ENDPOINT * endpoints
+
 
 class DraftGenerator:
     """Generates multiple candidate answers for a given question."""
@@ -30,91 +56,485 @@ class DraftGenerator:
     def __init__(
         self,
         model: str = "qwen3:1.7b",
-        base_url: str = "http://127.0.0.1:11434"
+        base_url: Union[str, List[str]] = "http://127.0.0.1:11434",
+        max_in_flight: Optional[int] = None,
+        client: Optional[OllamaClient] = None,
+        reporter: Optional[EventSink] = None,
+        tracer: Optional[Any] = None,
+        keep_alive: Optional[Union[str, int]] = "30m",
+        prime_prefix: bool = False
     ):
         """
         Initialize the draft generator.
 
         Args:
             model: Ollama model to use
-            base_url: Ollama API base URL
+            base_url: Ollama API base URL, or a list of URLs to
+                      load-balance candidate requests across
+            max_in_flight: Maximum concurrent Ollama requests per question
+                           (1 drafts candidates sequentially; default: 4 per
+                           endpoint, so drafting scales with added servers)
+            client: Shared OllamaClient (e.g. one pooled client for several
+                    components); model and base_url are taken from it
+            reporter: Event sink for progress events (default: NullSink)
+            tracer: Tracer receiving a 'draft.candidate' span per candidate
+                    (also passed to the client this generator creates)
+            keep_alive: How long Ollama keeps the model and its prompt cache
+                        resident between questions (for the client this
+                        generator creates; None = server default)
+            prime_prefix: Evaluate a shared prefix once and continue every
+                          candidate from its returned context (see generate)
         """
-        self.client = OllamaClient(base_url=base_url, model=model)
-        self.model = model
-        self.base_url = base_url
+        if max_in_flight is None:
+            max_in_flight = default_max_in_flight(base_url, client)
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+
+        self.client = client or OllamaClient(
+            base_url=base_url,
+            model=model,
+            pool_size=max(max_in_flight, 10),
+            tracer=tracer,
+            keep_alive=keep_alive
+        )
+        self.model = self.client.model
+        self.base_url = self.client.base_url
+        self.max_in_flight = max_in_flight
+        self.prime_prefix = prime_prefix
+        self.reporter = resolve_reporter(reporter)
+        self.tracer = resolve_tracer(tracer)
+        self._primed: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._primed_lock = threading.Lock()
 
     def generate(
         self,
         question: str,
         k: int = 3,
-        temperature_range: tuple = (0.6, 0.9)
+        temperature_range: tuple = (0.6, 0.9),
+        max_in_flight: Optional[int] = None,
+        stop: Optional[Callable[[str], bool]] = None,
+        prefix: Optional[str] = None,
+        token_budget: Optional[int] = None,
+        deadline: Optional[float] = None
     ) -> List[Dict[str, Any]]:
         """
         Generate k diverse candidate answers.
 
+        All k requests are sent concurrently (up to max_in_flight at a time);
+        candidates are returned in id order regardless of completion order.
+        With a deadline, candidates still running when it passes are cut off
+        and only the finished ones are returned.
+
         Args:
             question: The question to answer
             k: Number of candidates to generate (default: 3)
             temperature_range: (min, max) temperature for diversity
+            max_in_flight: Override the generator's concurrency limit
+            stop: Streaming stop predicate (e.g. ollama_client.char_budget)
+                  used to cut runaway candidates off early
+            prefix: Shared instruction/context text (e.g. retrieved
+                    passages). By default it is sent as "prefix\n\nquestion",
+                    one prompt that Ollama's prompt cache can reuse while the
+                    model stays loaded. With prime_prefix the prefix is
+                    evaluated once as its own turn, and candidates send only
+                    the question as a follow-up turn. The primed context
+                    also holds a one-token reply to the prefix, so answers
+                    can differ from the single-prompt form; if priming
+                    fails, candidates fall back to the single prompt.
+            token_budget: Total tokens to generate for the question, split
+                          evenly into each candidate's max_tokens; candidates
+                          that hit the limit have metadata['truncated'] set
+            deadline: Wall-clock budget for the question in seconds.
+                      Candidates are then streamed with a stop predicate,
+                      so they are not retried, hedged or cached (as with
+                      stop)
 
         Returns:
             List of candidate dictionaries with 'text', 'temperature', 'metadata'
+            (metadata has 'truncated' and prompt-eval stats unless the
+            response came from the client's cache)
         """
         if k < 1:
             raise ValueError("k must be at least 1")
 
-        print(f"\n🎯 Generating {k} candidate answers...")
-        print(f"📝 Question: {question}")
-        print(f"🤖 Model: {self.model}")
-        print(f"🌐 Ollama API: {self.base_url}")
-        print("-" * 60)
+        workers = min(k, self.max_in_flight if max_in_flight is None else max_in_flight)
+        if workers < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        max_tokens = self._candidate_tokens(token_budget, k)
+        end = self._deadline_end(deadline)
 
-        candidates = []
-        temp_min, temp_max = temperature_range
+        self.reporter.emit(
+            "draft.start",
+            question=question,
+            k=k,
+            model=self.model,
+            base_url=self.base_url,
+            max_in_flight=workers
+        )
 
-        for i in range(k):
-            # Vary temperature across candidates for diversity
-            if k == 1:
-                temperature = (temp_min + temp_max) / 2
-            else:
-                temperature = temp_min + (temp_max - temp_min) * (i / (k - 1))
+        primed = self._prime(prefix, end)
+        draft = partial(
+            self.draft_candidate,
+            question,
+            stop=stop,
+            prefix=prefix,
+            primed=primed,
+            max_tokens=max_tokens,
+            end=end
+        )
 
-            print(f"\n🔄 Generating candidate {i+1}/{k} (temp={temperature:.2f})...")
+        temperatures = [
+            self.candidate_temperature(i, k, temperature_range)
+            for i in range(k)
+        ]
 
-            try:
-                response = self.client.ask(question, temperature=temperature)
-
-                # Guard against empty responses
-                if not response or not response.strip():
-                    logger.warning(f"Candidate {i+1} returned empty response, skipping")
-                    print(f"⚠️ Candidate {i+1} returned empty response, skipping")
-                    continue
-
-                candidate = {
-                    "id": i + 1,
-                    "text": response,
-                    "temperature": temperature,
-                    "metadata": {
-                        "model": self.model,
-                        "question": question
-                    }
-                }
+        if self.reporter.enabled:
+            for i, temperature in enumerate(temperatures):
+                self.reporter.emit("draft.candidate_start", id=i + 1, k=k, temperature=temperature)
 
-                candidates.append(candidate)
-                print(f"✅ Candidate {i+1}: {response[:80]}...")
+        if workers == 1 and end is None:
+            results = [draft(i, temperature) for i, temperature in enumerate(temperatures)]
+        elif end is None:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(lambda args: draft(*args), enumerate(temperatures)))
+        else:
+            pool = ThreadPoolExecutor(max_workers=workers)
+            try:
+                futures = [pool.submit(draft, i, temperature) for i, temperature in enumerate(temperatures)]
+                done, _ = wait(futures, timeout=max(end - time.monotonic(), 0.0))
+                results = [future.result() if future in done else None for future in futures]
+            finally:
+                # Running candidates see the deadline and close their streams
+                pool.shutdown(wait=False, cancel_futures=True)
+            self._report_cancelled(
+                [i for i, future in enumerate(futures) if future not in done], deadline
+            )
 
-            except Exception as e:
-                logger.error(f"Error generating candidate {i+1}: {e}", exc_info=True)
-                print(f"❌ Error generating candidate {i+1}: {e}")
-                # Continue to next candidate
+        # Drop skipped/failed candidates, keeping id order
+        candidates = [candidate for candidate in results if candidate is not None]
 
-        print(f"\n✨ Generated {len(candidates)}/{k} candidates successfully")
+        self._report_prefix(primed, len(candidates))
+        self.reporter.emit("draft.done", generated=len(candidates), k=k)
         return candidates
 
+    def iter_generate(
+        self,
+        question: str,
+        k: int = 3,
+        temperature_range: tuple = (0.6, 0.9),
+        max_in_flight: Optional[int] = None,
+        stop: Optional[Callable[[str], bool]] = None,
+        prefix: Optional[str] = None,
+        token_budget: Optional[int] = None,
+        deadline: Optional[float] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield candidates in completion order, drafting at most k.
+
+        Only max_in_flight requests are outstanding at a time and finished
+        slots are refilled when the consumer asks for the next candidate,
+        so closing the iterator early (e.g. once a candidate is good enough)
+        stops further requests. Requests still in flight when it is closed
+        or when the deadline passes are abandoned, not waited for.
+
+        Args:
+            question: The question to answer
+            k: Maximum number of candidates to draft
+            temperature_range: (min, max) temperature for diversity; the
+                               lowest temperatures are drafted first
+            max_in_flight: Override the generator's concurrency limit
+            stop: Streaming stop predicate passed to each request
+            prefix: Shared prefix reused across candidates, as in generate()
+            token_budget: Total tokens for the question, split evenly over
+                          the k candidates
+            deadline: Wall-clock budget for the question in seconds, as in
+                      generate()
+
+        Yields:
+            Candidate dictionaries as in generate()
+        """
+        if k < 1:
+            raise ValueError("k must be at least 1")
+
+        workers = min(k, self.max_in_flight if max_in_flight is None else max_in_flight)
+        if workers < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        max_tokens = self._candidate_tokens(token_budget, k)
+        end = self._deadline_end(deadline)
+
+        self.reporter.emit(
+            "draft.start",
+            question=question,
+            k=k,
+            model=self.model,
+            base_url=self.base_url,
+            max_in_flight=workers
+        )
+
+        primed = self._prime(prefix, end)
+        pool = ThreadPoolExecutor(max_workers=workers)
+        pending = {}
+        next_id = 0
+        generated = 0
+
+        def submit():
+            nonlocal next_id
+            temperature = self.candidate_temperature(next_id, k, temperature_range)
+            self.reporter.emit("draft.candidate_start", id=next_id + 1, k=k, temperature=temperature)
+            future = pool.submit(
+                self.draft_candidate, question, next_id, temperature, stop,
+                prefix=prefix, primed=primed, max_tokens=max_tokens, end=end
+            )
+            pending[future] = next_id
+            next_id += 1
+
+        try:
+            while len(pending) < workers:
+                submit()
+
+            while pending:
+                timeout = None if end is None else max(end - time.monotonic(), 0.0)
+                done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                if not done:
+                    self._report_cancelled(sorted(pending.values()), deadline)
+                    break
+                for future in done:
+                    del pending[future]
+                    candidate = future.result()
+                    if candidate is not None:
+                        generated += 1
+                        yield candidate
+
+                # Refill only once the consumer asks for more
+                while len(pending) < workers and next_id < k and not self._expired(end):
+                    submit()
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+            self._report_prefix(primed, generated)
+            self.reporter.emit("draft.done", generated=generated, k=next_id)
+
+    def _prime(self, prefix: Optional[str], end: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Evaluate a shared prefix once and keep its context tokens.
+
+        Returns:
+            {'context', 'tokens', 'seconds', 'fresh'} for the prefix, or None
+            without a prefix, with prime_prefix off or when priming failed
+            (candidates then send the prefix in full)
+        """
+        if not prefix or not self.prime_prefix:
+            return None
+
+        with self._primed_lock:
+            primed = self._primed.get(prefix)
+            if primed is not None:
+                self._primed.move_to_end(prefix)
+                return dict(primed, fresh=False)
+
+        if self._expired(end):
+            return None
+
+        info: Dict[str, Any] = {}
+        timeout = None
+        stream = False
+        if end is not None:
+            # Streamed, so a slow prime is not retried past the deadline
+            timeout = end - time.monotonic()
+            stream = True
+        try:
+            with self.tracer.span("draft.prime"):
+                self.client.ask(
+                    prefix,
+                    temperature=0.0,
+                    max_tokens=1,
+                    stream=stream,
+                    timeout=timeout,
+                    info=info,
+                    cache=False
+                )
+        except Exception as e:
+            logger.warning(f"Priming shared prefix failed, sending it with each candidate: {e}")
+            return None
+
+        if not info.get("context"):
+            logger.warning("Ollama returned no context for the shared prefix, sending it with each candidate")
+            return None
+
+        primed = {
+            "context": info["context"],
+            "tokens": info.get("prompt_eval_count", 0),
+            "seconds": info.get("prompt_eval_duration", 0) / 1e9
+        }
+        with self._primed_lock:
+            self._primed[prefix] = primed
+            while len(self._primed) > MAX_PRIMED_PREFIXES:
+                self._primed.popitem(last=False)
+
+        return dict(primed, fresh=True)
+
+    def _report_prefix(self, primed: Optional[Dict[str, Any]], candidates: int) -> None:
+        """Report prompt-eval time saved by reusing a primed prefix."""
+        if primed is None:
+            return
+
+        # Each candidate skipped evaluating the prefix; a fresh prime paid for it once
+        saved = primed["seconds"] * (candidates - (1 if primed["fresh"] else 0))
+        self.tracer.record("draft.prompt_eval_saved", max(saved, 0.0))
+        logger.info(
+            f"Reused {primed['tokens']} prefix tokens across {candidates} candidates, "
+            f"saving ~{saved:.3f}s of prompt evaluation"
+        )
+        self.reporter.emit(
+            "draft.prefix",
+            tokens=primed["tokens"],
+            candidates=candidates,
+            fresh=primed["fresh"],
+            saved_seconds=saved
+        )
+
+    def _report_cancelled(self, ids: List[int], deadline: Optional[float]) -> None:
+        """Report candidates cut off or never started because of the deadline."""
+        if not ids:
+            return
+        logger.warning(f"Deadline of {deadline}s reached, dropped {len(ids)} unfinished candidates")
+        for i in ids:
+            self.reporter.emit("draft.candidate_cancelled", id=i + 1, deadline=deadline)
+
+    @staticmethod
+    def _candidate_tokens(token_budget: Optional[int], k: int) -> Optional[int]:
+        """Split a question's token budget evenly across k candidates."""
+        if token_budget is None:
+            return None
+        if token_budget < k:
+            raise ValueError("token_budget must allow at least one token per candidate")
+        return token_budget // k
+
+    @staticmethod
+    def _deadline_end(deadline: Optional[float]) -> Optional[float]:
+        """Monotonic time at which a deadline in seconds expires."""
+        if deadline is None:
+            return None
+        if deadline <= 0:
+            raise ValueError("deadline must be positive")
+        return time.monotonic() + deadline
+
+    @staticmethod
+    def _expired(end: Optional[float]) -> bool:
+        return end is not None and time.monotonic() >= end
+
+    @staticmethod
+    def candidate_temperature(i: int, k: int, temperature_range: tuple) -> float:
+        """Temperature of candidate i of k, spread over the range for diversity."""
+        temp_min, temp_max = temperature_range
+        if k == 1:
+            return (temp_min + temp_max) / 2
+        return temp_min + (temp_max - temp_min) * (i / (k - 1))
+
+    def draft_candidate(
+        self,
+        question: str,
+        i: int,
+        temperature: float,
+        stop: Optional[Callable[[str], bool]] = None,
+        prefix: Optional[str] = None,
+        primed: Optional[Dict[str, Any]] = None,
+        max_tokens: Optional[int] = None,
+        end: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Request a single candidate from Ollama.
+
+        generate and iter_generate call this for each candidate; schedulers
+        that interleave candidates of many questions (DraftScheduler) call
+        it directly.
+
+        With a primed prefix only the question is sent, continuing from the
+        prefix's context tokens; an unprimed prefix is prepended to it. With
+        a deadline (end, in time.monotonic() terms) the response is streamed
+        and its connection closed once the deadline passes, which stops
+        decoding on the server.
+
+        Returns:
+            Candidate dictionary, or None if the response was empty, failed
+            or was cut off by the deadline
+        """
+        timeout = None
+        cut_off = False
+        if end is not None:
+            timeout = end - time.monotonic()
+            if timeout <= 0:
+                return None
+
+            user_stop = stop
+
+            def stop(text: str) -> bool:
+                nonlocal cut_off
+                if time.monotonic() >= end:
+                    cut_off = True
+                    return True
+                return user_stop is not None and user_stop(text)
+
+        info: Dict[str, Any] = {}
+        prompt = question
+        context = None
+        if primed is not None:
+            context = primed["context"]
+        elif prefix:
+            prompt = f"{prefix}\n\n{question}"
+
+        try:
+            with self.tracer.span("draft.candidate"):
+                response = self.client.ask(
+                    prompt,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    timeout=timeout,
+                    stop=stop,
+                    context=context,
+                    info=info
+                )
+
+            if cut_off:
+                logger.info(f"Candidate {i+1} was cut off by the deadline, dropping it")
+                return None
+
+            # Guard against empty responses
+            if not response or not response.strip():
+                logger.warning(f"Candidate {i+1} returned empty response, skipping")
+                self.reporter.emit("draft.candidate_empty", id=i + 1)
+                return None
+
+            candidate = {
+                "id": i + 1,
+                "text": response,
+                "temperature": temperature,
+                "metadata": {
+                    "model": self.model,
+                    "question": question
+                }
+            }
+            if info:
+                # Cut off by max_tokens rather than finished by the model
+                candidate["metadata"]["truncated"] = info.get("done_reason") == "length"
+                candidate["metadata"]["prompt_eval_count"] = info.get("prompt_eval_count")
+                candidate["metadata"]["prompt_eval_seconds"] = info.get("prompt_eval_duration", 0) / 1e9
+
+            self.reporter.emit("draft.candidate_done", id=i + 1, text=response)
+            return candidate
+
+        except Exception as e:
+            if self._expired(end):
+                logger.info(f"Candidate {i+1} did not finish before the deadline: {e}")
+                return None
+            logger.error(f"Error generating candidate {i+1}: {e}", exc_info=True)
+            self.reporter.emit("draft.candidate_error", id=i + 1, error=str(e))
+            # Skip this candidate, the others are unaffected
+            return None
+
 
 def main():
     """Example usage."""
-    generator = DraftGenerator()
+    generator = DraftGenerator(reporter=ConsoleSink())
 
     # Example question
     question = "What is machine learning?"
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Draft Scheduler - Keeps the model server saturated across a whole dataset.
+
+DraftGenerator.generate drafts one question at a time, so a dataset run
+never has more than k requests in flight and the server idles between
+questions. DraftScheduler pulls questions lazily from an iterable and keeps
+a global number of requests outstanding across all questions and samples,
+yielding each question's candidates as soon as its last sample finishes.
+
+Usage:
+    scheduler = DraftScheduler(DraftGenerator(), max_outstanding=16)
+    for item, candidates in scheduler.run(dataset, k=5):
+        verified = verifier.verify(candidates)
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .generator import DraftGenerator
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+class _QuestionState:
+    """Drafting progress of one question."""
+
+    def __init__(self, item: Any, question: str, k: int):
+        self.item = item
+        self.question = question
+        self.results: List[Optional[Dict[str, Any]]] = [None] * k
+        self.submitted = 0
+        self.remaining = k
+
+
+class DraftScheduler:
+    """Drafts candidates for many questions through one shared request pool."""
+
+    def __init__(self, generator: Optional[DraftGenerator] = None, max_outstanding: int = 16):
+        """
+        Initialize the scheduler.
+
+        Args:
+            generator: Draft generator whose client, model and reporter are
+                       used (default: DraftGenerator()); its client's
+                       connection pool should hold max_outstanding connections
+            max_outstanding: Model requests kept in flight across all questions
+        """
+        if max_outstanding < 1:
+            raise ValueError("max_outstanding must be at least 1")
+
+        self.generator = generator or DraftGenerator(max_in_flight=max_outstanding)
+        self.max_outstanding = max_outstanding
+
+    def run(
+        self,
+        items: Iterable[Any],
+        k: int = 3,
+        temperature_range: tuple = (0.6, 0.9),
+        stop: Optional[Callable[[str], bool]] = None
+    ) -> Iterator[Tuple[Any, List[Dict[str, Any]]]]:
+        """
+        Draft k candidates for every item.
+
+        Items are read lazily, so only about max_outstanding / k questions
+        are in progress at once. Closing the iterator abandons the requests
+        still in flight.
+
+        Args:
+            items: Question strings, or dataset items with a 'question' field
+            k: Candidates per question
+            temperature_range: (min, max) temperature for diversity
+            stop: Streaming stop predicate passed to each request
+
+        Yields:
+            (item, candidates) per question in completion order; candidates
+            are in id order with failed or empty ones left out, as in
+            DraftGenerator.generate
+        """
+        if k < 1:
+            raise ValueError("k must be at least 1")
+
+        generator = self.generator
+        reporter = generator.reporter
+        source = iter(items)
+        pool = ThreadPoolExecutor(max_workers=self.max_outstanding)
+        pending = {}
+        current = None
+        exhausted = False
+
+        def fill():
+            nonlocal current, exhausted
+            while len(pending) < self.max_outstanding:
+                if current is None or current.submitted == k:
+                    if exhausted:
+                        return
+                    try:
+                        item = next(source)
+                    except StopIteration:
+                        exhausted = True
+                        return
+                    question = item["question"] if isinstance(item, dict) else item
+                    current = _QuestionState(item, question, k)
+                    reporter.emit(
+                        "draft.start",
+                        question=question,
+                        k=k,
+                        model=generator.model,
+                        base_url=generator.base_url,
+                        max_in_flight=self.max_outstanding
+                    )
+
+                i = current.submitted
+                temperature = generator.candidate_temperature(i, k, temperature_range)
+                reporter.emit("draft.candidate_start", id=i + 1, k=k, temperature=temperature)
+                future = pool.submit(generator.draft_candidate, current.question, i, temperature, stop)
+                pending[future] = (current, i)
+                current.submitted += 1
+
+        try:
+            fill()
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                finished = []
+                for future in done:
+                    state, i = pending.pop(future)
+                    state.results[i] = future.result()
+                    state.remaining -= 1
+                    if state.remaining == 0:
+                        finished.append(state)
+
+                # Keep the server busy while the caller handles finished questions
+                fill()
+
+                for state in finished:
+                    candidates = [candidate for candidate in state.results if candidate is not None]
+                    reporter.emit("draft.done", generated=len(candidates), k=k)
+                    yield state.item, candidates
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
@@ -1,5 +1,11 @@
 """Evaluation module."""
 
-from .scorer import SimpleEvaluator, TINY_QA_SET, TINY_CODE_SET
+from .scorer import SimpleEvaluator, TINY_QA_SET, TINY_CODE_SET, pass_at_k
+from .runner import EvaluationRunner
+from .datasets import load_dataset
+from .matcher import AnswerMatcher, normalize_answer
 
-__all__ = ['SimpleEvaluator', 'TINY_QA_SET', 'TINY_CODE_SET']
+__all__ = [
+    'SimpleEvaluator', 'TINY_QA_SET', 'TINY_CODE_SET', 'pass_at_k',
+    'EvaluationRunner', 'load_dataset', 'AnswerMatcher', 'normalize_answer'
+]
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Dataset Loaders - Stream eval sets from local JSONL/Parquet files.
+
+Records are read lazily and converted to the evaluator's item schema:
+    QA:   {"id", "question", "answer", "acceptable", "type": "qa"}
+    Code: {"id", "question", "tests", "test_setup", "type": "code"}
+
+Usage:
+    items = load_dataset("data/mbpp.jsonl", format="mbpp", shard=(0, 4))
+    metrics = EvaluationRunner(generate_fn, "runs/mbpp-0.jsonl").run(items, "code")
+"""
+
+import hashlib
+import json
+import logging
+import os
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def iter_jsonl(path: str) -> Iterator[Dict[str, Any]]:
+    """Yield records from a JSONL file one line at a time."""
+    with open(path, "r", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{path}:{line_number}: invalid JSON: {e}")
+
+
+def iter_parquet(path: str, batch_size: int = 1024) -> Iterator[Dict[str, Any]]:
+    """
+    Yield records from a Parquet file one record batch at a time.
+
+    Requires pyarrow (pip install "vpa-llm-fixer[datasets]").
+    """
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError(
+            "Reading Parquet files requires pyarrow: pip install \"vpa-llm-fixer[datasets]\""
+        )
+
+    parquet_file = pq.ParquetFile(path)
+    for batch in parquet_file.iter_batches(batch_size=batch_size):
+        for record in batch.to_pylist():
+            yield record
+
+
+def _from_vpa(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Records already in the evaluator's item schema."""
+    item = dict(record)
+    item.setdefault("type", "code" if item.get("tests") else "qa")
+    return item
+
+
+def _from_hotpotqa(record: Dict[str, Any]) -> Dict[str, Any]:
+    """HotpotQA: {"_id", "question", "answer", ...}."""
+    answer = str(record["answer"])
+    return {
+        "id": record.get("_id", record.get("id")),
+        "question": record["question"],
+        "answer": answer,
+        "acceptable": [answer.lower()],
+        "type": "qa"
+    }
+
+
+def _from_gsm8k(record: Dict[str, Any]) -> Dict[str, Any]:
+    """GSM8K: {"question", "answer": "<reasoning> #### <number>"}."""
+    answer = str(record["answer"]).split("####")[-1].strip().replace(",", "")
+    return {
+        "id": record.get("id"),
+        "question": record["question"],
+        "answer": answer,
+        "acceptable": [answer],
+        "type": "qa"
+    }
+
+
+def _from_mbpp(record: Dict[str, Any]) -> Dict[str, Any]:
+    """MBPP: {"task_id", "text", "test_list", "test_setup_code", ...}."""
+    tests = list(record["test_list"])
+    # Standard MBPP prompt: showing the tests tells the model the function name
+    question = record["text"] + "\nYour code should pass these tests:\n" + "\n".join(tests)
+    return {
+        "id": record.get("task_id"),
+        "question": question,
+        "tests": tests,
+        "test_setup": record.get("test_setup_code") or None,
+        "type": "code"
+    }
+
+
+def _from_humaneval(record: Dict[str, Any]) -> Dict[str, Any]:
+    """HumanEval: {"task_id", "prompt", "test", "entry_point"}."""
+    return {
+        "id": record.get("task_id"),
+        "question": record["prompt"],
+        # The test defines check(candidate); calling it is a single test case
+        "tests": [f"{record['test']}\ncheck({record['entry_point']})"],
+        "type": "code"
+    }
+
+
+FORMATS: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+    "vpa": _from_vpa,
+    "hotpotqa": _from_hotpotqa,
+    "gsm8k": _from_gsm8k,
+    "mbpp": _from_mbpp,
+    "humaneval": _from_humaneval,
+}
+
+
+def _in_sample(key: str, sample_rate: float, seed: int) -> bool:
+    """Deterministically keep about sample_rate of keys, independent of order."""
+    digest = hashlib.sha256(f"{seed}:{key}".encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") / 2 ** 64 < sample_rate
+
+
+def load_dataset(
+    path: str,
+    format: str = "vpa",
+    shard: Optional[Tuple[int, int]] = None,
+    sample_rate: Optional[float] = None,
+    seed: int = 0,
+    limit: Optional[int] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream a local dataset file as evaluator items.
+
+    Args:
+        path: .jsonl/.json (one record per line) or .parquet file
+        format: Record layout: "vpa", "hotpotqa", "gsm8k", "mbpp" or "humaneval"
+        shard: (index, count) keeps records whose position % count == index
+        sample_rate: Keep this fraction of records, chosen by a hash of the
+                     record id and seed (same subset on every run)
+        seed: Subsampling seed
+        limit: Stop after this many items
+
+    Yields:
+        Items with a stable 'id' (the record's id, else its file position)
+    """
+    if format not in FORMATS:
+        raise ValueError(f"Unknown dataset format: {format}")
+    if shard is not None:
+        shard_index, shard_count = shard
+        if shard_count < 1 or not 0 <= shard_index < shard_count:
+            raise ValueError(f"Invalid shard: {shard}")
+    if sample_rate is not None and not 0.0 < sample_rate <= 1.0:
+        raise ValueError("sample_rate must be in (0, 1]")
+
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".parquet":
+        records = iter_parquet(path)
+    elif extension in (".jsonl", ".json", ".ndjson"):
+        records = iter_jsonl(path)
+    else:
+        raise ValueError(f"Unsupported dataset file type: {path}")
+
+    convert = FORMATS[format]
+    yielded = 0
+
+    for position, record in enumerate(records):
+        if limit is not None and yielded >= limit:
+            break
+        if shard is not None and position % shard_count != shard_index:
+            continue
+
+        item = convert(record)
+        if item.get("id") is None:
+            item["id"] = position
+        item["id"] = str(item["id"])
+
+        if sample_rate is not None and not _in_sample(item["id"], sample_rate, seed):
+            continue
+
+        yielded += 1
+        yield item
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Answer Matcher - Normalized exact match, containment and token F1.
+
+Gold and acceptable answers are normalized SQuAD-style (lowercase, no
+punctuation or articles, collapsed whitespace, number words as digits) and
+compiled once per dataset item, so a response is normalized once and
+scanned by at most two precompiled patterns.
+"""
+
+import re
+import string
+from collections import Counter
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Sequence
+
+ARTICLES_PATTERN = re.compile(r'\b(a|an|the)\b')
+PUNCTUATION_TABLE = str.maketrans(string.punctuation, ' ' * len(string.punctuation))
+
+NUMBER_WORDS = {
+    'zero': '0', 'one': '1', 'two': '2', 'three': '3', 'four': '4',
+    'five': '5', 'six': '6', 'seven': '7', 'eight': '8', 'nine': '9',
+    'ten': '10', 'eleven': '11', 'twelve': '12', 'thirteen': '13',
+    'fourteen': '14', 'fifteen': '15', 'sixteen': '16', 'seventeen': '17',
+    'eighteen': '18', 'nineteen': '19', 'twenty': '20', 'thirty': '30',
+    'forty': '40', 'fifty': '50', 'sixty': '60', 'seventy': '70',
+    'eighty': '80', 'ninety': '90', 'hundred': '100', 'thousand': '1000'
+}
+
+
+def normalize_answer(text: str) -> str:
+    """
+    SQuAD-style answer normalization.
+
+    Lowercases, replaces punctuation with spaces, drops articles, maps
+    number words to digits and collapses whitespace.
+    """
+    text = ARTICLES_PATTERN.sub(' ', text.lower().translate(PUNCTUATION_TABLE))
+    return ' '.join(NUMBER_WORDS.get(token, token) for token in text.split())
+
+
+def token_f1(prediction_tokens: Counter, prediction_length: int, gold_tokens: List[str]) -> float:
+    """Token-level F1 between a prediction (as token counts) and a gold answer."""
+    if not prediction_length or not gold_tokens:
+        return float(prediction_length == len(gold_tokens))
+
+    common = sum((prediction_tokens & Counter(gold_tokens)).values())
+    if common == 0:
+        return 0.0
+    precision = common / prediction_length
+    recall = common / len(gold_tokens)
+    return 2 * precision * recall / (precision + recall)
+
+
+class AnswerMatcher:
+    """Matches responses against one item's gold and acceptable answers."""
+
+    def __init__(self, gold_answer: str, acceptable: Optional[Sequence[str]] = None):
+        """
+        Normalize the answers and compile their patterns.
+
+        Args:
+            gold_answer: The correct answer
+            acceptable: Answer variations that also count as correct when
+                        they appear anywhere in the response
+        """
+        self.gold = normalize_answer(gold_answer)
+        self.acceptable = []
+        for answer in acceptable or ():
+            normalized = normalize_answer(answer)
+            if normalized and normalized not in self.acceptable:
+                self.acceptable.append(normalized)
+
+        self.answers = [self.gold] + [a for a in self.acceptable if a != self.gold]
+        self._answer_tokens = [answer.split() for answer in self.answers]
+
+        # Acceptable answers mean correct, the gold answer alone only
+        # partial. They are scanned separately: matches of one alternation
+        # cannot overlap, so a gold match could hide an acceptable answer
+        # sharing its words. Longest first so the longest variant wins.
+        alternatives = sorted(self.acceptable, key=len, reverse=True)
+        self._accept_pattern = self._compile(alternatives)
+        self._gold_pattern = self._compile(
+            [self.gold] if self.gold and self.gold not in self.acceptable else []
+        )
+
+    @staticmethod
+    def _compile(answers: List[str]) -> Optional["re.Pattern"]:
+        """Pattern matching any of the answers as whole words (None if empty)."""
+        if not answers:
+            return None
+        return re.compile(r'(?<!\S)(?:' + '|'.join(map(re.escape, answers)) + r')(?!\S)')
+
+    def match(self, response: str) -> Dict[str, Any]:
+        """
+        Score a response against its normalized text.
+
+        Args:
+            response: The model's response
+
+        Returns:
+            Dictionary with 'exact_match' (normalized response equals an
+            answer), 'accepted' (an acceptable answer appears),
+            'contains_gold' (the gold answer appears; only tracked when it
+            is not itself acceptable and nothing was accepted) and 'f1' (best token F1 over all
+            answers)
+        """
+        normalized = normalize_answer(response)
+        tokens = normalized.split()
+        token_counts = Counter(tokens)
+
+        accepted = (
+            self._accept_pattern is not None
+            and self._accept_pattern.search(normalized) is not None
+        )
+        contains_gold = (
+            not accepted
+            and self._gold_pattern is not None
+            and self._gold_pattern.search(normalized) is not None
+        )
+
+        return {
+            "exact_match": normalized in self.answers,
+            "accepted": accepted,
+            "contains_gold": contains_gold,
+            "f1": max(
+                token_f1(token_counts, len(tokens), answer_tokens)
+                for answer_tokens in self._answer_tokens
+            )
+        }
+
+
+@lru_cache(maxsize=4096)
+def _cached_matcher(gold_answer: str, acceptable: tuple) -> AnswerMatcher:
+    return AnswerMatcher(gold_answer, acceptable)
+
+
+def get_matcher(gold_answer: str, acceptable: Optional[Sequence[str]] = None) -> AnswerMatcher:
+    """Matcher for an item, compiled once and reused across responses."""
+    return _cached_matcher(gold_answer, tuple(acceptable or ()))
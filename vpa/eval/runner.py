@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Evaluation Runner - Parallel, resumable evaluation with a JSONL checkpoint.
+
+Usage:
+    runner = EvaluationRunner(generator.generate, "runs/qa.jsonl", workers=8)
+    metrics = runner.run(dataset, test_set="qa", k=3)
+
+Every finished question is appended to the checkpoint immediately; running
+again with the same checkpoint skips questions that already have results.
+
+run_scheduled drafts with a DraftScheduler instead, keeping a fixed number
+of model requests in flight across all questions:
+    runner.run_scheduled(dataset, DraftScheduler(generator, 16), verifier.verify, k=5)
+"""
+
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set
+
+from .scorer import SimpleEvaluator
+from ..draft.scheduler import DraftScheduler
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def item_id(item: Dict[str, Any], index: int) -> str:
+    """Stable id for a dataset item: its 'id' field, else its position."""
+    return str(item.get("id", index))
+
+
+def iter_checkpoint(path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Stream results from a JSONL checkpoint.
+
+    A truncated last line (process killed mid-write) is skipped.
+
+    Yields:
+        One result dictionary per completed question
+    """
+    if not os.path.exists(path):
+        return
+
+    with open(path, "r", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning(f"Skipping malformed checkpoint line {line_number} in {path}")
+
+
+class EvaluationRunner:
+    """Evaluates a dataset concurrently, checkpointing each result to JSONL."""
+
+    def __init__(
+        self,
+        generate_fn: Callable[..., List[Dict[str, Any]]],
+        checkpoint_path: str,
+        workers: int = 4,
+        evaluator: Optional[SimpleEvaluator] = None
+    ):
+        """
+        Initialize the runner.
+
+        Args:
+            generate_fn: Function that takes (question, k=k) and returns
+                         candidates, best first (e.g. draft + verify)
+            checkpoint_path: JSONL file results are appended to
+            workers: Number of questions evaluated concurrently
+            evaluator: Evaluator used to score items (default: SimpleEvaluator())
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+
+        self.generate_fn = generate_fn
+        self.checkpoint_path = checkpoint_path
+        self.workers = workers
+        self.evaluator = evaluator or SimpleEvaluator()
+        self._write_lock = threading.Lock()
+
+    def completed_ids(self) -> Set[str]:
+        """Ids of questions that already have a checkpointed result."""
+        return {record["id"] for record in iter_checkpoint(self.checkpoint_path) if "id" in record}
+
+    def run(
+        self,
+        dataset: Iterable[Dict[str, Any]],
+        test_set: str = "qa",
+        k: int = 3
+    ) -> Dict[str, Any]:
+        """
+        Evaluate every item not yet in the checkpoint, then summarize.
+
+        The dataset is consumed lazily with at most 2 * workers items in
+        flight, so it can be a streaming loader over a large file. Items
+        whose generation raises are logged and left out of the checkpoint,
+        so they are retried on the next run.
+
+        Args:
+            dataset: Iterable of dataset items
+            test_set: "qa" or "code"
+            k: Number of candidates to generate per question
+
+        Returns:
+            Metrics computed by streaming over the whole checkpoint
+        """
+        done = self.completed_ids()
+        if done:
+            logger.info(f"Resuming: {len(done)} results already in {self.checkpoint_path}")
+
+        k_values = sorted({1, k})
+        submitted = 0
+        failed = 0
+
+        with self._open_checkpoint() as checkpoint:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                pending = set()
+
+                for index, item in enumerate(dataset):
+                    current_id = item_id(item, index)
+                    if current_id in done:
+                        continue
+
+                    if len(pending) >= 2 * self.workers:
+                        finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        failed += self._collect(finished)
+
+                    pending.add(pool.submit(
+                        self._evaluate_item, checkpoint, current_id, item, test_set, k, k_values
+                    ))
+                    submitted += 1
+
+                failed += self._collect(wait(pending).done)
+
+        logger.info(f"Evaluated {submitted - failed}/{submitted} new questions ({failed} failed)")
+
+        return self.summarize(test_set)
+
+    def run_scheduled(
+        self,
+        dataset: Iterable[Dict[str, Any]],
+        scheduler: DraftScheduler,
+        rank_fn: Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]],
+        test_set: str = "qa",
+        k: int = 3
+    ) -> Dict[str, Any]:
+        """
+        Evaluate every item not yet in the checkpoint using dataset-level drafting.
+
+        Drafting for all questions goes through the scheduler's shared
+        request pool; each question's candidates are ranked and scored as
+        soon as its last sample finishes. generate_fn is not used.
+
+        Args:
+            dataset: Iterable of dataset items
+            scheduler: Scheduler drafting the candidates
+            rank_fn: Orders a question's candidates best first
+                     (e.g. SimpleVerifier.verify)
+            test_set: "qa" or "code"
+            k: Number of candidates to generate per question
+
+        Returns:
+            Metrics computed by streaming over the whole checkpoint
+        """
+        done = self.completed_ids()
+        if done:
+            logger.info(f"Resuming: {len(done)} results already in {self.checkpoint_path}")
+
+        def todo():
+            for index, item in enumerate(dataset):
+                current_id = item_id(item, index)
+                if current_id not in done:
+                    yield dict(item, id=current_id)
+
+        k_values = sorted({1, k})
+        submitted = 0
+        failed = 0
+
+        with self._open_checkpoint() as checkpoint:
+            for item, candidates in scheduler.run(todo(), k=k):
+                submitted += 1
+                try:
+                    with self.evaluator.tracer.span("eval.rank"):
+                        ranked = rank_fn(candidates) if candidates else []
+                    self._record(checkpoint, item["id"], item, ranked, test_set, k_values)
+                except Exception as e:
+                    logger.error(f"Question evaluation failed: {e}")
+                    failed += 1
+
+        logger.info(f"Evaluated {submitted - failed}/{submitted} new questions ({failed} failed)")
+
+        return self.summarize(test_set)
+
+    def _open_checkpoint(self):
+        """
+        Open the checkpoint for appending.
+
+        A truncated last line is terminated first, so the next result
+        starts on a line of its own instead of being lost with it.
+        """
+        directory = os.path.dirname(os.path.abspath(self.checkpoint_path))
+        os.makedirs(directory, exist_ok=True)
+
+        partial_line = False
+        if os.path.exists(self.checkpoint_path) and os.path.getsize(self.checkpoint_path) > 0:
+            with open(self.checkpoint_path, "rb") as f:
+                f.seek(-1, os.SEEK_END)
+                partial_line = f.read(1) != b"\n"
+
+        checkpoint = open(self.checkpoint_path, "a", encoding="utf-8")
+        if partial_line:
+            checkpoint.write("\n")
+        return checkpoint
+
+    def summarize(self, test_set: str = "qa") -> Dict[str, Any]:
+        """Compute metrics by streaming over the checkpoint."""
+        return self.evaluator.summarize(iter_checkpoint(self.checkpoint_path), test_set)
+
+    def _evaluate_item(
+        self,
+        checkpoint,
+        current_id: str,
+        item: Dict[str, Any],
+        test_set: str,
+        k: int,
+        k_values: List[int]
+    ) -> None:
+        """Generate, score and checkpoint one item."""
+        with self.evaluator.tracer.span("eval.generate"):
+            candidates = self.generate_fn(item["question"], k=k)
+        self._record(checkpoint, current_id, item, candidates, test_set, k_values)
+
+    def _record(
+        self,
+        checkpoint,
+        current_id: str,
+        item: Dict[str, Any],
+        candidates: List[Dict[str, Any]],
+        test_set: str,
+        k_values: List[int]
+    ) -> None:
+        """Score one item's ranked candidates and checkpoint the result."""
+        with self.evaluator.tracer.span("eval.score"):
+            result = self.evaluator.score_item(item, candidates, test_set, k_values)
+
+        record = {"id": current_id, "test_set": test_set}
+        record.update(result)
+        line = json.dumps(record, ensure_ascii=False)
+
+        with self._write_lock:
+            checkpoint.write(line + "\n")
+            checkpoint.flush()
+
+    @staticmethod
+    def _collect(futures) -> int:
+        """Log failures among finished futures; returns how many failed."""
+        failed = 0
+        for future in futures:
+            error = future.exception()
+            if error is not None:
+                logger.error(f"Question evaluation failed: {error}")
+                failed += 1
+        return failed
@@ -3,9 +3,14 @@
 Evaluator - Tiny test sets and scoring.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence, Iterable
 import re
 
+from ..verify.unit_tests import UnitTestVerifier
+from .matcher import get_matcher
+from vpa.reporting import EventSink, resolve_reporter
+from vpa.tracing import resolve_tracer
+
 
 # Tiny test sets
 TINY_QA_SET = [
@@ -28,20 +33,75 @@ TINY_QA_SET = [
 
 TINY_CODE_SET = [
     {
-        "question": "Write a Python function to add two numbers.",
+        "question": "Write a Python function add(a, b) that adds two numbers.",
         "keywords": ["def", "return", "+", "add"],
+        "tests": [
+            "assert add(2, 3) == 5",
+            "assert add(-1, 1) == 0",
+            "assert add(0.5, 0.25) == 0.75"
+        ],
         "type": "code"
     }
 ]
 
 
+def pass_at_k(n: int, c: int, k: int) -> float:
+    """
+    Unbiased pass@k estimator (Chen et al., 2021).
+
+    Probability that at least one of k samples drawn without replacement
+    from n candidates (c of them correct) passes. When k > n, every
+    candidate is drawn, so this is 1.0 if any passed.
+
+    Args:
+        n: Number of candidates
+        c: Number of candidates that passed all tests
+        k: Sample budget
+
+    Returns:
+        pass@k in 0.0-1.0
+    """
+    if k < 1:
+        raise ValueError("k must be at least 1")
+    if n - c < k:
+        return 1.0 if c > 0 else 0.0
+
+    # 1 - C(n-c, k) / C(n, k), computed as a product for numerical stability
+    prob_all_fail = 1.0
+    for i in range(n - c + 1, n + 1):
+        prob_all_fail *= 1.0 - k / i
+    return 1.0 - prob_all_fail
+
+
 class SimpleEvaluator:
     """Simple evaluator with tiny test sets."""
 
-    def __init__(self):
-        """Initialize evaluator."""
+    def __init__(
+        self,
+        test_verifier: Optional[UnitTestVerifier] = None,
+        reporter: Optional[EventSink] = None,
+        tracer: Optional[Any] = None
+    ):
+        """
+        Initialize evaluator.
+
+        Args:
+            test_verifier: Runs code test cases (created on first use if omitted)
+            reporter: Event sink for per-question results (default: NullSink)
+            tracer: Tracer receiving 'eval.generate' and 'eval.score' spans
+        """
         self.qa_set = TINY_QA_SET
         self.code_set = TINY_CODE_SET
+        self._test_verifier = test_verifier
+        self.reporter = resolve_reporter(reporter)
+        self.tracer = resolve_tracer(tracer)
+
+    @property
+    def test_verifier(self) -> UnitTestVerifier:
+        """Unit test verifier for code items with test cases."""
+        if self._test_verifier is None:
+            self._test_verifier = UnitTestVerifier()
+        return self._test_verifier
 
     def evaluate_response(
         self,
@@ -62,8 +122,6 @@ class SimpleEvaluator:
         Returns:
             Dictionary with evaluation results
         """
-        response_lower = response.lower().strip()
-
         result = {
             "question": question,
             "response": response,
@@ -78,24 +136,18 @@ class SimpleEvaluator:
             result["score"] = 0.5  # Neutral
             return result
 
-        gold_lower = gold_answer.lower().strip()
+        match = get_matcher(gold_answer, acceptable).match(response)
+        result["exact_match"] = match["exact_match"]
+        result["f1"] = match["f1"]
 
-        # Exact match
-        if response_lower == gold_lower:
+        # Exact match, or an acceptable variation appears in the response
+        if match["exact_match"] or match["accepted"]:
             result["correct"] = True
             result["score"] = 1.0
             return result
 
-        # Check acceptable variations
-        if acceptable:
-            for accept in acceptable:
-                if accept.lower() in response_lower:
-                    result["correct"] = True
-                    result["score"] = 1.0
-                    return result
-
-        # Partial match (gold answer is substring of response)
-        if gold_lower in response_lower:
+        # Partial match (gold answer appears in the response)
+        if match["contains_gold"]:
             result["partial"] = True
             result["score"] = 0.7
             return result
@@ -104,6 +156,182 @@ class SimpleEvaluator:
         result["score"] = 0.0
         return result
 
+    def evaluate_code_candidates(
+        self,
+        question: str,
+        candidates: List[Dict[str, Any]],
+        tests: List[str],
+        setup: Optional[str] = None,
+        k_values: Sequence[int] = (1,)
+    ) -> Dict[str, Any]:
+        """
+        Evaluate code candidates by running test cases against all of them.
+
+        Args:
+            question: The question asked
+            candidates: Candidates, best first
+            tests: MBPP/HumanEval-style assert statements
+            setup: Code run before each candidate
+            k_values: Values of k to report pass@k for
+
+        Returns:
+            Dictionary with 'correct' (best candidate passes), 'score',
+            'num_passed', 'num_candidates' and 'pass_at_k'
+        """
+        reports = self.test_verifier.run_tests(
+            [candidate.get('text', '') for candidate in candidates],
+            tests,
+            setup=setup,
+            stop_on_failure=True
+        )
+
+        n = len(reports)
+        c = sum(1 for report in reports if report["all_passed"])
+        best_passed = n > 0 and reports[0]["all_passed"]
+
+        return {
+            "question": question,
+            "response": candidates[0].get('text', '') if candidates else "",
+            "correct": best_passed,
+            "partial": False,
+            "score": 1.0 if best_passed else 0.0,
+            "num_passed": c,
+            "num_candidates": n,
+            "pass_at_k": {f"pass@{k}": pass_at_k(n, c, k) for k in k_values},
+            "best_report": reports[0] if reports else None
+        }
+
+    def score_item(
+        self,
+        item: Dict[str, Any],
+        candidates: List[Dict[str, Any]],
+        test_set: str = "qa",
+        k_values: Sequence[int] = (1,)
+    ) -> Dict[str, Any]:
+        """
+        Score the candidates generated for one dataset item.
+
+        Args:
+            item: Dataset item ('question' plus 'answer'/'acceptable',
+                  'tests' or 'keywords')
+            candidates: Candidates, best first (may be empty)
+            test_set: "qa" or "code" (an item's own 'type' takes precedence)
+            k_values: Values of k to report pass@k for (code items with tests)
+
+        Returns:
+            Evaluation result with at least 'correct', 'partial' and 'score'
+        """
+        question = item["question"]
+        # Items from dataset loaders carry their own type
+        test_set = item.get("type", test_set)
+
+        if not candidates:
+            return {
+                "question": question,
+                "response": "",
+                "correct": False,
+                "partial": False,
+                "score": 0.0,
+                "error": "No candidates generated"
+            }
+
+        # Best candidate is first (assumed highest score from verifier)
+        response = candidates[0].get('text', '')
+
+        if test_set == "qa":
+            return self.evaluate_response(
+                question,
+                response,
+                gold_answer=item.get("answer"),
+                acceptable=item.get("acceptable")
+            )
+
+        if item.get("tests"):
+            # Run the task's test cases against every candidate
+            return self.evaluate_code_candidates(
+                question,
+                candidates,
+                item["tests"],
+                setup=item.get("test_setup"),
+                k_values=k_values
+            )
+
+        # Simple keyword check for code
+        keywords = item.get("keywords", [])
+        found_keywords = [kw for kw in keywords if kw in response.lower()]
+        score = len(found_keywords) / len(keywords) if keywords else 0.0
+
+        return {
+            "question": question,
+            "response": response,
+            "keywords_found": found_keywords,
+            "keywords_total": len(keywords),
+            "correct": score >= 0.75,
+            "partial": 0.5 <= score < 0.75,
+            "score": score
+        }
+
+    def summarize(self, results: Iterable[Dict[str, Any]], test_set: str = "qa") -> Dict[str, Any]:
+        """
+        Aggregate metrics over evaluation results in a single pass.
+
+        Results are consumed one at a time, so this works on a generator
+        over a large checkpoint file without holding it in memory.
+
+        Args:
+            results: Evaluation results (from score_item)
+            test_set: Name of the evaluated set
+
+        Returns:
+            Dictionary with total, correct, partial, accuracy, mean
+            'exact_match' and 'f1' for items with a gold answer and, for
+            code items with tests, mean 'pass_at_k'
+        """
+        total_questions = 0
+        total_correct = 0
+        total_partial = 0
+        pass_at_k_sums = {}
+        tested_questions = 0
+        exact_match_sum = 0.0
+        f1_sum = 0.0
+        matched_questions = 0
+
+        for result in results:
+            total_questions += 1
+            if result.get("correct"):
+                total_correct += 1
+            elif result.get("partial"):
+                total_partial += 1
+
+            if "f1" in result:
+                matched_questions += 1
+                exact_match_sum += result["exact_match"]
+                f1_sum += result["f1"]
+
+            if "pass_at_k" in result:
+                tested_questions += 1
+                for name, value in result["pass_at_k"].items():
+                    pass_at_k_sums[name] = pass_at_k_sums.get(name, 0.0) + value
+
+        metrics = {
+            "test_set": test_set,
+            "total": total_questions,
+            "correct": total_correct,
+            "partial": total_partial,
+            "accuracy": total_correct / total_questions if total_questions > 0 else 0.0
+        }
+
+        if matched_questions > 0:
+            metrics["exact_match"] = exact_match_sum / matched_questions
+            metrics["f1"] = f1_sum / matched_questions
+
+        if tested_questions > 0:
+            metrics["pass_at_k"] = {
+                name: total / tested_questions for name, total in pass_at_k_sums.items()
+            }
+
+        return metrics
+
     def evaluate_on_tiny_set(
         self,
         generate_fn,
@@ -128,99 +356,30 @@ class SimpleEvaluator:
         else:
             raise ValueError(f"Unknown test set: {test_set}")
 
-        print(f"\n📊 Evaluating on {test_set.upper()} test set ({len(dataset)} questions)")
-        print("=" * 60)
+        self.reporter.emit("eval.start", test_set=test_set, total=len(dataset))
 
         results = []
-        total_correct = 0
-        total_partial = 0
         total_questions = len(dataset)
+        k_values = sorted({1, k})
 
         for i, item in enumerate(dataset, 1):
             question = item["question"]
-            print(f"\n[{i}/{total_questions}] Question: {question}")
+            self.reporter.emit("eval.question", index=i, total=total_questions, question=question)
 
             # Generate candidates
-            candidates = generate_fn(question, k=k)
-
-            if not candidates:
-                print("  ❌ No candidates generated")
-                continue
-
-            # Get best candidate (first one, assumed highest score from verifier)
-            best = candidates[0]
-            response = best.get('text', '')
-
-            # Evaluate
-            if test_set == "qa":
-                eval_result = self.evaluate_response(
-                    question,
-                    response,
-                    gold_answer=item.get("answer"),
-                    acceptable=item.get("acceptable")
-                )
-
-                if eval_result["correct"]:
-                    print(f"  ✅ CORRECT (score: {eval_result['score']:.2f})")
-                    total_correct += 1
-                elif eval_result["partial"]:
-                    print(f"  ⚠️  PARTIAL (score: {eval_result['score']:.2f})")
-                    total_partial += 1
-                else:
-                    print(f"  ❌ WRONG (score: {eval_result['score']:.2f})")
-
-                print(f"     Expected: {item['answer']}")
-                print(f"     Got: {response[:100]}...")
-
-            elif test_set == "code":
-                # Simple keyword check for code
-                keywords = item.get("keywords", [])
-                found_keywords = [kw for kw in keywords if kw in response.lower()]
-                score = len(found_keywords) / len(keywords) if keywords else 0.0
-
-                eval_result = {
-                    "question": question,
-                    "response": response,
-                    "keywords_found": found_keywords,
-                    "keywords_total": len(keywords),
-                    "score": score
-                }
-
-                if score >= 0.75:
-                    print(f"  ✅ GOOD (score: {score:.2f})")
-                    total_correct += 1
-                elif score >= 0.5:
-                    print(f"  ⚠️  PARTIAL (score: {score:.2f})")
-                    total_partial += 1
-                else:
-                    print(f"  ❌ POOR (score: {score:.2f})")
-
-                print(f"     Keywords: {found_keywords}/{keywords}")
-                print(f"     Response: {response[:100]}...")
+            with self.tracer.span("eval.generate"):
+                candidates = generate_fn(question, k=k)
 
+            with self.tracer.span("eval.score"):
+                eval_result = self.score_item(item, candidates, test_set, k_values)
+            self.reporter.emit("eval.result", item=item, result=eval_result, test_set=test_set)
             results.append(eval_result)
 
-        # Calculate metrics
-        accuracy = total_correct / total_questions if total_questions > 0 else 0.0
-        partial_rate = total_partial / total_questions if total_questions > 0 else 0.0
+        metrics = self.summarize(results, test_set)
+        self.reporter.emit("eval.summary", metrics=metrics)
+        metrics["results"] = results
 
-        print("\n" + "=" * 60)
-        print("📈 EVALUATION RESULTS")
-        print("=" * 60)
-        print(f"Total Questions: {total_questions}")
-        print(f"Correct: {total_correct} ({accuracy * 100:.1f}%)")
-        print(f"Partial: {total_partial} ({partial_rate * 100:.1f}%)")
-        print(f"Wrong: {total_questions - total_correct - total_partial}")
-        print(f"\n🎯 Accuracy: {accuracy:.2%}")
-
-        return {
-            "test_set": test_set,
-            "total": total_questions,
-            "correct": total_correct,
-            "partial": total_partial,
-            "accuracy": accuracy,
-            "results": results
-        }
+        return metrics
 
     def compare_candidates(
         self,
@@ -0,0 +1,5 @@
+"""Planning module."""
+
+from .adaptive import AdaptiveDrafter
+
+__all__ = ['AdaptiveDrafter']
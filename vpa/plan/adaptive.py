@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Adaptive Drafter - Draft/verify loop that stops once an answer is good enough.
+
+Candidates are verified as they arrive instead of after all k are drafted.
+Drafting stops as soon as a candidate clears the score threshold or enough
+candidates agree on the same answer, so k is an upper bound rather than a
+fixed cost per question.
+"""
+
+import logging
+from collections import Counter
+from typing import List, Dict, Any, Optional, Callable
+
+from vpa.draft.generator import DraftGenerator
+from vpa.verify.checker import SimpleVerifier
+from vpa.verify.consensus import answer_key
+from vpa.reporting import EventSink, ConsoleSink, resolve_reporter
+from vpa.tracing import resolve_tracer
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveDrafter:
+    """Drafts candidates until one is verified as good enough."""
+
+    def __init__(
+        self,
+        generator: Optional[DraftGenerator] = None,
+        verifier: Optional[SimpleVerifier] = None,
+        threshold: Optional[float] = 0.9,
+        consensus: Optional[int] = None,
+        answer_fn: Callable[[str], str] = answer_key,
+        reporter: Optional[EventSink] = None,
+        tracer: Optional[Any] = None
+    ):
+        """
+        Initialize the adaptive drafter.
+
+        Args:
+            generator: Draft generator (default: DraftGenerator())
+            verifier: Verifier scoring each candidate (default: SimpleVerifier())
+            threshold: Stop once a candidate scores at least this
+                       (None = never stop on score)
+            consensus: Stop once this many candidates share an answer
+                       (None = never stop on agreement)
+            answer_fn: Maps candidate text to the answer compared for consensus
+            reporter: Event sink for plan events (default: NullSink)
+            tracer: Tracer receiving a 'plan.verify' span per candidate
+        """
+        if consensus is not None and consensus < 2:
+            raise ValueError("consensus must be at least 2")
+
+        self.generator = generator or DraftGenerator()
+        self.verifier = verifier or SimpleVerifier()
+        self.threshold = threshold
+        self.consensus = consensus
+        self.answer_fn = answer_fn
+        self.reporter = resolve_reporter(reporter)
+        self.tracer = resolve_tracer(tracer)
+
+    def generate(
+        self,
+        question: str,
+        k: int = 5,
+        min_k: int = 1,
+        temperature_range: tuple = (0.6, 0.9),
+        tests: Optional[List[str]] = None,
+        stop: Optional[Callable[[str], bool]] = None,
+        token_budget: Optional[int] = None,
+        deadline: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Draft and verify up to k candidates, stopping early when possible.
+
+        Has the same signature shape as DraftGenerator.generate, so it can be
+        used directly as an evaluator generate_fn; unlike it, the returned
+        candidates are already verified and ranked.
+
+        Args:
+            question: The question to answer
+            k: Maximum number of candidates to draft
+            min_k: Candidates to verify before an early stop is allowed
+            temperature_range: (min, max) temperature for diversity
+            tests: Optional asserts passed to the verifier
+            stop: Streaming stop predicate passed to the generator
+            token_budget: Total tokens for the question, split over k
+                          candidates by the generator
+            deadline: Wall-clock drafting budget in seconds; candidates
+                      verified before it passes are still ranked
+
+        Returns:
+            Verified candidates ranked by score, each with an 'answer' field
+        """
+        if not 1 <= min_k <= k:
+            raise ValueError("min_k must be between 1 and k")
+
+        verified = []
+        answers = Counter()
+
+        drafts = self.generator.iter_generate(
+            question,
+            k=k,
+            temperature_range=temperature_range,
+            stop=stop,
+            token_budget=token_budget,
+            deadline=deadline
+        )
+        try:
+            for candidate in drafts:
+                try:
+                    with self.tracer.span("plan.verify"):
+                        result = self.verifier.verify([candidate], tests=tests)[0]
+                except ValueError:
+                    # Filtered out by the verifier (e.g. empty text)
+                    continue
+
+                result['answer'] = self.answer_fn(result['text'])
+                answers[result['answer']] += 1
+                verified.append(result)
+
+                self.reporter.emit(
+                    "plan.candidate",
+                    id=result.get('id'),
+                    score=result['score'],
+                    answer=result['answer'],
+                    verified=len(verified)
+                )
+
+                reason = self._stop_reason(verified, answers, min_k)
+                if reason is not None:
+                    break
+            else:
+                reason = "budget"
+        finally:
+            # Stops further requests for this question
+            drafts.close()
+
+        # Rank across everything verified so far
+        verified.sort(key=lambda x: x['score'], reverse=True)
+        for i, candidate in enumerate(verified, 1):
+            candidate['rank'] = i
+
+        self.reporter.emit(
+            "plan.done",
+            reason=reason,
+            verified=len(verified),
+            k=k,
+            best_score=verified[0]['score'] if verified else None
+        )
+        logger.info(f"Adaptive drafting stopped ({reason}) after {len(verified)}/{k} candidates")
+
+        return verified
+
+    def _stop_reason(
+        self,
+        verified: List[Dict[str, Any]],
+        answers: Counter,
+        min_k: int
+    ) -> Optional[str]:
+        """
+        Decide whether drafting can stop given the candidates verified so far.
+
+        Returns:
+            'threshold' or 'consensus' if a stop condition is met, else None
+        """
+        if len(verified) < min_k:
+            return None
+
+        if self.threshold is not None and max(c['score'] for c in verified) >= self.threshold:
+            return "threshold"
+
+        if self.consensus is not None and answers.most_common(1)[0][1] >= self.consensus:
+            return "consensus"
+
+        return None
+
+
+def main():
+    """Example usage."""
+    drafter = AdaptiveDrafter(consensus=2, reporter=ConsoleSink())
+
+    question = "What is 12 * 12?"
+    candidates = drafter.generate(question, k=5)
+
+    print("\n" + "=" * 60)
+    print("ADAPTIVE DRAFTING RESULTS")
+    print("=" * 60)
+
+    for candidate in candidates:
+        print(f"\nRank {candidate['rank']} (score={candidate['score']:.2f}, answer={candidate['answer']}):")
+        print(f"{candidate['text'][:200]}\n")
+        print("-" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Reporting - Structured events emitted by the draft/verify/eval pipeline.
+
+Components call `reporter.emit(event, **fields)` instead of printing.
+The default NullSink does nothing, so library use pays no formatting or
+I/O cost; pass ConsoleSink() for the interactive output or JsonlSink(path)
+to collect events for a log pipeline.
+
+Events:
+    draft.start, draft.candidate_start, draft.candidate_done,
+    draft.candidate_empty, draft.candidate_error, draft.done,
+    verify.start, verify.candidate, verify.done,
+    eval.start, eval.question, eval.result, eval.summary
+"""
+
+import json
+import threading
+from abc import ABC, abstractmethod
+import time
+from typing import Any, IO, List, Optional, Union
+
+
+class EventSink(ABC):
+    """Base class for event sinks."""
+
+    # False lets emitters skip building expensive event fields
+    enabled = True
+
+    @abstractmethod
+    def emit(self, event: str, **fields: Any) -> None:
+        """
+        Handle one event.
+
+        Args:
+            event: Dotted event name, e.g. "verify.candidate"
+            **fields: JSON-serializable event data
+        """
+
+    def close(self) -> None:
+        """Flush and release resources."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class NullSink(EventSink):
+    """Discards every event (default for library use)."""
+
+    enabled = False
+
+    def emit(self, event: str, **fields: Any) -> None:
+        pass
+
+
+class ConsoleSink(EventSink):
+    """Prints events as human-readable console output."""
+
+    def emit(self, event: str, **fields: Any) -> None:
+        handler = getattr(self, "_" + event.replace(".", "_"), None)
+        if handler is not None:
+            handler(**fields)
+
+    # Draft events
+
+    def _draft_start(self, question, k, model, base_url, max_in_flight, **_):
+        print(f"\n🎯 Generating {k} candidate answers...")
+        print(f"📝 Question: {question}")
+        print(f"🤖 Model: {model}")
+        print(f"🌐 Ollama API: {base_url}")
+        print(f"⚡ Max in flight: {max_in_flight}")
+        print("-" * 60)
+
+    def _draft_candidate_start(self, id, k, temperature, **_):
+        print(f"\n🔄 Generating candidate {id}/{k} (temp={temperature:.2f})...")
+
+    def _draft_candidate_done(self, id, text, **_):
+        print(f"✅ Candidate {id}: {text[:80]}...")
+
+    def _draft_candidate_empty(self, id, **_):
+        print(f"⚠️ Candidate {id} returned empty response, skipping")
+
+    def _draft_candidate_error(self, id, error, **_):
+        print(f"❌ Error generating candidate {id}: {error}")
+
+    def _draft_candidate_cancelled(self, id, deadline, **_):
+        print(f"⏱️ Candidate {id} dropped at the {deadline}s deadline")
+
+    def _draft_prefix(self, tokens, candidates, saved_seconds, **_):
+        print(f"\n♻️ Reused {tokens} prefix tokens across {candidates} candidates "
+              f"(~{saved_seconds:.2f}s prompt eval saved)")
+
+    def _draft_done(self, generated, k, **_):
+        print(f"\n✨ Generated {generated}/{k} candidates successfully")
+
+    # Verify events
+
+    def _verify_start(self, count, **_):
+        print(f"\n🔍 Verifying {count} candidates...")
+        print("=" * 60)
+
+    def _verify_candidate(self, id, score, checks, **_):
+        print(f"\n📊 Candidate {id}:")
+        print(f"   Score: {score:.2f}")
+        print(f"   Checks:")
+        for check_name, check_score in checks.items():
+            status = "✅" if check_score >= 0.7 else "⚠️" if check_score >= 0.4 else "❌"
+            print(f"     {status} {check_name}: {check_score:.2f}")
+
+    def _verify_done(self, best_score, **_):
+        print("\n" + "=" * 60)
+        print(f"✨ Verification complete! Best score: {best_score:.2f}")
+
+    # Plan events
+
+    def _plan_candidate(self, id, score, answer, verified, **_):
+        print(f"🧭 Candidate {id}: score {score:.2f}, answer '{answer[:40]}' ({verified} verified)")
+
+    def _plan_done(self, reason, verified, k, **_):
+        print(f"\n🛑 Stopped drafting ({reason}) after {verified}/{k} candidates")
+
+    # Eval events
+
+    def _eval_start(self, test_set, total, **_):
+        print(f"\n📊 Evaluating on {test_set.upper()} test set ({total} questions)")
+        print("=" * 60)
+
+    def _eval_question(self, index, total, question, **_):
+        print(f"\n[{index}/{total}] Question: {question}")
+
+    def _eval_result(self, item, result, test_set, **_):
+        response = result.get("response", "")
+        kind = item.get("type", test_set)
+
+        if result.get("error") == "No candidates generated":
+            print("  ❌ No candidates generated")
+
+        elif kind == "qa":
+            if result["correct"]:
+                print(f"  ✅ CORRECT (score: {result['score']:.2f})")
+            elif result["partial"]:
+                print(f"  ⚠️  PARTIAL (score: {result['score']:.2f})")
+            else:
+                print(f"  ❌ WRONG (score: {result['score']:.2f})")
+
+            print(f"     Expected: {item.get('answer')}")
+            print(f"     Got: {response[:100]}...")
+
+        elif "pass_at_k" in result:
+            if result["correct"]:
+                print(f"  ✅ PASSED ({result['num_passed']}/{result['num_candidates']} candidates pass)")
+            else:
+                print(f"  ❌ FAILED ({result['num_passed']}/{result['num_candidates']} candidates pass)")
+                best_report = result["best_report"]
+                if best_report and best_report["error"]:
+                    print(f"     Error: {best_report['error'][:100]}")
+
+            print(f"     pass@k: {result['pass_at_k']}")
+            print(f"     Response: {response[:100]}...")
+
+        else:
+            score = result["score"]
+            if result["correct"]:
+                print(f"  ✅ GOOD (score: {score:.2f})")
+            elif result["partial"]:
+                print(f"  ⚠️  PARTIAL (score: {score:.2f})")
+            else:
+                print(f"  ❌ POOR (score: {score:.2f})")
+
+            print(f"     Keywords: {result['keywords_found']}/{item.get('keywords', [])}")
+            print(f"     Response: {response[:100]}...")
+
+    def _eval_summary(self, metrics, **_):
+        total_questions = metrics["total"]
+        partial_rate = metrics["partial"] / total_questions if total_questions > 0 else 0.0
+
+        print("\n" + "=" * 60)
+        print("📈 EVALUATION RESULTS")
+        print("=" * 60)
+        print(f"Total Questions: {total_questions}")
+        print(f"Correct: {metrics['correct']} ({metrics['accuracy'] * 100:.1f}%)")
+        print(f"Partial: {metrics['partial']} ({partial_rate * 100:.1f}%)")
+        print(f"Wrong: {total_questions - metrics['correct'] - metrics['partial']}")
+        print(f"\n🎯 Accuracy: {metrics['accuracy']:.2%}")
+
+        if "f1" in metrics:
+            print(f"🔤 Exact match: {metrics['exact_match']:.2%}  F1: {metrics['f1']:.2%}")
+
+        for name, value in metrics.get("pass_at_k", {}).items():
+            print(f"🧪 {name}: {value:.2%}")
+
+
+class JsonlSink(EventSink):
+    """
+    Buffers events and writes them as JSON lines.
+
+    Each line is {"event": ..., "ts": <unix time>, **fields}. Events are
+    serialized when emitted, so later changes to the fields do not reach
+    the log; lines are written once buffer_size events are queued and on
+    flush()/close(). Safe to share between threads.
+    """
+
+    def __init__(self, target: Union[str, IO[str]], buffer_size: int = 256):
+        """
+        Initialize the sink.
+
+        Args:
+            target: File path (opened for append) or writable text stream
+            buffer_size: Events held in memory before writing
+        """
+        if buffer_size < 1:
+            raise ValueError("buffer_size must be at least 1")
+
+        if isinstance(target, str):
+            self._file = open(target, "a", encoding="utf-8")
+            self._owns_file = True
+        else:
+            self._file = target
+            self._owns_file = False
+
+        self.buffer_size = buffer_size
+        self._buffer: List[str] = []
+        self._lock = threading.Lock()
+
+    def emit(self, event: str, **fields: Any) -> None:
+        record = {"event": event, "ts": time.time()}
+        record.update(fields)
+        line = json.dumps(record, ensure_ascii=False, default=str) + "\n"
+        with self._lock:
+            self._buffer.append(line)
+            if len(self._buffer) >= self.buffer_size:
+                self._write_buffer()
+
+    def flush(self) -> None:
+        """Write buffered events."""
+        with self._lock:
+            self._write_buffer()
+
+    def _write_buffer(self) -> None:
+        """Write queued lines (lock held)."""
+        if not self._buffer:
+            return
+        lines = "".join(self._buffer)
+        self._buffer.clear()
+        self._file.write(lines)
+        self._file.flush()
+
+    def close(self) -> None:
+        """Flush and close the file if this sink opened it."""
+        self.flush()
+        if self._owns_file:
+            self._file.close()
+
+
+def resolve_reporter(reporter: Optional[EventSink]) -> EventSink:
+    """Use the given sink, or a NullSink when none is configured."""
+    return reporter if reporter is not None else NullSink()
@@ -0,0 +1,453 @@
+#!/usr/bin/env python3
+"""
+VPA Server - Long-running HTTP service around draft → verify → rank.
+
+One OllamaClient connection pool, DraftGenerator and SimpleVerifier (with
+its warm code-execution pool) are shared by all requests, so callers do
+not pay import, logging and client setup per call.
+
+Endpoints (JSON in, JSON out):
+    POST /draft   {"question", "k"?, <budget>}        -> {"candidates"}
+    POST /verify  {"candidates", "tests"?}            -> {"candidates"}
+    POST /answer  {"question", "k"?, "tests"?, "adaptive"?, <budget>}
+                                                      -> {"answer", "score", "candidates"}
+    POST /batch   {"items": [<answer request>, ...]}  -> {"results"}  (at most max_batch items)
+    GET  /health                                      -> {"status", "ollama", "endpoints"}
+                                                         ("ollama": any endpoint reachable)
+    GET  /metrics                                     -> Prometheus text (with a tracer)
+
+<budget> is the optional "token_budget" (tokens per question, split over
+the candidates) and "deadline" (drafting seconds); the server-wide
+defaults apply when they are omitted.
+
+At most max_concurrent requests are processed at once; further requests
+get 429 with a Retry-After header instead of queueing.
+
+Usage:
+    python -m vpa.server --port 8080 --max-concurrent 8
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+try:
+    from ollama_client import OllamaClient
+except ImportError:
+    # Fallback for direct execution
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+    from ollama_client import OllamaClient
+
+from vpa.draft.generator import DraftGenerator, default_max_in_flight
+from vpa.verify.checker import SimpleVerifier
+from vpa.plan.adaptive import AdaptiveDrafter
+from vpa.tracing import Tracer, resolve_tracer
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+MAX_BODY_BYTES = 10 * 1024 * 1024
+
+
+class RequestError(Exception):
+    """Client error reported with an HTTP status."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class PipelineService:
+    """Shared draft/verify state behind the HTTP endpoints."""
+
+    def __init__(
+        self,
+        model: str = "qwen3:1.7b",
+        base_url: Union[str, List[str]] = "http://127.0.0.1:11434",
+        max_in_flight: Optional[int] = None,
+        code_workers: Optional[int] = None,
+        batch_workers: int = 4,
+        max_batch: int = 64,
+        default_k: int = 3,
+        max_k: int = 16,
+        client: Optional[OllamaClient] = None,
+        tracer: Optional[Any] = None,
+        token_budget: Optional[int] = None,
+        deadline: Optional[float] = None
+    ):
+        """
+        Initialize the service.
+
+        Args:
+            model: Ollama model to use
+            base_url: Ollama API base URL (or a list to load-balance across)
+            max_in_flight: Concurrent Ollama requests per question (default:
+                           4 per Ollama endpoint)
+            code_workers: Warm code-execution workers (default: as SimpleVerifier)
+            batch_workers: Questions of one /batch request processed at once
+            max_batch: Most items one /batch request may contain
+            default_k: Candidates per question when a request omits k
+            max_k: Largest k a request may ask for
+            client: Shared OllamaClient (created with a pool sized for
+                    batch_workers * max_in_flight if omitted)
+            tracer: Tracer shared by all components (exposed on /metrics)
+            token_budget: Default tokens per question when a request omits
+                          it (raised to k for requests with a larger k)
+            deadline: Default drafting seconds per question when a request
+                      omits it
+        """
+        self.tracer = resolve_tracer(tracer)
+        if max_in_flight is None:
+            max_in_flight = default_max_in_flight(base_url, client)
+        self.client = client or OllamaClient(
+            base_url=base_url,
+            model=model,
+            pool_size=max(batch_workers * max_in_flight, 10),
+            tracer=tracer
+        )
+        self.generator = DraftGenerator(
+            client=self.client,
+            max_in_flight=max_in_flight,
+            tracer=tracer
+        )
+        self.verifier = SimpleVerifier(code_workers=code_workers, tracer=tracer)
+        self.adaptive = AdaptiveDrafter(self.generator, self.verifier, tracer=tracer)
+        self.batch_workers = batch_workers
+        self.max_batch = max_batch
+        self.default_k = default_k
+        self.max_k = max_k
+        if token_budget is not None and token_budget < 1:
+            raise ValueError("token_budget must be at least 1")
+        if deadline is not None and deadline <= 0:
+            raise ValueError("deadline must be positive")
+        self.token_budget = token_budget
+        self.deadline = deadline
+
+    def draft(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Generate candidates for a question."""
+        question, k = self._question_and_k(request)
+        return {"candidates": self.generator.generate(question, k=k, **self._budget(request, k))}
+
+    def verify(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Verify and rank given candidates (dicts with 'text', or plain strings)."""
+        candidates = request.get("candidates")
+        if not isinstance(candidates, list) or not candidates:
+            raise RequestError(400, "'candidates' must be a non-empty list")
+
+        normalized = []
+        for i, candidate in enumerate(candidates):
+            if isinstance(candidate, str):
+                candidate = {"id": i + 1, "text": candidate}
+            elif not isinstance(candidate, dict) or not isinstance(candidate.get("text"), str):
+                raise RequestError(400, "each candidate must be a string or an object with a string 'text'")
+            normalized.append(candidate)
+        return {"candidates": self._verify(normalized, self._tests(request))}
+
+    def answer(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Draft, verify and return the best candidate for a question."""
+        question, k = self._question_and_k(request)
+        tests = self._tests(request)
+        budget = self._budget(request, k)
+
+        if request.get("adaptive"):
+            verified = self.adaptive.generate(question, k=k, tests=tests, **budget)
+        else:
+            candidates = self.generator.generate(question, k=k, **budget)
+            verified = self._verify(candidates, tests) if candidates else []
+
+        if not verified:
+            return {"question": question, "answer": None, "score": 0.0, "candidates": []}
+
+        best = verified[0]
+        return {
+            "question": question,
+            "answer": best["text"],
+            "score": best["score"],
+            "candidates": verified
+        }
+
+    def batch(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Answer several questions, batch_workers at a time."""
+        items = request.get("items")
+        if not isinstance(items, list) or not items:
+            raise RequestError(400, "'items' must be a non-empty list")
+        if len(items) > self.max_batch:
+            raise RequestError(413, f"'items' may hold at most {self.max_batch} questions")
+
+        def answer_item(item: Dict[str, Any]) -> Dict[str, Any]:
+            try:
+                if not isinstance(item, dict):
+                    raise RequestError(400, "each item must be a JSON object")
+                return self.answer(item)
+            except RequestError as e:
+                return {"error": str(e)}
+            except Exception as e:
+                logger.error(f"Batch item failed: {e}", exc_info=True)
+                return {"error": str(e)}
+
+        with ThreadPoolExecutor(max_workers=min(self.batch_workers, len(items))) as pool:
+            return {"results": list(pool.map(answer_item, items))}
+
+    def health(self) -> Dict[str, Any]:
+        """Service status with a probe of every Ollama endpoint."""
+        urls = self.client.base_urls
+        with ThreadPoolExecutor(max_workers=len(urls)) as pool:
+            available = dict(zip(urls, pool.map(self.client.is_available, urls)))
+
+        endpoints = self.client.endpoints.stats()
+        for url, stats in endpoints.items():
+            stats["available"] = available[url]
+        return {
+            "status": "ok",
+            "model": self.client.model,
+            "ollama": any(available.values()),
+            "endpoints": endpoints
+        }
+
+    def close(self) -> None:
+        """Stop the code-execution pool and close Ollama connections."""
+        self.verifier.executor.close()
+        self.client.close()
+
+    def _verify(self, candidates: List[Dict[str, Any]], tests: Optional[List[str]]) -> List[Dict[str, Any]]:
+        try:
+            return self.verifier.verify(candidates, tests=tests)
+        except ValueError as e:
+            # No candidate with usable text
+            raise RequestError(422, str(e))
+
+    def _tests(self, request: Dict[str, Any]) -> Optional[List[str]]:
+        tests = request.get("tests")
+        if tests is not None and (
+            not isinstance(tests, list) or not all(isinstance(test, str) for test in tests)
+        ):
+            raise RequestError(400, "'tests' must be a list of strings")
+        return tests
+
+    def _question_and_k(self, request: Dict[str, Any]) -> Tuple[str, int]:
+        question = request.get("question")
+        if not isinstance(question, str) or not question.strip():
+            raise RequestError(400, "'question' must be a non-empty string")
+
+        k = request.get("k", self.default_k)
+        if not isinstance(k, int) or isinstance(k, bool) or not 1 <= k <= self.max_k:
+            raise RequestError(400, f"'k' must be an integer between 1 and {self.max_k}")
+        return question, k
+
+    def _budget(self, request: Dict[str, Any], k: int) -> Dict[str, Any]:
+        token_budget = request.get("token_budget")
+        if token_budget is None and self.token_budget is not None:
+            # The server default always allows one token per candidate
+            token_budget = max(self.token_budget, k)
+        elif token_budget is not None and (
+            not isinstance(token_budget, int) or isinstance(token_budget, bool) or token_budget < k
+        ):
+            raise RequestError(400, "'token_budget' must be an integer of at least k")
+
+        deadline = request.get("deadline", self.deadline)
+        if deadline is not None and (
+            not isinstance(deadline, (int, float)) or isinstance(deadline, bool) or deadline <= 0
+        ):
+            raise RequestError(400, "'deadline' must be a positive number of seconds")
+        return {"token_budget": token_budget, "deadline": deadline}
+
+
+class PipelineServer:
+    """HTTP front end with a request concurrency limit."""
+
+    def __init__(
+        self,
+        service: PipelineService,
+        host: str = "127.0.0.1",
+        port: int = 8080,
+        max_concurrent: int = 8,
+        retry_after: int = 1
+    ):
+        """
+        Initialize the server.
+
+        Args:
+            service: Shared pipeline state
+            host: Interface to bind
+            port: Port to bind (0 = any free port)
+            max_concurrent: Requests processed at once; more get 429
+            retry_after: Seconds suggested to clients in the 429 Retry-After header
+        """
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be at least 1")
+
+        self.service = service
+        self.max_concurrent = max_concurrent
+        self.retry_after = retry_after
+        self.rejected = 0
+        self._rejected_lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_concurrent)
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def serve_forever(self) -> None:
+        """Serve in the current thread until shutdown()."""
+        self._server.serve_forever()
+
+    def start(self) -> "PipelineServer":
+        """Serve in a background thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def shutdown(self) -> None:
+        """Stop serving and release the shared pipeline."""
+        self._server.shutdown()
+        self._server.server_close()
+        self.service.close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
+
+    def _handler_class(self):
+        server = self
+        routes = {
+            "/draft": server.service.draft,
+            "/verify": server.service.verify,
+            "/answer": server.service.answer,
+            "/batch": server.service.batch
+        }
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                logger.debug(format % args)
+
+            def _send(self, status: int, data: bytes, content_type: str, headers: Dict[str, str] = None):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(data)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _send_json(self, status: int, body: Dict[str, Any], headers: Dict[str, str] = None):
+                data = json.dumps(body, ensure_ascii=False, default=str).encode("utf-8")
+                self._send(status, data, "application/json", headers)
+
+            def do_GET(self):
+                if self.path == "/health":
+                    self._send_json(200, server.service.health())
+                elif self.path == "/metrics" and isinstance(server.service.tracer, Tracer):
+                    self._send(200, server.service.tracer.to_prometheus().encode("utf-8"),
+                               "text/plain; version=0.0.4")
+                else:
+                    self._send_json(404, {"error": "not found"})
+
+            def _reject(self, status: int, message: str, headers: Dict[str, str] = None):
+                # Drop the unread body with the connection
+                self.close_connection = True
+                self._send_json(status, {"error": message}, headers)
+
+            def do_POST(self):
+                handler = routes.get(self.path)
+                if handler is None:
+                    self._reject(404, "not found")
+                    return
+
+                try:
+                    length = int(self.headers.get("Content-Length", 0))
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    self._reject(400, "invalid Content-Length")
+                    return
+                if length > MAX_BODY_BYTES:
+                    self._reject(413, "request body too large")
+                    return
+
+                if not server._slots.acquire(blocking=False):
+                    with server._rejected_lock:
+                        server.rejected += 1
+                    self._reject(429, "server busy", {"Retry-After": str(server.retry_after)})
+                    return
+
+                try:
+                    body = self.rfile.read(length)
+                    request = json.loads(body or b"{}")
+                    if not isinstance(request, dict):
+                        raise RequestError(400, "request body must be a JSON object")
+                    self._send_json(200, handler(request))
+                except json.JSONDecodeError as e:
+                    self._send_json(400, {"error": f"invalid JSON: {e}"})
+                except RequestError as e:
+                    self._send_json(e.status, {"error": str(e)})
+                except Exception as e:
+                    logger.error(f"Error handling {self.path}: {e}", exc_info=True)
+                    self._send_json(500, {"error": str(e)})
+                finally:
+                    server._slots.release()
+
+        return Handler
+
+
+def main():
+    """Run the service in the foreground."""
+    parser = argparse.ArgumentParser(description="VPA draft/verify HTTP service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--model", default="qwen3:1.7b")
+    parser.add_argument("--base-url", nargs="+", default=["http://127.0.0.1:11434"],
+                        help="Ollama API base URL(s); several are load-balanced")
+    parser.add_argument("--max-concurrent", type=int, default=8, help="Requests processed at once")
+    parser.add_argument("--max-in-flight", type=int, default=None,
+                        help="Ollama requests per question (default: 4 per endpoint)")
+    parser.add_argument("--code-workers", type=int, default=None, help="Warm code-execution workers")
+    parser.add_argument("--batch-workers", type=int, default=4, help="Questions per /batch at once")
+    parser.add_argument("--max-batch", type=int, default=64, help="Most questions per /batch request")
+    parser.add_argument("--token-budget", type=int, default=None,
+                        help="Default tokens per question, split over its candidates")
+    parser.add_argument("--deadline", type=float, default=None,
+                        help="Default drafting seconds per question")
+    args = parser.parse_args()
+
+    service = PipelineService(
+        model=args.model,
+        base_url=args.base_url,
+        max_in_flight=args.max_in_flight,
+        code_workers=args.code_workers,
+        batch_workers=args.batch_workers,
+        max_batch=args.max_batch,
+        tracer=Tracer(),
+        token_budget=args.token_budget,
+        deadline=args.deadline
+    )
+    server = PipelineServer(service, args.host, args.port, args.max_concurrent)
+
+    print(f"🚀 VPA server listening on {server.base_url} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Tracing - Per-stage latency spans and Ollama server timings.
+
+Usage:
+    tracer = Tracer()
+    generator = DraftGenerator(tracer=tracer)
+    verifier = SimpleVerifier(tracer=tracer)
+    ...
+    print(tracer.to_json())        # p50/p95/p99 per span, tokens/sec
+    print(tracer.to_prometheus())  # Prometheus text exposition format
+
+Span names:
+    ollama.ask, ollama.chat        client request (incl. retries/streaming)
+    draft.candidate                one candidate in DraftGenerator.generate
+    verify.<check>                 each SimpleVerifier check
+    code.execute                   one CodeExecutor snippet
+    eval.generate, eval.score      evaluator per-question stages
+"""
+
+import contextlib
+import json
+import math
+import random
+import threading
+import time
+from typing import Any, Dict, Iterator, Optional
+
+# Ollama reports durations in nanoseconds
+NANOSECONDS = 1e9
+
+QUANTILES = (("p50", "0.5"), ("p95", "0.95"), ("p99", "0.99"))
+
+OLLAMA_DURATION_FIELDS = {
+    "total_duration": "total",
+    "load_duration": "load",
+    "prompt_eval_duration": "prompt_eval",
+    "eval_duration": "eval",
+}
+
+
+def _nearest_rank(ordered: list, q: float) -> float:
+    """Nearest-rank percentile of a sorted, non-empty list."""
+    return ordered[max(0, math.ceil(q / 100 * len(ordered)) - 1)]
+
+
+class Histogram:
+    """
+    Streaming latency histogram with exact count/sum and sampled percentiles.
+
+    Keeps at most max_samples observations (reservoir sampling), so memory
+    stays bounded on long runs.
+    """
+
+    def __init__(self, max_samples: int = 10000):
+        self.max_samples = max_samples
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self._samples = []
+        self._random = random.Random(0)
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        self.count += 1
+        self.sum += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+        if len(self._samples) < self.max_samples:
+            self._samples.append(value)
+        else:
+            slot = self._random.randrange(self.count)
+            if slot < self.max_samples:
+                self._samples[slot] = value
+
+    def percentile(self, q: float) -> float:
+        """Nearest-rank percentile for q in 0-100 (0.0 when empty)."""
+        if not self._samples:
+            return 0.0
+        return _nearest_rank(sorted(self._samples), q)
+
+    def summary(self) -> Dict[str, float]:
+        """Count, sum, mean, min, max, p50, p95 and p99."""
+        if self.count == 0:
+            return {"count": 0, "sum": 0.0, "mean": 0.0, "min": 0.0, "max": 0.0,
+                    "p50": 0.0, "p95": 0.0, "p99": 0.0}
+        ordered = sorted(self._samples)
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "mean": self.sum / self.count,
+            "min": self.min,
+            "max": self.max,
+            "p50": _nearest_rank(ordered, 50),
+            "p95": _nearest_rank(ordered, 95),
+            "p99": _nearest_rank(ordered, 99)
+        }
+
+
+class NullTracer:
+    """Tracer that records nothing (default)."""
+
+    enabled = False
+
+    def span(self, name: str):
+        return contextlib.nullcontext()
+
+    def record(self, name: str, seconds: float) -> None:
+        pass
+
+    def observe_ollama(self, response: Dict[str, Any]) -> None:
+        pass
+
+
+class Tracer:
+    """Collects span durations and Ollama server timings. Thread-safe."""
+
+    enabled = True
+
+    def __init__(self, max_samples: int = 10000):
+        """
+        Initialize the tracer.
+
+        Args:
+            max_samples: Observations kept per histogram for percentiles
+        """
+        self.max_samples = max_samples
+        self.spans: Dict[str, Histogram] = {}
+        self.ollama_durations: Dict[str, Histogram] = {}
+        self.tokens_per_second = Histogram(max_samples)
+        self.eval_tokens = 0
+        self.prompt_eval_tokens = 0
+        self.ollama_responses = 0
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        """Time the enclosed block (recorded even if it raises)."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def record(self, name: str, seconds: float) -> None:
+        """Record a duration for a span name."""
+        with self._lock:
+            histogram = self.spans.get(name)
+            if histogram is None:
+                histogram = self.spans[name] = Histogram(self.max_samples)
+            histogram.observe(seconds)
+
+    def observe_ollama(self, response: Dict[str, Any]) -> None:
+        """
+        Record server-reported timings from a final Ollama response.
+
+        Uses total_duration, load_duration, prompt_eval_duration,
+        eval_duration (nanoseconds), eval_count and prompt_eval_count.
+        """
+        with self._lock:
+            self.ollama_responses += 1
+            for field, phase in OLLAMA_DURATION_FIELDS.items():
+                if response.get(field) is None:
+                    continue
+                histogram = self.ollama_durations.get(phase)
+                if histogram is None:
+                    histogram = self.ollama_durations[phase] = Histogram(self.max_samples)
+                histogram.observe(response[field] / NANOSECONDS)
+
+            eval_count = response.get("eval_count") or 0
+            eval_duration = response.get("eval_duration") or 0
+            self.eval_tokens += eval_count
+            self.prompt_eval_tokens += response.get("prompt_eval_count") or 0
+            if eval_count and eval_duration:
+                self.tokens_per_second.observe(eval_count / (eval_duration / NANOSECONDS))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Snapshot of all metrics."""
+        with self._lock:
+            eval_histogram = self.ollama_durations.get("eval")
+            eval_seconds = eval_histogram.sum if eval_histogram else 0.0
+            return {
+                "spans": {name: h.summary() for name, h in sorted(self.spans.items())},
+                "ollama": {
+                    "responses": self.ollama_responses,
+                    "eval_tokens": self.eval_tokens,
+                    "prompt_eval_tokens": self.prompt_eval_tokens,
+                    "durations": {
+                        phase: h.summary() for phase, h in sorted(self.ollama_durations.items())
+                    },
+                    "tokens_per_second": self.tokens_per_second.summary(),
+                    # Aggregate decode throughput across all responses
+                    "overall_tokens_per_second": (
+                        self.eval_tokens / eval_seconds if eval_seconds > 0 else 0.0
+                    )
+                }
+            }
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        """Metrics as a JSON document."""
+        return json.dumps(self.to_dict(), indent=indent)
+
+    def to_prometheus(self, prefix: str = "vpa") -> str:
+        """Metrics in the Prometheus text exposition format."""
+        metrics = self.to_dict()
+        lines = []
+
+        def summary(name: str, help_text: str, label: str, histograms: Dict[str, Dict[str, float]]):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} summary")
+            for value, stats in histograms.items():
+                labels = f'{label}="{value}"' if label else ""
+                separator = "," if labels else ""
+                for key, quantile in QUANTILES:
+                    lines.append(f'{name}{{{labels}{separator}quantile="{quantile}"}} {stats[key]}')
+                suffix = f"{{{labels}}}" if labels else ""
+                lines.append(f"{name}_sum{suffix} {stats['sum']}")
+                lines.append(f"{name}_count{suffix} {stats['count']}")
+
+        summary(f"{prefix}_span_duration_seconds", "Pipeline stage latency.",
+                "span", metrics["spans"])
+        summary(f"{prefix}_ollama_duration_seconds", "Server-reported Ollama timings.",
+                "phase", metrics["ollama"]["durations"])
+        summary(f"{prefix}_ollama_tokens_per_second", "Per-response decode throughput.",
+                "", {"": metrics["ollama"]["tokens_per_second"]})
+
+        for name, key, help_text in (
+            ("ollama_eval_tokens_total", "eval_tokens", "Generated tokens."),
+            ("ollama_prompt_eval_tokens_total", "prompt_eval_tokens", "Prompt tokens evaluated."),
+            ("ollama_responses_total", "responses", "Ollama responses with timings."),
+        ):
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} counter")
+            lines.append(f"{prefix}_{name} {metrics['ollama'][key]}")
+
+        return "\n".join(lines) + "\n"
+
+
+def resolve_tracer(tracer: Optional[Any]) -> Any:
+    """Use the given tracer, or a NullTracer when none is configured."""
+    return tracer if tracer is not None else NullTracer()
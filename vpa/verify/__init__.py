@@ -1,5 +1,7 @@
 """Verification module."""
 
 from .checker import SimpleVerifier
+from .unit_tests import UnitTestVerifier
+from .consensus import ConsensusClusterer, answer_key
 
-__all__ = ['SimpleVerifier']
+__all__ = ['SimpleVerifier', 'UnitTestVerifier', 'ConsensusClusterer', 'answer_key']
@@ -3,10 +3,16 @@
 Verifier - Simple checks for candidate quality.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence, Tuple
+import os
 import re
 import logging
-from .code_executor import CodeExecutor
+from .code_executor import CodeExecutor, normalize_code
+from .unit_tests import UnitTestVerifier
+from .consensus import ConsensusClusterer
+from vpa.cache.verification import VerificationCache
+from vpa.reporting import EventSink, ConsoleSink, resolve_reporter
+from vpa.tracing import resolve_tracer
 
 # Configure logging
 logging.basicConfig(
@@ -15,20 +21,122 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns shared by the per-candidate and batch checks
+SENTENCE_END_PATTERN = re.compile(r'[.!?]+')
+PUNCTUATION_RUN_PATTERN = re.compile(r'[!?.]{5,}')
+
+HEURISTIC_CHECKS = ('length', 'completeness', 'coherence', 'format')
+
+# Bump when check logic changes so cached check results are not reused
+VERIFIER_VERSION = "2"
+
+
+def _has_word_repetition(words: List[str]) -> bool:
+    """Check for the same word 5+ times in a row."""
+    return any(
+        a == b == c == d == e
+        for a, b, c, d, e in zip(words, words[1:], words[2:], words[3:], words[4:])
+    )
+
+
+def _text_features(text: str) -> Tuple[float, ...]:
+    """
+    Compute every input of the heuristic checks in one pass over a text.
+
+    Returns:
+        (length, completeness, has_sentence_punctuation, starts_upper,
+         sentence_count, word_repetition, punctuation_run, triple_newline)
+    """
+    stripped = text.strip()
+    if not stripped:
+        completeness = 0.0
+    elif stripped[-1] in '.!?':
+        completeness = 1.0
+    elif stripped[-1] in ',;:':
+        completeness = 0.4
+    else:
+        completeness = 0.6
+
+    sentence_count = len(SENTENCE_END_PATTERN.findall(text))
+
+    return (
+        len(text),
+        completeness,
+        # Any '.', '!' or '?' means at least one sentence-ending run
+        sentence_count > 0,
+        bool(text) and text[0].isupper(),
+        sentence_count,
+        _has_word_repetition(text.lower().split()),
+        PUNCTUATION_RUN_PATTERN.search(text) is not None,
+        '\n\n\n' in text
+    )
+
 
 class SimpleVerifier:
     """Simple verifier with basic quality checks."""
 
-    def __init__(self):
-        """Initialize the verifier."""
-        self.executor = CodeExecutor()
+    def __init__(
+        self,
+        code_workers: Optional[int] = None,
+        code_deadline: Optional[float] = None,
+        consensus: Optional[ConsensusClusterer] = None,
+        cache: Optional[VerificationCache] = None,
+        reporter: Optional[EventSink] = None,
+        tracer: Optional[Any] = None
+    ):
+        """
+        Initialize the verifier.
 
-    def verify(self, candidates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        Args:
+            code_workers: Warm worker processes for code execution
+                          (default: CPU count, capped at 4; 0 = process per block)
+            code_deadline: Overall seconds allowed for executing all code
+                           blocks of one verify call (default: no limit)
+            consensus: Clusterer adding a 'consensus' check (agreement with
+                       the other candidates) before ranking (default: off)
+            cache: Cache of check results per candidate text and of
+                   execution results per code block (default: off)
+            reporter: Event sink for per-candidate results (default: NullSink)
+            tracer: Tracer receiving a 'verify.<check>' span per check and
+                    'code.execute' spans from the executor
+        """
+        if code_workers is None:
+            code_workers = min(4, os.cpu_count() or 1)
+        self.tracer = resolve_tracer(tracer)
+        self.executor = CodeExecutor(pool_size=code_workers, tracer=self.tracer)
+        self.code_deadline = code_deadline
+        self.consensus = consensus
+        self.cache = cache
+        # Cache entries are only reused under the same configuration
+        self.code_config = {
+            "version": VERIFIER_VERSION,
+            "timeout": self.executor.timeout,
+            "limits": vars(self.executor.limits)
+        }
+        self.config = {
+            "version": VERIFIER_VERSION,
+            "checks": list(HEURISTIC_CHECKS),
+            "code": self.code_config
+        }
+        self.unit_tests = UnitTestVerifier(self.executor)
+        self.reporter = resolve_reporter(reporter)
+        self._heuristic_checks = [
+            (name, f"verify.{name}", getattr(self, f"_check_{name}"))
+            for name in HEURISTIC_CHECKS
+        ]
+
+    def verify(
+        self,
+        candidates: List[Dict[str, Any]],
+        tests: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
         """
         Verify candidates with simple quality checks.
 
         Args:
             candidates: List of candidate dictionaries
+            tests: Optional MBPP/HumanEval-style asserts; adds a 'unit_tests'
+                   check (fraction passed) and a per-test 'tests' report
 
         Returns:
             List of candidates with added 'score' and 'checks' fields
@@ -37,31 +145,58 @@ class SimpleVerifier:
             logger.warning("No candidates to verify")
             return []
 
-        print(f"\n🔍 Verifying {len(candidates)} candidates...")
-        print("=" * 60)
+        self.reporter.emit("verify.start", count=len(candidates))
 
         verified = []
 
+        # Guard against empty or missing text
+        valid = []
         for candidate in candidates:
             text = candidate.get('text', '')
-
-            # Guard against empty or missing text
             if not text or not text.strip():
                 logger.warning(f"Candidate {candidate.get('id', '?')} has empty text, skipping")
                 continue
-
-            # Run checks
-            checks = {
-                'length': self._check_length(text),
-                'completeness': self._check_completeness(text),
-                'coherence': self._check_coherence(text),
-                'format': self._check_format(text)
-            }
-            
-            # Code execution check (optional, only if code blocks exist)
-            code_score = self._check_code_execution(text)
-            if code_score is not None:
-                checks['code_exec'] = code_score
+            valid.append(candidate)
+
+        # Candidates verified before under the same configuration
+        if self.cache is not None:
+            cached = [
+                self.cache.lookup_checks(candidate['text'], self.config, tests)
+                for candidate in valid
+            ]
+        else:
+            cached = [None] * len(valid)
+        uncached_texts = [
+            candidate['text'] for candidate, hit in zip(valid, cached) if hit is None
+        ]
+
+        # Execute every uncached candidate's code blocks in one parallel batch
+        with self.tracer.span("verify.code_exec"):
+            code_results = self._execute_code_blocks(uncached_texts)
+
+        test_reports = [None] * len(uncached_texts)
+        if tests and uncached_texts:
+            with self.tracer.span("verify.unit_tests"):
+                test_reports = self.unit_tests.run_tests(
+                    uncached_texts,
+                    tests,
+                    deadline=self.code_deadline
+                )
+
+        fresh = iter(zip(code_results, test_reports))
+        for candidate, hit in zip(valid, cached):
+            text = candidate['text']
+
+            if hit is not None:
+                checks = dict(hit['checks'])
+                test_report = hit['tests']
+            else:
+                block_results, test_report = next(fresh)
+                checks = self._run_checks(text, self._code_score(block_results), test_report)
+                if self.cache is not None:
+                    self.cache.store_checks(
+                        text, self.config, tests, checks, test_report, block_results
+                    )
 
             # Calculate composite score (0.0 to 1.0)
             score = sum(checks.values()) / len(checks)
@@ -70,34 +205,140 @@ class SimpleVerifier:
             verified_candidate = candidate.copy()
             verified_candidate['score'] = score
             verified_candidate['checks'] = checks
+            if test_report is not None:
+                verified_candidate['tests'] = test_report
             verified_candidate['rank'] = 0  # Will be set later
 
             verified.append(verified_candidate)
 
-            # Print results
-            print(f"\n📊 Candidate {candidate['id']}:")
-            print(f"   Score: {score:.2f}")
-            print(f"   Checks:")
-            for check_name, check_score in checks.items():
-                status = "✅" if check_score >= 0.7 else "⚠️" if check_score >= 0.4 else "❌"
-                print(f"     {status} {check_name}: {check_score:.2f}")
+            self.reporter.emit("verify.candidate", id=candidate.get('id'), score=score, checks=checks)
 
         # Guard against no valid candidates
         if not verified:
             logger.error("All candidates were filtered out during verification")
             raise ValueError("No valid candidates after verification")
 
-        # Rank candidates by score
-        verified.sort(key=lambda x: x['score'], reverse=True)
-        for i, candidate in enumerate(verified, 1):
-            candidate['rank'] = i
+        if self.consensus is not None:
+            # Adds the consensus check, rescores and ranks
+            with self.tracer.span("verify.consensus"):
+                self.consensus.apply(verified)
+        else:
+            # Rank candidates by score
+            verified.sort(key=lambda x: x['score'], reverse=True)
+            for i, candidate in enumerate(verified, 1):
+                candidate['rank'] = i
 
-        print("\n" + "=" * 60)
-        print(f"✨ Verification complete! Best score: {verified[0]['score']:.2f}")
+        self.reporter.emit("verify.done", best_score=verified[0]['score'])
         logger.info(f"Verified {len(verified)} candidates, best score: {verified[0]['score']:.2f}")
 
         return verified
 
+    def verify_batch(
+        self,
+        texts: Sequence[str],
+        group_ids: Optional[Sequence[Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Score many texts with the heuristic checks at once (requires NumPy).
+
+        Meant for offline re-scoring of large candidate dumps: features are
+        extracted in one pass per text and the check scores, composite
+        score and ranking are computed as arrays. Code execution and unit
+        tests are not run; scores match verify() for texts without code.
+
+        Args:
+            texts: Candidate texts
+            group_ids: Optional group (e.g. question id) per text; ranks are
+                       then computed within each group
+
+        Returns:
+            Dictionary of NumPy arrays, one entry per text: one array per
+            check, 'score', 'valid' (non-empty text) and 'rank' (1 = best,
+            ties keep input order); plus 'order' (indices sorted by group,
+            then best first)
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError(
+                "verify_batch requires NumPy: pip install \"vpa-llm-fixer[batch]\""
+            )
+
+        n = len(texts)
+        features = np.array(
+            [_text_features(text) for text in texts],
+            dtype=np.float64
+        ).reshape(n, 8)
+        (length, completeness, has_punctuation, starts_upper,
+         sentence_count, repetition, punctuation_run, triple_newline) = features.T
+
+        checks = {
+            'length': np.select(
+                [length < 20, length < 50, length < 500, length < 1000],
+                [0.2, 0.6, 1.0, 0.8],
+                default=0.6
+            ),
+            'completeness': completeness,
+            'coherence': np.minimum(
+                0.3 * has_punctuation
+                + 0.3 * starts_upper
+                + np.select([sentence_count >= 2, sentence_count >= 1], [0.4, 0.2], default=0.0),
+                1.0
+            ),
+            'format': np.maximum(
+                1.0 - 0.5 * repetition - 0.3 * punctuation_run - 0.2 * triple_newline,
+                0.0
+            )
+        }
+        # Empty texts score 0 on format as in _check_format (verify() skips them)
+        checks['format'] = np.where(length > 0, checks['format'], 0.0)
+        valid = np.array([bool(text and text.strip()) for text in texts], dtype=bool)
+
+        score = np.mean(np.stack([checks[name] for name in HEURISTIC_CHECKS]), axis=0)
+
+        # Sort by group, then score descending, then input position
+        if group_ids is None:
+            groups = np.zeros(n, dtype=np.int64)
+        else:
+            _, groups = np.unique(np.asarray(group_ids), return_inverse=True)
+        positions = np.arange(n)
+        order = np.lexsort((positions, -score, groups))
+
+        sorted_groups = groups[order]
+        group_start = np.searchsorted(sorted_groups, sorted_groups, side='left')
+        rank = np.empty(n, dtype=np.int64)
+        rank[order] = positions - group_start + 1
+
+        result = dict(checks)
+        result.update({
+            'score': score,
+            'valid': valid,
+            'rank': rank,
+            'order': order
+        })
+        return result
+
+    def _run_checks(
+        self,
+        text: str,
+        code_score: Optional[float],
+        test_report: Optional[Dict[str, Any]]
+    ) -> Dict[str, float]:
+        """Run the heuristic checks and add the code and unit test results."""
+        checks = {}
+        for check_name, span_name, check in self._heuristic_checks:
+            with self.tracer.span(span_name):
+                checks[check_name] = check(text)
+
+        # Code execution check (optional, only if code blocks exist)
+        if code_score is not None:
+            checks['code_exec'] = code_score
+
+        if test_report is not None:
+            checks['unit_tests'] = test_report['passed'] / test_report['total']
+
+        return checks
+
     def _check_length(self, text: str) -> float:
         """
         Check if response has reasonable length.
@@ -159,7 +400,7 @@ class SimpleVerifier:
             score += 0.3
 
         # Has multiple sentences (more complete)
-        sentence_count = len(re.findall(r'[.!?]+', text))
+        sentence_count = len(SENTENCE_END_PATTERN.findall(text))
         if sentence_count >= 2:
             score += 0.4
         elif sentence_count >= 1:
@@ -180,15 +421,11 @@ class SimpleVerifier:
         score = 1.0
 
         # Check for excessive repetition (same word 5+ times in a row)
-        words = text.lower().split()
-        if len(words) > 0:
-            for i in range(len(words) - 4):
-                if words[i] == words[i+1] == words[i+2] == words[i+3] == words[i+4]:
-                    score -= 0.5
-                    break
+        if _has_word_repetition(text.lower().split()):
+            score -= 0.5
 
         # Check for excessive punctuation (e.g., "!!!!!")
-        if re.search(r'[!?.]{5,}', text):
+        if PUNCTUATION_RUN_PATTERN.search(text):
             score -= 0.3
 
         # Check for excessive newlines
@@ -206,21 +443,83 @@ class SimpleVerifier:
             0.0 if failure
             None if no code blocks found
         """
-        code_blocks = self.executor.extract_code_blocks(text)
-        if not code_blocks:
+        return self._check_code_execution_batch([text])[0]
+
+    def _check_code_execution_batch(self, texts: List[str]) -> List[Optional[float]]:
+        """
+        Check code blocks of several texts with one executor batch.
+
+        Returns:
+            One code execution score (or None) per text, as in
+            _check_code_execution
+        """
+        return [self._code_score(results) for results in self._execute_code_blocks(texts)]
+
+    def _execute_code_blocks(self, texts: List[str]) -> List[Optional[List[Dict[str, Any]]]]:
+        """
+        Execute the code blocks of several texts in one executor batch.
+
+        Blocks that are identical after normalization execute once per call,
+        and blocks with a cached result are not executed again.
+
+        Returns:
+            Per text, the execution results of its blocks (None if it has none)
+        """
+        blocks_per_text = [self.executor.extract_code_blocks(text) for text in texts]
+        all_blocks = [code for blocks in blocks_per_text for code in blocks]
+        if not all_blocks:
+            return [None] * len(texts)
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(all_blocks)
+        missing = []
+        for i, code in enumerate(all_blocks):
+            cached = None
+            if self.cache is not None:
+                cached = self.cache.lookup_code(normalize_code(code), self.code_config)
+            if cached is not None:
+                results[i] = cached
+            else:
+                missing.append(i)
+
+        logger.info(
+            f"Found {len(all_blocks)} code blocks across {len(texts)} candidates, "
+            f"{len(missing)} not cached"
+        )
+        if missing:
+            # Identical blocks across candidates execute once and share a result
+            executed = self.executor.execute_unique(
+                [all_blocks[i] for i in missing],
+                deadline=self.code_deadline
+            )
+            stored = set()
+            for i, result in zip(missing, executed):
+                results[i] = result
+                code = normalize_code(all_blocks[i])
+                if self.cache is not None and code not in stored:
+                    stored.add(code)
+                    self.cache.store_code(code, self.code_config, result)
+
+        results_per_text = []
+        offset = 0
+        for blocks in blocks_per_text:
+            results_per_text.append(results[offset:offset + len(blocks)] if blocks else None)
+            offset += len(blocks)
+        return results_per_text
+
+    @staticmethod
+    def _code_score(results: Optional[List[Dict[str, Any]]]) -> Optional[float]:
+        """1.0 if every code block succeeded, 0.0 if any failed, None if there were none."""
+        if results is None:
             return None
-            
-        logger.info(f"Found {len(code_blocks)} code blocks to execute")
-        
+
         all_success = True
-        for i, code in enumerate(code_blocks):
-            result = self.executor.execute_code(code)
+        for i, result in enumerate(results):
             if not result['success']:
                 logger.warning(f"Code block {i+1} failed: {result['error']}")
                 all_success = False
             else:
                 logger.info(f"Code block {i+1} executed successfully")
-                
+
         return 1.0 if all_success else 0.0
 
     def get_best_candidate(self, verified_candidates: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -261,7 +560,7 @@ def main():
         }
     ]
 
-    verifier = SimpleVerifier()
+    verifier = SimpleVerifier(reporter=ConsoleSink())
     verified = verifier.verify(candidates)
 
     print("\n" + "=" * 60)
@@ -1,25 +1,196 @@
 import re
+import os
+import hashlib
 import sys
 import io
+import signal
 import contextlib
 import multiprocessing
+import multiprocessing.connection
+import queue as queue_module
+import threading
+import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 
+from vpa.tracing import resolve_tracer
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+
+def normalize_code(code: str) -> str:
+    """
+    Normalize line endings and trailing whitespace at the end of a snippet.
+
+    Whitespace inside the snippet is kept, since it can be part of string
+    literals.
+    """
+    return code.replace("\r\n", "\n").replace("\r", "\n").rstrip()
+
+
+def code_fingerprint(code: str) -> str:
+    """Hash of the normalized code."""
+    return hashlib.sha256(normalize_code(code).encode("utf-8")).hexdigest()
+
+
+class ResourceLimits:
+    """
+    Per-execution resource caps, applied with rlimits in the child process.
+
+    Memory is the address space a snippet may add on top of the worker's
+    baseline; CPU seconds are counted from the start of each snippet. Limits
+    set to None are not applied. rlimits are skipped where the resource
+    module is unavailable, but output capture is always capped.
+    """
+
+    def __init__(
+        self,
+        memory_mb: Optional[int] = 2048,
+        cpu_seconds: Optional[int] = None,
+        open_files: Optional[int] = 256,
+        output_bytes: int = 64 * 1024
+    ):
+        """
+        Initialize resource limits.
+
+        Args:
+            memory_mb: Extra address space allowed, in MiB (default: 2048)
+            cpu_seconds: CPU time per snippet in seconds (default: no limit
+                         beyond the wall-clock timeout)
+            open_files: Maximum open file descriptors (default: 256)
+            output_bytes: Captured bytes kept per stream (default: 64 KiB)
+        """
+        if output_bytes < 0:
+            raise ValueError("output_bytes must be non-negative")
+
+        self.memory_mb = memory_mb
+        self.cpu_seconds = cpu_seconds
+        self.open_files = open_files
+        self.output_bytes = output_bytes
+
+    def apply_process_limits(self) -> None:
+        """Cap address space and open files for the current process."""
+        if resource is None:
+            return
+
+        if self.memory_mb is not None:
+            baseline = _address_space_bytes()
+            _set_soft_limit(resource.RLIMIT_AS, baseline + self.memory_mb * 1024 * 1024)
+
+        if self.open_files is not None:
+            _set_soft_limit(resource.RLIMIT_NOFILE, self.open_files)
+
+    def apply_cpu_limit(self) -> None:
+        """Allow cpu_seconds more CPU time from now (SIGXCPU past that)."""
+        if resource is None or self.cpu_seconds is None:
+            return
+
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        used = int(usage.ru_utime + usage.ru_stime)
+        _set_soft_limit(resource.RLIMIT_CPU, used + self.cpu_seconds)
+
+
+def _set_soft_limit(kind: int, value: int) -> None:
+    """Lower a soft rlimit, never above the hard limit."""
+    _, hard = resource.getrlimit(kind)
+    if hard != resource.RLIM_INFINITY:
+        value = min(value, hard)
+    resource.setrlimit(kind, (value, hard))
+
+
+def _address_space_bytes() -> int:
+    """Current virtual memory size of this process (0 if unknown)."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+def _death_message(exitcode: Optional[int]) -> str:
+    """Describe why a child process ended without returning a result."""
+    if exitcode == -getattr(signal, "SIGXCPU", -1):
+        return "CPU time limit exceeded"
+    return "Process failed to return result"
+
+
+class _BoundedOutput(io.TextIOBase):
+    """
+    Text sink that keeps at most max_bytes of UTF-8 output in chunks.
+
+    Writes past the cap are dropped and a truncation marker is appended to
+    the value, so a snippet printing gigabytes costs a bounded amount of
+    memory and pipe traffic.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.truncated = False
+        self._chunks = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        if self.truncated:
+            return len(text)
+
+        data = text.encode("utf-8", "replace")
+        remaining = self.max_bytes - self.size
+        if len(data) > remaining:
+            data = data[:remaining]
+            self.truncated = True
+
+        self._chunks.append(data)
+        self.size += len(data)
+        return len(text)
+
+    def getvalue(self) -> str:
+        value = b"".join(self._chunks).decode("utf-8", "ignore")
+        if self.truncated:
+            value += f"\n... [output truncated at {self.max_bytes} bytes]"
+        return value
+
+
 class CodeExecutor:
     """
     Executes Python code snippets extracted from text.
     WARNING: This uses exec() and is NOT sandboxed. Use only with trusted models/prompts.
     """
 
-    def __init__(self, timeout: int = 5):
+    def __init__(
+        self,
+        timeout: int = 5,
+        pool_size: int = 0,
+        limits: Optional[ResourceLimits] = None,
+        tracer: Optional[Any] = None
+    ):
         """
         Initialize the code executor.
         
         Args:
             timeout: Maximum execution time in seconds (default: 5)
+            pool_size: Number of warm worker processes to reuse across
+                       snippets (default: 0, one fresh process per snippet);
+                       also the parallelism of execute_many
+            limits: Memory/CPU/file/output caps per execution
+                    (default: ResourceLimits())
+            tracer: Tracer receiving a 'code.execute' span per snippet
         """
+        if pool_size < 0:
+            raise ValueError("pool_size must be non-negative")
+
         self.timeout = timeout
+        self.pool_size = pool_size
+        self.limits = limits or ResourceLimits()
+        self.tracer = resolve_tracer(tracer)
+        self._pool = None
+        self._pool_lock = threading.Lock()
 
     def extract_code_blocks(self, text: str) -> List[str]:
         """
@@ -47,44 +218,172 @@ class CodeExecutor:
         Returns:
             Dictionary with 'success', 'output', 'error'
         """
-        # Create a queue to get results from the process
-        queue = multiprocessing.Queue()
+        return self._execute(code, self.timeout)
+
+    def execute_many(
+        self,
+        codes: List[str],
+        deadline: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute a batch of snippets in parallel.
+
+        Snippets run on pool_size workers (or one process per snippet, CPU
+        count at a time, without a pool). Each snippet keeps its own timeout,
+        further capped by the time left before the batch deadline; snippets
+        that have not started when the deadline passes are not run.
+
+        Args:
+            codes: Python code snippets to execute
+            deadline: Overall time budget for the batch in seconds
+
+        Returns:
+            List of 'success'/'output'/'error' dictionaries, in input order
+        """
+        if not codes:
+            return []
+
+        end = time.monotonic() + deadline if deadline is not None else None
+
+        def run(code: str) -> Dict[str, Any]:
+            timeout = self.timeout
+            if end is not None:
+                remaining = end - time.monotonic()
+                if remaining <= 0:
+                    return {
+                        "success": False,
+                        "output": "",
+                        "error": f"Batch deadline of {deadline} seconds exceeded"
+                    }
+                timeout = min(timeout, remaining)
+            return self._execute(code, timeout)
+
+        workers = min(len(codes), self.pool_size or os.cpu_count() or 1)
+        if workers == 1:
+            return [run(code) for code in codes]
+
+        with ThreadPoolExecutor(max_workers=workers) as threads:
+            return list(threads.map(run, codes))
+
+    def execute_unique(
+        self,
+        codes: List[str],
+        deadline: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Like execute_many, but snippets that are identical after
+        normalization run once and share one result.
+
+        Args:
+            codes: Python code snippets to execute
+            deadline: Overall time budget for the batch in seconds
+
+        Returns:
+            List of 'success'/'output'/'error' dictionaries, in input order
+        """
+        fingerprints = [code_fingerprint(code) for code in codes]
+        unique = {}
+        for fingerprint, code in zip(fingerprints, codes):
+            unique.setdefault(fingerprint, code)
+
+        results = dict(zip(unique, self.execute_many(list(unique.values()), deadline=deadline)))
+        return [results[fingerprint] for fingerprint in fingerprints]
+
+    def _execute(self, code: str, timeout: float) -> Dict[str, Any]:
+        """Execute one snippet on the pool or in a fresh process."""
+        with self.tracer.span("code.execute"):
+            if self.pool_size > 0:
+                return self._get_pool().run(code, timeout)
+            return self._execute_in_new_process(code, timeout)
+
+    def _execute_in_new_process(self, code: str, timeout: float) -> Dict[str, Any]:
+        """Execute one snippet in a dedicated process."""
+        # Results come back over a pipe, read as soon as they are ready: a
+        # result larger than the pipe buffer would otherwise block the child
+        # until it is killed
+        result_conn, child_conn = multiprocessing.Pipe(duplex=False)
         
         # Create a process to run the code
         process = multiprocessing.Process(
             target=self._run_code_in_process,
-            args=(code, queue)
+            args=(code, child_conn, self.limits)
         )
         
         process.start()
-        process.join(self.timeout)
-        
-        if process.is_alive():
-            process.terminate()
+        child_conn.close()
+
+        try:
+            # Wake up on a result, on the child exiting, or at the timeout
+            if not multiprocessing.connection.wait([result_conn, process.sentinel], timeout):
+                process.terminate()
+                process.join()
+                return {
+                    "success": False,
+                    "output": "",
+                    "error": f"Execution timed out after {timeout} seconds"
+                }
+
+            result = None
+            if result_conn.poll():
+                try:
+                    result = result_conn.recv()
+                except EOFError:
+                    pass
             process.join()
-            return {
-                "success": False,
-                "output": "",
-                "error": f"Execution timed out after {self.timeout} seconds"
-            }
-            
-        if not queue.empty():
-            return queue.get()
-        else:
-            return {
-                "success": False,
-                "output": "",
-                "error": "Process failed to return result"
-            }
+        finally:
+            result_conn.close()
+
+        if result is not None:
+            return result
+        return {
+            "success": False,
+            "output": "",
+            "error": _death_message(process.exitcode)
+        }
+
+    def _get_pool(self) -> "WorkerPool":
+        """Start the worker pool on first use."""
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = WorkerPool(self.pool_size, self.timeout, limits=self.limits)
+            return self._pool
+
+    def close(self) -> None:
+        """Stop pooled worker processes (no-op without a pool)."""
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.close()
+                self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     @staticmethod
-    def _run_code_in_process(code: str, queue: multiprocessing.Queue):
+    def _run_code_in_process(
+        code: str,
+        conn,
+        limits: Optional[ResourceLimits] = None
+    ):
         """
         Worker function to run code in a separate process.
         """
+        limits = limits or ResourceLimits()
+        limits.apply_process_limits()
+        limits.apply_cpu_limit()
+        conn.send(CodeExecutor._execute_snippet(code, limits.output_bytes))
+        conn.close()
+
+    @staticmethod
+    def _execute_snippet(code: str, max_output_bytes: int = 64 * 1024) -> Dict[str, Any]:
+        """
+        Run code in a clean namespace, capturing (capped) stdout and stderr.
+        """
         # Capture stdout and stderr
-        stdout_capture = io.StringIO()
-        stderr_capture = io.StringIO()
+        stdout_capture = _BoundedOutput(max_output_bytes)
+        stderr_capture = _BoundedOutput(max_output_bytes)
         
         result = {
             "success": False,
@@ -106,7 +405,184 @@ class CodeExecutor:
         except Exception:
             result["success"] = False
             result["output"] = stdout_capture.getvalue()
-            # Capture full traceback
-            result["error"] = f"{stderr_capture.getvalue()}\n{traceback.format_exc()}".strip()
+            # Capture full traceback (capped separately so it survives a full stderr)
+            traceback_capture = _BoundedOutput(max_output_bytes)
+            traceback_capture.write(traceback.format_exc())
+            result["error"] = f"{stderr_capture.getvalue()}\n{traceback_capture.getvalue()}".strip()
             
-        queue.put(result)
+        return result
+
+
+def _pool_worker_main(conn, limits: ResourceLimits) -> None:
+    """
+    Worker process loop: run snippets received over conn until told to stop.
+
+    Each job gets a fresh namespace, and interpreter state that snippets
+    commonly touch (cwd, sys.path, sys.argv) is restored afterwards.
+    Imported modules stay loaded, which is what keeps the worker warm.
+    """
+    limits.apply_process_limits()
+    cwd = os.getcwd()
+    sys_path = list(sys.path)
+    sys_argv = list(sys.argv)
+
+    while True:
+        try:
+            code = conn.recv()
+        except (EOFError, KeyboardInterrupt):
+            break
+        if code is None:
+            break
+
+        try:
+            limits.apply_cpu_limit()
+            result = CodeExecutor._execute_snippet(code, limits.output_bytes)
+        except SystemExit:
+            result = {
+                "success": False,
+                "output": "",
+                "error": f"Code called exit()\n{traceback.format_exc()}".strip()
+            }
+        finally:
+            os.chdir(cwd)
+            sys.path[:] = sys_path
+            sys.argv[:] = sys_argv
+
+        conn.send(result)
+
+
+class _PoolWorker:
+    """A warm worker process and the parent end of its pipe."""
+
+    def __init__(self, limits: ResourceLimits):
+        self.conn, child_conn = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(
+            target=_pool_worker_main,
+            args=(child_conn, limits),
+            daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        self.jobs = 0
+
+    def kill(self) -> None:
+        """Forcefully stop the worker."""
+        self.process.terminate()
+        self.process.join(1)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+    def stop(self) -> None:
+        """Ask the worker to exit, killing it if it does not."""
+        try:
+            self.conn.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.join(1)
+        if self.process.is_alive():
+            self.kill()
+        else:
+            self.conn.close()
+
+
+class WorkerPool:
+    """
+    Pool of pre-started worker processes for running code snippets.
+
+    Workers are reused across snippets; a worker that times out or dies is
+    killed and replaced, and workers are recycled after max_jobs snippets so
+    state leaked by snippets (imports, monkeypatches) cannot accumulate.
+    Safe to use from multiple threads.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        timeout: float = 5,
+        max_jobs: int = 100,
+        limits: Optional[ResourceLimits] = None
+    ):
+        """
+        Initialize and start the pool.
+
+        Args:
+            size: Number of worker processes
+            timeout: Default per-snippet timeout in seconds
+            max_jobs: Snippets a worker runs before it is replaced
+            limits: Resource caps applied inside each worker
+        """
+        if size < 1:
+            raise ValueError("size must be at least 1")
+
+        self.size = size
+        self.timeout = timeout
+        self.max_jobs = max_jobs
+        self.limits = limits or ResourceLimits()
+        self._idle = queue_module.Queue()
+        self._closed = False
+        for _ in range(size):
+            self._idle.put(_PoolWorker(self.limits))
+
+    def run(self, code: str, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Run a snippet on an idle worker.
+
+        Args:
+            code: Python code to execute
+            timeout: Override the pool timeout for this snippet
+
+        Returns:
+            Dictionary with 'success', 'output', 'error'
+        """
+        if self._closed:
+            raise RuntimeError("WorkerPool is closed")
+
+        timeout = self.timeout if timeout is None else timeout
+        worker = self._idle.get()
+
+        try:
+            worker.conn.send(code)
+            if not worker.conn.poll(timeout):
+                worker.kill()
+                worker = _PoolWorker(self.limits)
+                return {
+                    "success": False,
+                    "output": "",
+                    "error": f"Execution timed out after {timeout} seconds"
+                }
+
+            result = worker.conn.recv()
+            worker.jobs += 1
+            if worker.jobs >= self.max_jobs:
+                worker.stop()
+                worker = _PoolWorker(self.limits)
+            return result
+
+        except (EOFError, BrokenPipeError, OSError):
+            # Worker died mid-job (os._exit, segfault, OOM or CPU limit)
+            worker.kill()
+            message = _death_message(worker.process.exitcode)
+            worker = _PoolWorker(self.limits)
+            return {
+                "success": False,
+                "output": "",
+                "error": message
+            }
+
+        finally:
+            if self._closed:
+                worker.stop()
+            else:
+                self._idle.put(worker)
+
+    def close(self) -> None:
+        """Stop all idle workers; busy workers stop when their job ends."""
+        self._closed = True
+        while True:
+            try:
+                worker = self._idle.get_nowait()
+            except queue_module.Empty:
+                break
+            worker.stop()
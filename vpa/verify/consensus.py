@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Consensus - Self-consistency voting across verified candidates.
+
+Candidate answers are normalized and identical answers are grouped.
+Longer free-text answers are also sketched with MinHash over character
+shingles and bucketed with LSH banding, so near-identical wordings are
+clustered without comparing every pair; numbers and short answers only
+match exactly, since shingles cannot tell "1000000" from "10000000". The
+size of a candidate's cluster becomes a 'consensus' check that feeds into
+its score and rank.
+"""
+
+import logging
+import random
+import re
+import zlib
+from collections import defaultdict
+from typing import List, Dict, Any, Optional, Callable, Sequence, Tuple
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+NUMBER_PATTERN = re.compile(r'-?\d[\d,]*(?:\.\d+)?')
+NON_WORD_PATTERN = re.compile(r'[^\w\s]')
+DIGIT_PATTERN = re.compile(r'\d')
+
+# Mersenne prime for the universal hash family
+MINHASH_PRIME = (1 << 61) - 1
+
+
+def answer_key(text: str) -> str:
+    """
+    Reduce a candidate to a comparable answer.
+
+    Uses the last number in the text when there is one (math-style answers),
+    otherwise the lowercased first line without punctuation.
+    """
+    numbers = NUMBER_PATTERN.findall(text)
+    if numbers:
+        return numbers[-1].replace(',', '')
+
+    first_line = text.strip().split('\n', 1)[0].lower()
+    return ' '.join(NON_WORD_PATTERN.sub(' ', first_line).split())
+
+
+def shingles(text: str, size: int = 3) -> set:
+    """Character shingles of a normalized answer (the whole text if shorter)."""
+    if len(text) <= size:
+        return {text} if text else set()
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+class ConsensusClusterer:
+    """Clusters equivalent candidate answers and scores agreement."""
+
+    def __init__(
+        self,
+        threshold: float = 0.8,
+        num_perm: int = 64,
+        bands: int = 16,
+        shingle_size: int = 3,
+        answer_fn: Callable[[str], str] = answer_key,
+        seed: int = 0,
+        min_fuzzy_length: int = 8
+    ):
+        """
+        Initialize the clusterer.
+
+        Args:
+            threshold: Estimated Jaccard similarity at which two answers are
+                       treated as the same
+            num_perm: MinHash signature length
+            bands: LSH bands (num_perm must be divisible by it); more bands
+                   find lower-similarity pairs at the cost of more checks
+            shingle_size: Characters per shingle
+            answer_fn: Maps candidate text to the answer that is compared
+            seed: Seed for the hash permutations
+            min_fuzzy_length: Shortest answer matched by similarity; shorter
+                              answers and answers containing digits only
+                              cluster with identical answers
+        """
+        if not 0.0 < threshold <= 1.0:
+            raise ValueError("threshold must be in (0, 1]")
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.answer_fn = answer_fn
+        self.min_fuzzy_length = min_fuzzy_length
+
+        rng = random.Random(seed)
+        self._perms = [
+            (rng.randrange(1, MINHASH_PRIME), rng.randrange(0, MINHASH_PRIME))
+            for _ in range(num_perm)
+        ]
+
+    def signature(self, answer: str) -> Optional[Tuple[int, ...]]:
+        """
+        MinHash signature of a normalized answer.
+
+        Returns:
+            Tuple of num_perm hash minima, or None for an empty answer
+        """
+        hashes = [
+            zlib.crc32(shingle.encode('utf-8'))
+            for shingle in shingles(answer, self.shingle_size)
+        ]
+        if not hashes:
+            return None
+        return tuple(
+            min((a * h + b) % MINHASH_PRIME for h in hashes)
+            for a, b in self._perms
+        )
+
+    def cluster(self, texts: Sequence[str]) -> List[int]:
+        """
+        Assign a cluster label to each text.
+
+        Texts with identical answers are always merged. Distinct free-text
+        answers are compared only when they share an LSH band, and merged
+        when their estimated similarity reaches the threshold. Empty
+        answers stay unclustered.
+
+        Args:
+            texts: Candidate texts
+
+        Returns:
+            Cluster label per text (labels are the index of the first member)
+        """
+        parent = list(range(len(texts)))
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        def union(a: int, b: int) -> None:
+            root_a, root_b = find(a), find(b)
+            if root_a != root_b:
+                parent[max(root_a, root_b)] = min(root_a, root_b)
+
+        # Identical answers: first occurrence of each answer represents it
+        representatives = {}
+        for i, answer in enumerate(self.answer_fn(text) for text in texts):
+            if not answer:
+                continue
+            first = representatives.setdefault(answer, i)
+            if first != i:
+                union(first, i)
+
+        # Similar free-text answers: one signature per distinct answer
+        signatures = {
+            i: self.signature(answer)
+            for answer, i in representatives.items()
+            if self._fuzzy(answer)
+        }
+
+        buckets = defaultdict(list)
+        for i, sig in signatures.items():
+            for band in range(self.bands):
+                start = band * self.rows
+                buckets[(band, sig[start:start + self.rows])].append(i)
+
+        compared = set()
+        for members in buckets.values():
+            for position, a in enumerate(members):
+                for b in members[position + 1:]:
+                    if (a, b) in compared:
+                        continue
+                    compared.add((a, b))
+                    if self._similarity(signatures[a], signatures[b]) >= self.threshold:
+                        union(a, b)
+
+        return [find(i) for i in range(len(texts))]
+
+    def apply(self, verified: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Add a consensus check to verified candidates and re-rank them.
+
+        Each candidate gets 'answer', 'cluster' and 'cluster_size' fields and
+        a 'consensus' check (cluster size / number of candidates); its score
+        is recomputed as the mean of all checks, as in SimpleVerifier.verify.
+
+        Args:
+            verified: Candidates returned by SimpleVerifier.verify
+
+        Returns:
+            The same candidates, re-sorted by score with updated ranks
+        """
+        if not verified:
+            return verified
+
+        labels = self.cluster([candidate['text'] for candidate in verified])
+        sizes = defaultdict(int)
+        for label in labels:
+            sizes[label] += 1
+
+        for candidate, label in zip(verified, labels):
+            candidate['answer'] = self.answer_fn(candidate['text'])
+            candidate['cluster'] = label
+            candidate['cluster_size'] = sizes[label]
+            candidate['checks']['consensus'] = sizes[label] / len(verified)
+            candidate['score'] = sum(candidate['checks'].values()) / len(candidate['checks'])
+
+        verified.sort(key=lambda x: x['score'], reverse=True)
+        for i, candidate in enumerate(verified, 1):
+            candidate['rank'] = i
+
+        logger.info(f"Found {len(sizes)} answer clusters across {len(verified)} candidates")
+        return verified
+
+    def _fuzzy(self, answer: str) -> bool:
+        """Check whether an answer may match others by similarity."""
+        return len(answer) >= self.min_fuzzy_length and not DIGIT_PATTERN.search(answer)
+
+    def _similarity(self, a: Tuple[int, ...], b: Tuple[int, ...]) -> float:
+        """Estimated Jaccard similarity of two signatures."""
+        return sum(x == y for x, y in zip(a, b)) / self.num_perm
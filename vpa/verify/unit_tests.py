@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Unit Test Verifier - Runs task test cases against candidate code.
+
+Test cases are MBPP/HumanEval-style assert statements, e.g.
+    ["assert add(1, 2) == 3", "assert add(-1, 1) == 0"]
+"""
+
+import json
+import logging
+from typing import List, Dict, Any, Optional
+
+from .code_executor import CodeExecutor
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# Marks the harness's result line in the captured output
+RESULT_MARKER = "__VPA_TEST_RESULTS__"
+
+# Runs the candidate, then each test, in one namespace. Candidate prints are
+# discarded so the result line cannot be pushed past the output cap.
+HARNESS_TEMPLATE = '''
+import contextlib as _vpa_contextlib
+import io as _vpa_io
+import json as _vpa_json
+
+class _VpaDiscard(_vpa_io.TextIOBase):
+    def write(self, text):
+        return len(text)
+
+_vpa_namespace = {{"__name__": "__candidate__"}}
+_vpa_report = {{"setup_error": None, "results": []}}
+
+with _vpa_contextlib.redirect_stdout(_VpaDiscard()):
+    try:
+        exec(compile({code!r}, "<candidate>", "exec"), _vpa_namespace)
+    except BaseException as _vpa_error:
+        _vpa_report["setup_error"] = f"{{type(_vpa_error).__name__}}: {{_vpa_error}}"[:500]
+
+    if _vpa_report["setup_error"] is None:
+        for _vpa_test in {tests!r}:
+            try:
+                exec(compile(_vpa_test, "<test>", "exec"), _vpa_namespace)
+                _vpa_report["results"].append({{"passed": True, "error": ""}})
+            except BaseException as _vpa_error:
+                _vpa_report["results"].append({{
+                    "passed": False,
+                    "error": f"{{type(_vpa_error).__name__}}: {{_vpa_error}}"[:500]
+                }})
+                if {stop_on_failure!r}:
+                    break
+
+print({marker!r} + _vpa_json.dumps(_vpa_report))
+'''
+
+
+class UnitTestVerifier:
+    """Verifies candidate code by running task test cases in the executor."""
+
+    def __init__(self, executor: Optional[CodeExecutor] = None):
+        """
+        Initialize the unit test verifier.
+
+        Args:
+            executor: CodeExecutor to run tests with (e.g. the pooled one owned
+                      by SimpleVerifier); a fresh one is created if omitted
+        """
+        self.executor = executor or CodeExecutor()
+
+    def extract_program(self, text: str) -> str:
+        """
+        Get the code to test from a candidate.
+
+        Returns:
+            All fenced code blocks joined together, or the whole text if the
+            candidate has no code blocks (raw code answers)
+        """
+        blocks = self.executor.extract_code_blocks(text)
+        if blocks:
+            return "\n\n".join(blocks)
+        return text.strip()
+
+    def build_harness(
+        self,
+        code: str,
+        tests: List[str],
+        setup: Optional[str] = None,
+        stop_on_failure: bool = False
+    ) -> str:
+        """
+        Build the program that runs tests against candidate code.
+
+        Args:
+            code: Candidate code
+            tests: Assert statements to run
+            setup: Code run before the candidate (e.g. MBPP test_setup_code)
+            stop_on_failure: Stop at the first failing test
+
+        Returns:
+            Python source for the executor
+        """
+        if setup:
+            code = f"{setup}\n\n{code}"
+        return HARNESS_TEMPLATE.format(
+            code=code,
+            tests=list(tests),
+            stop_on_failure=stop_on_failure,
+            marker=RESULT_MARKER
+        )
+
+    def run_tests(
+        self,
+        texts: List[str],
+        tests: List[str],
+        setup: Optional[str] = None,
+        stop_on_failure: bool = False,
+        deadline: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Run the same tests against several candidates in parallel.
+
+        Args:
+            texts: Candidate texts (markdown or raw code)
+            tests: Assert statements to run
+            setup: Code run before each candidate
+            stop_on_failure: Stop each candidate at its first failing test
+                             (enough for pass/fail and pass@k)
+            deadline: Overall time budget for the batch in seconds
+
+        Returns:
+            One report per text with 'passed', 'total', 'all_passed',
+            'results' (per-test 'test', 'passed', 'error') and 'error'
+        """
+        programs = [
+            self.build_harness(self.extract_program(text), tests, setup, stop_on_failure)
+            for text in texts
+        ]
+        # Identical candidate programs are tested once
+        executions = self.executor.execute_unique(programs, deadline=deadline)
+        return [self._parse_report(execution, tests) for execution in executions]
+
+    def verify(
+        self,
+        candidates: List[Dict[str, Any]],
+        tests: List[str],
+        setup: Optional[str] = None,
+        stop_on_failure: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Add unit test results to candidates.
+
+        Args:
+            candidates: List of candidate dictionaries
+            tests: Assert statements to run
+            setup: Code run before each candidate
+            stop_on_failure: Stop each candidate at its first failing test
+
+        Returns:
+            Copies of the candidates with an added 'tests' report, in order
+        """
+        reports = self.run_tests(
+            [candidate.get('text', '') for candidate in candidates],
+            tests,
+            setup=setup,
+            stop_on_failure=stop_on_failure
+        )
+
+        verified = []
+        for candidate, report in zip(candidates, reports):
+            verified_candidate = candidate.copy()
+            verified_candidate['tests'] = report
+            verified.append(verified_candidate)
+
+            logger.info(
+                f"Candidate {candidate.get('id', '?')}: "
+                f"{report['passed']}/{report['total']} tests passed"
+            )
+
+        return verified
+
+    @staticmethod
+    def _parse_report(execution: Dict[str, Any], tests: List[str]) -> Dict[str, Any]:
+        """Turn executor output into a per-test report."""
+        report = {
+            "passed": 0,
+            "total": len(tests),
+            "all_passed": False,
+            "results": [],
+            "error": ""
+        }
+
+        payload = None
+        for line in reversed(execution.get("output", "").splitlines()):
+            if line.startswith(RESULT_MARKER):
+                try:
+                    payload = json.loads(line[len(RESULT_MARKER):])
+                except ValueError:
+                    # Cut off by the executor's output cap (many long failures)
+                    report["error"] = "Test harness report exceeded the output limit"
+                    return report
+                break
+
+        if payload is None:
+            # Harness never reported: timeout, crash or resource limit
+            report["error"] = execution.get("error") or "Test harness returned no result"
+        elif payload["setup_error"]:
+            report["error"] = payload["setup_error"]
+        else:
+            for test, outcome in zip(tests, payload["results"]):
+                report["results"].append({
+                    "test": test,
+                    "passed": outcome["passed"],
+                    "error": outcome["error"]
+                })
+            report["passed"] = sum(1 for outcome in report["results"] if outcome["passed"])
+
+        report["all_passed"] = report["total"] > 0 and report["passed"] == report["total"]
+        return report